@@ -171,7 +171,12 @@ def yggrun():
     parser = argparse.ArgumentParser(description='Run an integration.')
     parser.add_argument('yamlfile', nargs='+',
                         help='One or more yaml specification files.')
+    parser.add_argument('--trace', default=None,
+                        help=('Directory where timing information for each '
+                              'message should be saved.'))
     args = parser.parse_args()
+    if args.trace:
+        os.environ['YGG_TRACE'] = os.path.abspath(args.trace)
     prog = sys.argv[0].split(os.path.sep)[-1]
     runner.run(args.yamlfile, ygg_debug_prefix=prog)
 
@@ -252,9 +257,11 @@ def regen_metaschema():
 def regen_schema():
     r"""Regenerate the yggdrasil schema."""
     from yggdrasil import schema
+    from yggdrasil.components import clear_registry_manifest
     if os.path.isfile(schema._schema_fname):
         os.remove(schema._schema_fname)
     schema.clear_schema()
+    clear_registry_manifest(remove_file=True)
     schema.init_schema()
 
 
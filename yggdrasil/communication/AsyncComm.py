@@ -16,6 +16,20 @@ class AsyncComm(CommBase.CommBase):
         dont_backlog (bool, optional): If True, the backlog will not be started
             and all messages will be sent/received directly to/from the comm.
             Defaults to False.
+        backlog_max_count (int, optional): Maximum number of messages that
+            can be held in the send or recv backlog before sends block (or
+            messages are left in the underlying connection for recv). Defaults
+            to 0 and the number of messages is not limited.
+        backlog_max_bytes (int, optional): Maximum number of bytes that can be
+            held in the send or recv backlog before sends block (or messages
+            are left in the underlying connection for recv). Defaults to 0 and
+            the number of bytes is not limited.
+        backlog_low_water (float, optional): Fraction of backlog_max_count
+            and backlog_max_bytes that a full backlog must drain to before
+            more messages are added to it. Defaults to 0.5.
+        backlog_timeout (float, optional): Time (in seconds) that a send
+            should wait for space in a full backlog before failing. Defaults
+            to None and sends wait until there is space or the comm is closed.
         **kwargs: Additional keyword arguments are passed to CommBase.
         
     Attributes:
@@ -25,17 +39,44 @@ class AsyncComm(CommBase.CommBase):
             message in the send backlog.
         backlog_recv_ready (threading.Event): Event set when there is a
             message in the recv backlog.
+        backlog_send_space (threading.Event): Event set when there is space
+            for messages in the send backlog.
+        backlog_recv_space (threading.Event): Event set when there is space
+            for messages in the recv backlog.
+        backlog_max_count (int): Maximum number of messages that can be held
+            in the backlog.
+        backlog_max_bytes (int): Maximum number of bytes that can be held in
+            the backlog.
+        backlog_low_water (float): Fraction of the maximums that a full
+            backlog must drain to before more messages are added.
+        backlog_timeout (float): Time that a send should wait for space in
+            a full backlog.
         
     """
+
+    _schema_properties = {
+        'backlog_max_count': {'type': 'integer', 'default': 0, 'minimum': 0},
+        'backlog_max_bytes': {'type': 'integer', 'default': 0, 'minimum': 0},
+        'backlog_low_water': {'type': 'number', 'default': 0.5,
+                              'minimum': 0, 'maximum': 1},
+        'backlog_timeout': {'type': 'number', 'minimum': 0}}
+
     def __init__(self, name, dont_backlog=False, **kwargs):
         # TODO: Fix the cleanup of Python threads in languages that call the
         # Python API underneath
         self.dont_backlog = (dont_backlog or kwargs.get('is_interface', False))
         self._backlog_recv = []
         self._backlog_send = []
+        self._backlog_recv_nbytes = 0
+        self._backlog_send_nbytes = 0
         self._backlog_thread = None
         self.backlog_send_ready = threading.Event()
         self.backlog_recv_ready = threading.Event()
+        self.backlog_send_space = threading.Event()
+        self.backlog_recv_space = threading.Event()
+        self.backlog_send_space.set()
+        self.backlog_recv_space.set()
+        self._recv_notifiers = []
         self.backlog_open = False
         self._used_direct = False
         super(AsyncComm, self).__init__(name, **kwargs)
@@ -107,6 +148,7 @@ class AsyncComm(CommBase.CommBase):
         self.backlog_thread.set_break_flag()
         self.backlog_send_ready.set()
         self.backlog_recv_ready.set()
+        self._notify_recv()
         if wait and not self.dont_backlog:
             self.backlog_thread.wait(key=str(uuid.uuid4()))
 
@@ -185,14 +227,16 @@ class AsyncComm(CommBase.CommBase):
 
     @property
     def n_msg_recv(self):
-        r"""int: Number of messages in the receive backlog."""
+        r"""int: Number of messages in the receive backlog (and remaining
+        from a received batch)."""
         if self.direction == 'recv':
             if self.dont_backlog:
-                return self.n_msg_direct_recv
+                out = self.n_msg_direct_recv
             else:
-                return self.n_msg_backlog_recv
+                out = self.n_msg_backlog_recv
         else:
-            return self.n_msg_direct_recv
+            out = self.n_msg_direct_recv
+        return out + len(self._batch_recv)
 
     @property
     def n_msg_send(self):
@@ -205,10 +249,99 @@ class AsyncComm(CommBase.CommBase):
         else:
             return self.n_msg_direct_send
 
+    def wait_for_direct(self, direction=None, timeout=None):
+        r"""Block until the direct comm is ready or the timeout is reached.
+        For receipt, the direct comm is ready when there is a message
+        waiting. For sending, it is ready when a sent message can be
+        confirmed. Subclasses that can poll the underlying connection should
+        override this so that waiting threads wake as soon as it is ready.
+
+        Args:
+            direction (str, optional): Direction that readiness should be
+                checked for. Defaults to self.direction.
+            timeout (float, optional): Maximum time (in seconds) that should
+                be waited. Defaults to self.sleeptime.
+
+        Returns:
+            bool: True if the direct comm is ready, False otherwise.
+
+        """
+        if direction is None:
+            direction = self.direction
+        if timeout is None:
+            timeout = self.sleeptime
+        if (direction == 'recv') and (self.n_msg_direct_recv > 0):
+            return True
+        self.sleep(timeout)
+        return ((direction == 'recv') and (self.n_msg_direct_recv > 0))
+
+    def wait_for_recv(self, timeout=None):
+        r"""Block until there is a message waiting to be received or the
+        timeout is reached.
+
+        Args:
+            timeout (float, optional): Maximum time (in seconds) that should
+                be waited. Defaults to self.sleeptime.
+
+        Returns:
+            bool: True if there is a message waiting, False otherwise.
+
+        """
+        if self._batch_recv:
+            return True
+        if timeout is None:
+            timeout = self.sleeptime
+        if (self.direction == 'recv') and (not self.dont_backlog):
+            if not self.is_open_backlog:
+                self.sleep(timeout)
+                return False
+            return self.backlog_recv_ready.wait(timeout)
+        return self.wait_for_direct(direction='recv', timeout=timeout)
+
+    def add_recv_notifier(self, event):
+        r"""Register an event that should be set when a message is added to
+        the recv backlog (or the backlog is closed) so that a thread can wait
+        on several comms at once. Notifications are only possible for
+        receiving comms that use a backlog.
+
+        Args:
+            event (threading.Event): Event that should be set.
+
+        Returns:
+            bool: True if the comm will set the event, False otherwise.
+
+        """
+        if (self.direction != 'recv') or self.dont_backlog:
+            return False
+        with self.backlog_thread.lock:
+            if event not in self._recv_notifiers:
+                self._recv_notifiers.append(event)
+            if self.backlog_recv_ready.is_set():
+                event.set()
+        return True
+
+    def remove_recv_notifier(self, event):
+        r"""Stop setting an event registered with add_recv_notifier.
+
+        Args:
+            event (threading.Event): Event that should no longer be set.
+
+        """
+        with self.backlog_thread.lock:
+            if event in self._recv_notifiers:
+                self._recv_notifiers.remove(event)
+
+    def _notify_recv(self):
+        r"""Set the events registered to be notified of received messages."""
+        for x in list(self._recv_notifiers):
+            x.set()
+
     @property
     def n_msg_recv_drain(self):
-        r"""int: Number of messages in the receive backlog and direct comm."""
-        return self.n_msg_direct_recv + self.n_msg_backlog_recv
+        r"""int: Number of messages in the receive backlog, direct comm, and
+        remaining from a received batch."""
+        return (self.n_msg_direct_recv + self.n_msg_backlog_recv
+                + len(self._batch_recv))
 
     @property
     def n_msg_send_drain(self):
@@ -243,6 +376,75 @@ class AsyncComm(CommBase.CommBase):
         with self.backlog_thread.lock:
             return self._backlog_send
 
+    def _update_backlog_space(self, direction):
+        r"""Update the event indicating that there is space in a backlog
+        based on the high (backlog_max_count/backlog_max_bytes) and low
+        (backlog_low_water) water marks. This should be called with the
+        backlog lock acquired.
+
+        Args:
+            direction (str): Direction of the backlog that should be updated
+                ('send' or 'recv').
+
+        """
+        if direction == 'send':
+            count = len(self._backlog_send)
+            nbytes = self._backlog_send_nbytes
+            event = self.backlog_send_space
+        else:
+            count = len(self._backlog_recv)
+            nbytes = self._backlog_recv_nbytes
+            event = self.backlog_recv_space
+        max_count = self.backlog_max_count
+        max_bytes = self.backlog_max_bytes
+        if event.is_set():
+            if (((max_count and (count >= max_count))
+                 or (max_bytes and (nbytes >= max_bytes)))):
+                self.debug("%s backlog full (%d messages, %d bytes)",
+                           direction, count, nbytes)
+                event.clear()
+        else:
+            low = self.backlog_low_water
+            if (((not max_count) or (count <= low * max_count))
+                    and ((not max_bytes) or (nbytes <= low * max_bytes))):
+                self.debug("%s backlog drained (%d messages, %d bytes)",
+                           direction, count, nbytes)
+                event.set()
+
+    def wait_for_backlog_space(self, direction=None, timeout=None):
+        r"""Block until there is space in the backlog, the timeout is
+        reached, or the comm is closed.
+
+        Args:
+            direction (str, optional): Direction of the backlog that should
+                be waited on. Defaults to self.direction.
+            timeout (float, optional): Maximum time (in seconds) that should
+                be waited. Defaults to backlog_timeout.
+
+        Returns:
+            bool: True if there is space in the backlog, False otherwise.
+
+        """
+        if direction is None:
+            direction = self.direction
+        if direction == 'send':
+            event = self.backlog_send_space
+        else:
+            event = self.backlog_recv_space
+        if event.is_set():
+            return True
+        if timeout is None:
+            timeout = self.backlog_timeout
+        if timeout is None:
+            timeout = False
+        T = self.start_timeout(timeout, key_suffix='_backlog_space')
+        while ((not T.is_out) and (not event.is_set())
+               and self.is_open_backlog
+               and (not self._closing_thread.was_terminated)):
+            event.wait(self.sleeptime)
+        self.stop_timeout(key_suffix='_backlog_space')
+        return event.is_set()
+
     def add_backlog_recv(self, msg):
         r"""Add a message to the backlog of received messages.
 
@@ -253,7 +455,10 @@ class AsyncComm(CommBase.CommBase):
         with self.backlog_thread.lock:
             self.debug("Added %d bytes to recv backlog.", len(msg))
             self._backlog_recv.append(msg)
+            self._backlog_recv_nbytes += len(msg)
+            self._update_backlog_space('recv')
             self.backlog_recv_ready.set()
+            self._notify_recv()
 
     def add_backlog_send(self, msg, **kwargs):
         r"""Add a message to the backlog of messages to be sent.
@@ -267,6 +472,8 @@ class AsyncComm(CommBase.CommBase):
         with self.backlog_thread.lock:
             self.debug("Added %d bytes to send backlog.", len(msg))
             self._backlog_send.append((msg, kwargs))
+            self._backlog_send_nbytes += len(msg)
+            self._update_backlog_space('send')
             self.backlog_send_ready.set()
 
     def pop_backlog_recv(self):
@@ -279,6 +486,8 @@ class AsyncComm(CommBase.CommBase):
         with self.backlog_thread.lock:
             msg = self._backlog_recv.pop(0)
             self.debug("Popped %d bytes from recv backlog.", len(msg))
+            self._backlog_recv_nbytes -= len(msg)
+            self._update_backlog_space('recv')
             if len(self._backlog_recv) == 0:
                 self.backlog_recv_ready.clear()
         return msg
@@ -294,6 +503,8 @@ class AsyncComm(CommBase.CommBase):
         with self.backlog_thread.lock:
             msg, kwargs = self._backlog_send.pop(0)
             self.debug("Popped %d bytes from send backlog.", len(msg))
+            self._backlog_send_nbytes -= len(msg)
+            self._update_backlog_space('send')
             if len(self._backlog_send) == 0:
                 self.backlog_send_ready.clear()
         return msg, kwargs
@@ -311,7 +522,13 @@ class AsyncComm(CommBase.CommBase):
         self.periodic_debug('run_backlog_send', period=1000)(
             "Sleeping (is_confirmed_send=%s)",
             str(self.is_confirmed_send))
-        self.sleep()
+        if self.n_msg_backlog_send > 0:
+            # Direct comm was not available for the last message
+            self.sleep()
+        elif self.n_msg_direct_send > 0:
+            self.wait_for_direct(direction='send')
+        else:
+            self.backlog_send_ready.wait(self.sleeptime)
 
     def run_backlog_recv(self):
         r"""Continue buffering received messages."""
@@ -323,6 +540,11 @@ class AsyncComm(CommBase.CommBase):
             self.debug("Backlog closed")
             self._close_backlog()
             return
+        if not self.backlog_recv_space.is_set():
+            # Leave messages in the direct comm until the model catches up
+            # so that the sender is eventually blocked
+            self.backlog_recv_space.wait(self.sleeptime)
+            return
         if not self.recv_backlog():
             # Stop the thread, but don't close the backlog
             self.debug("Stopping backlog recv thread")
@@ -331,7 +553,7 @@ class AsyncComm(CommBase.CommBase):
         self.periodic_debug('run_backlog_recv', period=1000)(
             "Sleeping (is_confirmed_recv=%s)",
             str(self.is_confirmed_recv))
-        self.sleep()
+        self.wait_for_direct(direction='recv')
 
     def send_backlog(self):
         r"""Send a message from the send backlog to the queue."""
@@ -448,6 +670,10 @@ class AsyncComm(CommBase.CommBase):
             except AsyncTryAgain:
                 if no_backlog:  # pragma: debug
                     raise
+        if not self.wait_for_backlog_space(direction='send'):
+            self.error("Send backlog full (%d messages, %d bytes).",
+                       self.n_msg_backlog_send, self._backlog_send_nbytes)
+            return False
         self.add_backlog_send(payload, **kwargs)
         self.debug('%d bytes backlogged', len(payload))
         return True
@@ -482,7 +708,7 @@ class AsyncComm(CommBase.CommBase):
             T = self.start_timeout(timeout, key_suffix='_recv:direct')
             while ((not T.is_out) and (self.n_msg_direct_recv == 0)
                    and self.is_open_direct):
-                self.sleep()
+                self.wait_for_direct(direction='recv')
             self.stop_timeout(key_suffix='_recv:direct')
             if not self.is_open_direct:  # pragma: debug
                 self.debug("Comm closed")
@@ -530,3 +756,7 @@ class AsyncComm(CommBase.CommBase):
             self.backlog_send_ready.clear()
             self._backlog_recv = []
             self._backlog_send = []
+            self._backlog_recv_nbytes = 0
+            self._backlog_send_nbytes = 0
+            self.backlog_recv_space.set()
+            self.backlog_send_space.set()
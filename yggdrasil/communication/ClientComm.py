@@ -3,6 +3,78 @@ from yggdrasil.components import import_component
 from yggdrasil.communication import (CommBase, new_comm, get_comm)
 
 
+class ClientResponseFuture(object):
+    r"""Pending response to a request sent asynchronously by a client.
+
+    Args:
+        comm (ClientComm): Client comm that sent the request.
+        request_id (str): ID of the request.
+        result (tuple, optional): Result for the request if it is already
+            known (e.g. because the request could not be sent). Defaults to
+            None and the result is received from the comm.
+
+    Attributes:
+        comm (ClientComm): Client comm that sent the request.
+        request_id (str): ID of the request.
+
+    """
+
+    def __init__(self, comm, request_id, result=None):
+        self.comm = comm
+        self.request_id = request_id
+        self._result = result
+
+    def done(self):
+        r"""Determine if the response has been received, checking for it
+        without waiting.
+
+        Returns:
+            bool: True if the response has been received, False otherwise.
+
+        """
+        if self._result is None:
+            self.result(timeout=0)
+        return (self._result is not None)
+
+    def result(self, timeout=False):
+        r"""Get the response, waiting for it if it has not been received.
+
+        Args:
+            timeout (float, optional): Time (in seconds) that should be waited
+                for the response. Defaults to False and the call will block
+                until the response is received.
+
+        Returns:
+            tuple (bool, obj): Success or failure of receive and the response.
+                If the response was not received before the timeout, an empty
+                message is returned and the request remains pending until the
+                response is received or the request is cancelled.
+
+        """
+        if self._result is None:
+            out = self.comm.recv_response(self.request_id, timeout=timeout)
+            if out[0] and self.comm.icomm.is_empty_recv(out[1]):
+                return out
+            self._result = out
+        return self._result
+
+    def cancel(self):
+        r"""Stop waiting for the response so that it is not returned by later
+        calls to the comm's recv method. If the response arrives later, it is
+        discarded.
+
+        Returns:
+            bool: True if the request was cancelled, False if the response
+                had already been received.
+
+        """
+        if self._result is not None:
+            return False
+        self.comm.cancel_request(self.request_id)
+        self._result = (False, self.comm.empty_obj_recv)
+        return True
+
+
 class ClientComm(CommBase.CommBase):
     r"""Class for handling Client side communication.
 
@@ -17,8 +89,10 @@ class ClientComm(CommBase.CommBase):
 
     Attributes:
         response_kwargs (dict): Keyword arguments for the response comm.
-        icomm (dict): Response comms keyed to the ID of the associated request.
-        icomm_order (list): Response comm keys in the order or the requests.
+        icomm (Comm): Response comm that is shared by all requests. It is
+            created when the first request is sent.
+        icomm_order (list): IDs of requests awaiting responses in the order
+            that the requests were sent.
         ocomm (Comm): Request comm.
 
     """
@@ -36,8 +110,9 @@ class ClientComm(CommBase.CommBase):
         ocomm_kwargs['comm'] = request_comm
         self.response_kwargs = response_kwargs
         self.ocomm = get_comm(ocomm_name, **ocomm_kwargs)
-        self.icomm = dict()
+        self.icomm = None
         self.icomm_order = []
+        self._response_backlog = dict()
         self.response_kwargs.setdefault('comm', self.ocomm.comm_class)
         self.response_kwargs.setdefault('recv_timeout', self.ocomm.recv_timeout)
         self.response_kwargs.setdefault('language', self.ocomm.language)
@@ -125,8 +200,8 @@ class ClientComm(CommBase.CommBase):
     def close(self, *args, **kwargs):
         r"""Close the connection."""
         self.ocomm.close(*args, **kwargs)
-        for k in self.icomm_order:
-            self.icomm[k].close()
+        if self.icomm is not None:
+            self.icomm.close()
         super(ClientComm, self).close(*args, **kwargs)
 
     @property
@@ -151,28 +226,58 @@ class ClientComm(CommBase.CommBase):
 
     # RESPONSE COMM
     def create_response_comm(self):
-        r"""Create a response comm based on information from the last header."""
-        comm_kwargs = dict(direction='recv', is_response_client=True,
-                           single_use=True, **self.response_kwargs)
-        header = dict(request_id=str(uuid.uuid4()))
-        if header['request_id'] in self.icomm:  # pragma: debug
+        r"""Register a new request, creating the response comm if it does not
+        already exist. A single response comm is used for all requests and
+        responses are routed using the request ID in their header.
+
+        Returns:
+            dict: Header keywords containing the request ID and the address
+                of the response comm.
+
+        """
+        if self.icomm is None:
+            comm_kwargs = dict(direction='recv', is_response_client=True,
+                               skip_component_schema_normalization=True,
+                               **self.response_kwargs)
+            self.icomm = new_comm('client_response_comm.' + str(uuid.uuid4()),
+                                  **comm_kwargs)
+        header = dict(request_id=str(uuid.uuid4()),
+                      response_address=self.icomm.address,
+                      persistent_response=True)
+        if header['request_id'] in self.icomm_order:  # pragma: debug
             raise ValueError("Request ID %s already in use." % header['request_id'])
-        c = new_comm('client_response_comm.' + header['request_id'], **comm_kwargs)
-        header['response_address'] = c.address
-        self.icomm[header['request_id']] = c
         self.icomm_order.append(header['request_id'])
         return header
 
-    def remove_response_comm(self):
-        r"""Remove response comm."""
-        key = self.icomm_order.pop(0)
-        icomm = self.icomm.pop(key)
-        icomm.close()
+    def remove_response_comm(self, request_id=None):
+        r"""Remove a request from the list of those awaiting a response.
+
+        Args:
+            request_id (str, optional): ID of the request that should be
+                removed. Defaults to None and the oldest request is removed.
+
+        """
+        if request_id is None:
+            request_id = self.icomm_order[0]
+        self.icomm_order.remove(request_id)
+        self._response_backlog.pop(request_id, None)
+
+    def cancel_request(self, request_id):
+        r"""Stop waiting for the response to a request. Responses that
+        arrive later for the request are discarded.
+
+        Args:
+            request_id (str): ID of the request that should be cancelled.
+
+        """
+        if request_id in self.icomm_order:
+            self.debug("Cancelling request %s", request_id)
+            self.remove_response_comm(request_id)
 
     # SEND METHODS
     def send(self, *args, **kwargs):
-        r"""Create a response comm and then send a message to the output comm
-        with the response address in the header.
+        r"""Register a request and then send a message to the output comm
+        with the request ID and response address in the header.
 
         Args:
             *args: Arguments are passed to output comm send method.
@@ -192,13 +297,29 @@ class ClientComm(CommBase.CommBase):
             created_response = True
         out = self.ocomm.send(*args, **kwargs)
         if (not out) and created_response:
-            self.remove_response_comm()
+            self.remove_response_comm(kwargs['header_kwargs']['request_id'])
         return out
 
+    def send_batch(self, msgs, **kwargs):
+        r"""Send a set of messages. Each message is sent separately so
+        that every request is assigned its own request ID.
+
+        Args:
+            msgs (list): Messages to send.
+            **kwargs: Keyword arguments are passed to send.
+
+        Returns:
+            bool: Success or failure of sending the messages.
+
+        """
+        for x in msgs:
+            if not self.send(x, **kwargs):
+                return False
+        return True
+
     # RECV METHODS
     def recv(self, *args, **kwargs):
-        r"""Receive a message from the input comm and open a new response comm
-        for output using address from the header.
+        r"""Receive the response to the oldest request awaiting a response.
 
         Args:
             *args: Arguments are passed to input comm recv method.
@@ -211,10 +332,50 @@ class ClientComm(CommBase.CommBase):
         # if self.is_closed:
         #     self.debug("recv(): Connection closed.")
         #     return (False, None)
-        if len(self.icomm) == 0:  # pragma: debug
-            raise RuntimeError("There are not any registered response comms.")
-        out = self.icomm[self.icomm_order[0]].recv(*args, **kwargs)
-        self.remove_response_comm()
+        if len(self.icomm_order) == 0:  # pragma: debug
+            raise RuntimeError("There are not any requests awaiting a response.")
+        return self.recv_response(self.icomm_order[0], *args, **kwargs)
+
+    def recv_response(self, request_id, *args, **kwargs):
+        r"""Receive the response to a specific request. Responses to other
+        outstanding requests that arrive first are stored until they are
+        requested. Responses without a request ID are assumed to arrive in
+        the same order as the requests.
+
+        Args:
+            request_id (str): ID of the request to receive the response for.
+            *args: Arguments are passed to response comm recv method.
+            **kwargs: Keyword arguments are passed to response comm recv method.
+
+        Returns:
+            tuple (bool, obj): Success or failure of receive and received
+                message.
+
+        Raises:
+            KeyError: If there is not a request with the provided ID awaiting a
+                response.
+
+        """
+        if request_id not in self.icomm_order:
+            raise KeyError("There is not a request with ID %s awaiting a response."
+                           % request_id)
+        while request_id not in self._response_backlog:
+            flag, msg = self.icomm.recv(*args, **kwargs)
+            if (not flag) or self.icomm.is_empty_recv(msg):
+                return flag, msg
+            header = self.icomm._last_header or {}
+            msg_id = header.get('request_id', None)
+            if msg_id is None:
+                for k in self.icomm_order:
+                    if k not in self._response_backlog:
+                        msg_id = k
+                        break
+            if msg_id in self.icomm_order:
+                self._response_backlog[msg_id] = (flag, msg)
+            else:  # pragma: debug
+                self.debug("Discarding response to unknown request %s", msg_id)
+        out = self._response_backlog[request_id]
+        self.remove_response_comm(request_id)
         return out
 
     # CALL
@@ -230,15 +391,61 @@ class ClientComm(CommBase.CommBase):
             obj: Output from input comm recv method.
 
         """
+        nreq = len(self.icomm_order)
         flag = self.send(*args, **kwargs)
-        if not flag:  # pragma: debug
+        if (not flag) or (len(self.icomm_order) == nreq):  # pragma: debug
             return (False, self.empty_obj_recv)
-        return self.recv(timeout=False)
+        return self.recv_response(self.icomm_order[-1], timeout=False)
 
     def call_nolimit(self, *args, **kwargs):
         r"""Alias for call."""
         return self.call(*args, **kwargs)
 
+    def call_async(self, *args, **kwargs):
+        r"""Send a request without waiting for the response. Any number of
+        requests can be outstanding at once and their responses can be
+        retrieved in any order.
+
+        Args:
+            *args: Arguments are passed to output comm send method.
+            **kwargs: Keyword arguments are passed to output comm send method.
+
+        Returns:
+            ClientResponseFuture: Pending response to the request.
+
+        """
+        nreq = len(self.icomm_order)
+        flag = self.send(*args, **kwargs)
+        if (not flag) or (len(self.icomm_order) == nreq):  # pragma: debug
+            return ClientResponseFuture(self, None,
+                                        result=(False, self.empty_obj_recv))
+        return ClientResponseFuture(self, self.icomm_order[-1])
+
+    def call_many(self, msgs, timeout=False, **kwargs):
+        r"""Send a set of requests before waiting for any of the responses so
+        that requests are processed while others are in transit.
+
+        Args:
+            msgs (list): Request messages.
+            timeout (float, optional): Time (in seconds) that should be waited
+                for each response. Defaults to False and the call will block
+                until all responses are received. Requests that are not
+                responded to before the timeout are cancelled.
+            **kwargs: Keyword arguments are passed to output comm send method.
+
+        Returns:
+            list: Success or failure of receive and the response for each
+                request, in the same order as the requests.
+
+        """
+        futures = [self.call_async(x, **kwargs) for x in msgs]
+        out = [x.result(timeout=timeout) for x in futures]
+        for i, x in enumerate(futures):
+            if not x.done():
+                x.cancel()
+                out[i] = x.result()
+        return out
+
     # OLD STYLE ALIASES
     def rpcSend(self, *args, **kwargs):
         r"""Alias for RPCComm.send"""
@@ -6,7 +6,8 @@ import threading
 import logging
 from yggdrasil import backwards, tools, serialize
 from yggdrasil.tools import YGG_MSG_EOF
-from yggdrasil.communication import new_comm, get_comm, determine_suffix
+from yggdrasil.communication import (
+    new_comm, get_comm, determine_suffix, tracing)
 from yggdrasil.components import import_component, create_component
 from yggdrasil.metaschema.datatypes import MetaschemaTypeError
 from yggdrasil.metaschema.datatypes.MetaschemaType import MetaschemaType
@@ -431,6 +432,7 @@ class CommBase(tools.YggClass):
         self.close_on_eof_recv = close_on_eof_recv
         self.close_on_eof_send = close_on_eof_send
         self._last_header = None
+        self._batch_recv = []
         self._work_comms = {}
         self.single_use = single_use
         self._used = False
@@ -445,6 +447,7 @@ class CommBase(tools.YggClass):
         self._server_class = CommServer
         self._server_kwargs = {}
         self._send_serializer = True
+        self._tracer = tracing.get_tracer()
         if self.single_use and (not self.is_response_server):
             self._send_serializer = False
         # Add interface tag
@@ -960,19 +963,70 @@ class CommBase(tools.YggClass):
 
     @property
     def n_msg_recv(self):
-        r"""int: The number of incoming messages in the connection."""
-        return 0
+        r"""int: The number of incoming messages in the connection, including
+        messages remaining from a received batch."""
+        return len(self._batch_recv)
 
     @property
     def n_msg_send(self):
         r"""int: The number of outgoing messages in the connection."""
         return 0
 
+    @property
+    def n_msg_batch_recv(self):
+        r"""int: The number of messages remaining from a received batch."""
+        return len(self._batch_recv)
+
     @property
     def n_msg_recv_drain(self):
         r"""int: The number of incoming messages in the connection to drain."""
         return self.n_msg_recv
 
+    def wait_for_recv(self, timeout=None):
+        r"""Block until there is a message waiting to be received or the
+        timeout is reached. By default this sleeps for the timeout. Comms
+        that can be notified when a message arrives should override this so
+        that waiting threads wake immediately.
+
+        Args:
+            timeout (float, optional): Maximum time (in seconds) that should
+                be waited. Defaults to self.sleeptime.
+
+        Returns:
+            bool: True if a message is known to be waiting, False otherwise.
+
+        """
+        if self._batch_recv:
+            return True
+        if timeout is None:
+            timeout = self.sleeptime
+        self.sleep(timeout)
+        return False
+
+    def add_recv_notifier(self, event):
+        r"""Register an event that should be set when a message becomes
+        available to receive (or the comm is closed) so that a thread can wait
+        on several comms at once. By default comms cannot provide
+        notifications and must be polled.
+
+        Args:
+            event (threading.Event): Event that should be set.
+
+        Returns:
+            bool: True if the comm will set the event, False otherwise.
+
+        """
+        return False
+
+    def remove_recv_notifier(self, event):
+        r"""Stop setting an event registered with add_recv_notifier.
+
+        Args:
+            event (threading.Event): Event that should no longer be set.
+
+        """
+        pass
+
     @property
     def n_msg_send_drain(self):
         r"""int: The number of outgoing messages in the connection to drain."""
@@ -1061,7 +1115,15 @@ class CommBase(tools.YggClass):
         if len(msg_in) == 1:
             msg_in = msg_in[0]
         if self.filter and (not self.is_eof(msg_in)):
+            if self._tracer is not None:
+                t_start = self._tracer.time()
             out = self.filter(msg_in)
+            if self._tracer is not None:
+                msg_id = None
+                if (self.direction == 'recv') and self._last_header:
+                    msg_id = self._last_header.get('trace_id', None)
+                self._tracer.record('filter', self.name, t_start,
+                                    msg_id=msg_id, address=self.address)
         assert(isinstance(out, bool))
         return out
         
@@ -1119,10 +1181,12 @@ class CommBase(tools.YggClass):
             str: Chunks of message.
 
         """
+        # Slice a view so that only the chunk being yielded is copied
+        msg_view = memoryview(msg)
         prev = 0
         while prev < len(msg):
             next = min(prev + self.maxMsgSize, len(msg))
-            yield msg[prev:next]
+            yield msg_view[prev:next].tobytes()
             prev = next
 
     # CLIENT/SERVER METHODS
@@ -1178,7 +1242,8 @@ class CommBase(tools.YggClass):
         return dict(comm=self.comm_class, direction='recv',
                     recv_timeout=self.recv_timeout,
                     is_interface=self.is_interface,
-                    single_use=True)
+                    single_use=True,
+                    skip_component_schema_normalization=True)
 
     @property
     def create_work_comm_kwargs(self):
@@ -1186,7 +1251,8 @@ class CommBase(tools.YggClass):
         return dict(comm=self.comm_class, direction='send',
                     recv_timeout=self.recv_timeout,
                     is_interface=self.is_interface,
-                    uuid=str(uuid.uuid4()), single_use=True)
+                    uuid=str(uuid.uuid4()), single_use=True,
+                    skip_component_schema_normalization=True)
 
     def get_work_comm(self, header, **kwargs):
         r"""Get temporary work comm, creating as necessary.
@@ -1453,11 +1519,21 @@ class CommBase(tools.YggClass):
         else:
             flag = True
             # Covert object
-            msg_ = self.apply_send_converter(msg)
+            if (header_kwargs is not None) and header_kwargs.get('batch', False):
+                msg_ = [self.apply_send_converter(x) for x in msg]
+            else:
+                msg_ = self.apply_send_converter(msg)
             # Serialize
             add_sinfo = (self._send_serializer and (not self.is_file))
             if add_sinfo:
                 self.debug('Sending sinfo: %s', self.serializer.serializer_info)
+            trace = ((self._tracer is not None) and (not self.is_file))
+            if trace:
+                # Messages are identified by a separate header key when
+                # tracing as 'id' is replaced for messages sent in parts
+                header_kwargs = dict(header_kwargs or {})
+                header_kwargs.setdefault('trace_id', tracing.new_message_id())
+                t_start = self._tracer.time()
             msg_s = self.serialize(msg_, header_kwargs=header_kwargs,
                                    add_serializer_info=add_sinfo)
             # Create work comm if message too large to be sent all at once
@@ -1471,6 +1547,10 @@ class CommBase(tools.YggClass):
                 #     work_comm = self.get_work_comm(header_kwargs)
                 header_kwargs = self.workcomm2header(work_comm, **header_kwargs)
                 msg_s = self.serialize(msg_, header_kwargs=header_kwargs)
+            if trace:
+                self._tracer.record('serialize', self.name, t_start,
+                                    msg_id=header_kwargs['trace_id'],
+                                    address=self.address, nbytes=len(msg_s))
         return flag, msg_s, header_kwargs
 
     def send(self, *args, **kwargs):
@@ -1486,6 +1566,8 @@ class CommBase(tools.YggClass):
         """
         if self.single_use and self._used:  # pragma: debug
             raise RuntimeError("This comm is single use and it was already used.")
+        if (self._tracer is not None) and self.is_interface:
+            self._tracer.record_model_send()
         args = self.language_driver.language2python(args)
         if not self.evaluate_filter(*args):
             # Return True to indicate success because nothing should be done
@@ -1521,6 +1603,53 @@ class CommBase(tools.YggClass):
             # self.close_in_thread(no_wait=True, timeout=False)
         return ret
 
+    def send_batch(self, msgs, **kwargs):
+        r"""Send a set of messages. If possible, the messages are coalesced
+        into a single message that shares one header and type check and is
+        unpacked into the individual messages by the receiving comm.
+        Otherwise, the messages are sent one at a time.
+
+        Args:
+            msgs (list): Messages to send. Each element is treated as the
+                single argument that would be passed to send.
+            **kwargs: All keywords arguments are passed to send_multipart (or
+                send if the messages cannot be coalesced).
+
+        Returns:
+            bool: Success or failure of send.
+
+        """
+        if (((len(msgs) < 2) or self.single_use or self.is_file
+             or (self.serializer.func_serialize is not None)
+             or any([self.is_eof(x) for x in msgs]))):
+            for x in msgs:
+                if not self.send(x, **kwargs):
+                    return False
+            return True
+        batch = []
+        for x in msgs:
+            args = self.language_driver.language2python((x,))
+            if not self.evaluate_filter(*args):
+                self.debug("Sent message skipped based on filter: %.100s",
+                           str(args))
+                continue
+            batch.append(args[0])
+        if len(batch) == 0:
+            return True
+        header_kwargs = copy.deepcopy(kwargs.pop('header_kwargs', {}))
+        header_kwargs['batch'] = True
+        try:
+            ret = self.send_multipart(batch, header_kwargs=header_kwargs,
+                                      **kwargs)
+        except BaseException:
+            self.exception('Failed to send batch of %d messages.', len(batch))
+            return False
+        if ret:
+            self._used = True
+            if self.serializer.initialized:
+                self._send_serializer = False
+        return ret
+
     def send_multipart(self, msg, header_kwargs=None, **kwargs):
         r"""Send a multipart message. If the message is smaller than maxMsgSize,
         it is sent using _send, otherwise it is sent to a worker comm using
@@ -1542,6 +1671,8 @@ class CommBase(tools.YggClass):
         if not flag:
             return flag
         msg_len = len(msg_s)
+        if self._tracer is not None:
+            t_start = self._tracer.time()
         # Sent first part of message which includes the header describing the
         # work comm
         self.special_debug('Sending %d bytes', msg_len)
@@ -1551,12 +1682,16 @@ class CommBase(tools.YggClass):
             flag = self._safe_send(msg_s[:self.maxMsgSize])
             if flag:
                 # Send remainder of message using work comm
-                flag = self._send_multipart_worker(msg_s[self.maxMsgSize:],
-                                                   header, **kwargs)
+                flag = self._send_multipart_worker(
+                    memoryview(msg_s)[self.maxMsgSize:], header, **kwargs)
             else:  # pragma: debug
                 self.special_debug("Sending message header failed.")
         if flag:
             self.debug('Sent %d bytes', msg_len)
+            if self._tracer is not None:
+                self._tracer.record('send', self.name, t_start,
+                                    msg_id=(header or {}).get('trace_id', None),
+                                    address=self.address, nbytes=msg_len)
         else:
             self.special_debug('Failed to send %d bytes', msg_len)
         return flag
@@ -1614,16 +1749,32 @@ class CommBase(tools.YggClass):
 
         """
         ret = True
-        while len(data) < leng_exp:
-            payload = self._safe_recv(**kwargs)
-            if not payload[0]:  # pragma: debug
-                self.debug("Read interupted at %d of %d bytes.",
-                           len(data), leng_exp)
-                ret = False
-                break
-            data = data + payload[1]
-            # if len(payload[1]) == 0:
-            #     self.sleep()
+        nrecv = len(data)
+        if nrecv < leng_exp:
+            # Parts are copied into a buffer allocated once for the expected
+            # size so the cost of assembly is linear in the message size
+            buf = bytearray(leng_exp)
+            buf_view = memoryview(buf)
+            buf_view[:nrecv] = data
+            while nrecv < leng_exp:
+                payload = self._safe_recv(**kwargs)
+                if not payload[0]:  # pragma: debug
+                    self.debug("Read interupted at %d of %d bytes.",
+                               nrecv, leng_exp)
+                    ret = False
+                    break
+                nnew = len(payload[1])
+                if (nrecv + nnew) > leng_exp:  # pragma: debug
+                    buf = buf[:nrecv] + payload[1]
+                    nrecv += nnew
+                    break
+                buf_view[nrecv:(nrecv + nnew)] = payload[1]
+                nrecv += nnew
+                # if len(payload[1]) == 0:
+                #     self.sleep()
+            if nrecv < len(buf):
+                buf = buf[:nrecv]
+            data = bytes(buf)
         payload = (ret, data)
         self.debug("Read %d/%d bytes", len(data), leng_exp)
         return payload
@@ -1680,12 +1831,22 @@ class CommBase(tools.YggClass):
         metadata = None
         if second_pass:
             metadata = self._last_header
+        if self._tracer is not None:
+            t_start = self._tracer.time()
         msg_, header = self.deserialize(s_msg, metadata=metadata)
+        if (((self._tracer is not None) and (len(s_msg) > 0)
+             and (not header.get('incomplete', False)))):
+            self._tracer.record('deserialize', self.name, t_start,
+                                msg_id=header.get('trace_id', None),
+                                address=self.address, nbytes=len(s_msg))
         if self.is_eof(msg_):
             flag = self.on_recv_eof()
             msg = msg_
         elif not header.get('incomplete', False):
-            msg = self.apply_recv_converter(msg_)
+            if header.get('batch', False):
+                msg = [self.apply_recv_converter(x) for x in msg_]
+            else:
+                msg = self.apply_recv_converter(msg_)
         else:
             msg = msg_
         if not second_pass:
@@ -1723,6 +1884,10 @@ class CommBase(tools.YggClass):
             assert(not self.single_use)
             self.debug("Recieved message skipped based on filter: %.100s", str(msg))
             return self.recv(*args, **kwargs)
+        if (((self._tracer is not None) and flag and self.is_interface
+             and self._last_header and (not self.is_empty_recv(msg)))):
+            self._tracer.record_model_recv(
+                self._last_header.get('trace_id', None))
         if self.single_use and self._used:
             self.debug('Linger close on single use')
             self.linger_close()
@@ -1744,12 +1909,23 @@ class CommBase(tools.YggClass):
                 message.
 
         """
+        # Return messages remaining from a batch
+        if self._batch_recv:
+            return True, self._batch_recv.pop(0)
         # Receive first part of message
+        if self._tracer is not None:
+            t_start = self._tracer.time()
         flag, s_msg = self._safe_recv(*args, **kwargs)
         if not flag:
             return flag, s_msg
+        if self._tracer is not None:
+            t_recv = self._tracer.time()
         # Parse message
         flag, msg, header = self.on_recv(s_msg)
+        if (self._tracer is not None) and flag and (len(s_msg) > 0):
+            self._tracer.record('recv', self.name, t_start, end=t_recv,
+                                msg_id=header.get('trace_id', None),
+                                address=self.address, nbytes=len(s_msg))
         if not flag:
             if not header.get('raw', False):  # pragma: debug
                 self.debug("Failed to receive message header.")
@@ -1757,14 +1933,67 @@ class CommBase(tools.YggClass):
         # Receive remainder of message that was not received
         if header.get('incomplete', False):
             header['body'] = msg
+            if self._tracer is not None:
+                t_start = self._tracer.time()
             flag, s_msg = self._recv_multipart_worker(header, **kwargs)
             if not flag:  # pragma: debug
                 return flag, s_msg
+            if self._tracer is not None:
+                self._tracer.record('recv', self.name, t_start,
+                                    msg_id=header.get('trace_id', None),
+                                    address=self.address,
+                                    nbytes=len(s_msg))
             # Parse complete message
             flag, msg, header2 = self.on_recv(s_msg, second_pass=True)
         if flag and len(s_msg) > 0:
             self.debug('%d bytes received', len(s_msg))
+        # Unpack batch, returning the first message
+        if flag and header.get('batch', False):
+            self._batch_recv = list(msg[1:])
+            msg = msg[0]
         return flag, msg
+
+    def recv_batch(self, max_n=None, timeout=None, **kwargs):
+        r"""Receive a set of messages. This blocks until the first message
+        is received or the timeout is reached and then returns any additional
+        messages that are already waiting (e.g. the remainder of a batch
+        sent using send_batch).
+
+        Args:
+            max_n (int, optional): Maximum number of messages that should be
+                returned. Defaults to None and all waiting messages are
+                returned.
+            timeout (float, optional): Time (in seconds) that should be
+                waited for the first message. Defaults to None and
+                recv_timeout is used.
+            **kwargs: All keyword arguments are passed to recv.
+
+        Returns:
+            tuple (bool, list): Success or failure of receive and the
+                received messages.
+
+        """
+        out = []
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+        flag, msg = self.recv(**kwargs)
+        kwargs['timeout'] = 0
+        while flag and (not self.is_empty_recv(msg)):
+            if self.is_eof(msg):
+                if len(out) == 0:
+                    out.append(msg)
+                else:
+                    # Return the EOF on the next call
+                    self._batch_recv.insert(0, msg)
+                break
+            out.append(msg)
+            if (((max_n is not None) and (len(out) >= max_n))
+                    or not (self._batch_recv or (self.n_msg_recv > 0))):
+                break
+            flag, msg = self.recv(**kwargs)
+        if len(out) > 0:
+            flag = True
+        return flag, out
         
     def recv_nolimit(self, *args, **kwargs):
         r"""Alias for recv."""
@@ -1799,6 +2028,7 @@ class CommBase(tools.YggClass):
         self._n_recv = 0
         self._last_send = None
         self._last_recv = None
+        self._batch_recv = []
 
     # Send/recv dictionary of fields
     def send_dict(self, args_dict, **kwargs):
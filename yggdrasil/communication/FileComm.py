@@ -1,5 +1,6 @@
 import os
 import copy
+import mmap
 import tempfile
 from yggdrasil import backwards, platform
 from yggdrasil.serialize.SerializeBase import SerializeBase
@@ -38,6 +39,17 @@ class FileComm(CommBase.CommBase):
         wait_for_creation (float, optional): Time (in seconds) that should be
             waited before opening for the file to be created if it dosn't exist.
             Defaults to 0 s and file will attempt to be opened immediately.
+        read_chunk_size (int, optional): Maximum number of bytes that should be
+            read from the file at once. For framed serializations, frames are
+            located by reading progressively larger chunks starting at this
+            size so that only one frame is held in memory at a time. For direct
+            serialization, received messages will contain at most this many
+            bytes. Defaults to 0 and the remainder of the file is read (frames
+            are located starting with chunks of 1 MB). Ignored if direction is
+            'send' or read_meth is 'readline'.
+        use_mmap (bool, optional): If True and reading, the file is memory
+            mapped and messages are sliced from the mapping instead of read via
+            the file object. Defaults to False.
         **kwargs: Additional keywords arguments are passed to parent class.
 
     Attributes:
@@ -51,6 +63,9 @@ class FileComm(CommBase.CommBase):
             reached. If writing, each output will be to a new file in the series.
         platform_newline (str): String indicating a newline on the current
             platform.
+        read_chunk_size (int): Maximum number of bytes that should be read
+            from the file at once.
+        use_mmap (bool): If True and reading, the file is memory mapped.
 
     Raises:
         ValueError: If the read_meth is not one of the supported values.
@@ -75,6 +90,8 @@ class FileComm(CommBase.CommBase):
         'in_temp': {'type': 'boolean', 'default': False},
         'is_series': {'type': 'boolean', 'default': False},
         'wait_for_creation': {'type': 'float', 'default': 0.0},
+        'read_chunk_size': {'type': 'int', 'default': 0},
+        'use_mmap': {'type': 'boolean', 'default': False},
         'serializer': {'oneOf': [{'$ref': '#/definitions/serializer'},
                                  {'type': 'instance',
                                   'class': SerializeBase}],
@@ -87,6 +104,7 @@ class FileComm(CommBase.CommBase):
     _default_extension = '.txt'
     is_file = True
     _maxMsgSize = 0
+    _frame_chunk_size = 2**20
 
     def __init__(self, *args, **kwargs):
         kwargs.setdefault('close_on_eof_send', True)
@@ -101,6 +119,7 @@ class FileComm(CommBase.CommBase):
         # Process file class keywords
         if not hasattr(self, '_fd'):
             self._fd = None
+        self._mmap = None
         self.platform_newline = platform._newline
         if self.in_temp:
             self.address = os.path.join(tempfile.gettempdir(), self.address)
@@ -426,6 +445,7 @@ class FileComm(CommBase.CommBase):
                     raise
 
     def _file_close(self):
+        self._close_mmap()
         if self.is_open:
             try:
                 self.fd.flush()
@@ -481,17 +501,100 @@ class FileComm(CommBase.CommBase):
         r"""Associated file identifier."""
         return self._fd
 
+    def _close_mmap(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _get_mmap(self):
+        r"""Get a read-only memory map of the current file, remapping it if
+        the size of the file has changed since it was last mapped.
+
+        Returns:
+            mmap.mmap: Memory map of the file. An empty bytes string is
+                returned if the file is empty as empty files cannot be mapped.
+
+        """
+        size = os.fstat(self.fd.fileno()).st_size
+        if (self._mmap is None) or (len(self._mmap) != size):
+            self._close_mmap()
+            if size == 0:
+                return self.empty_bytes_msg
+            self._mmap = mmap.mmap(self.fd.fileno(), size,
+                                   access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def _read(self, size=-1):
+        r"""Read bytes from the current position in the file.
+
+        Args:
+            size (int, optional): Maximum number of bytes that should be read.
+                Defaults to -1 and the remainder of the file is read.
+
+        Returns:
+            bytes: Bytes read from the file.
+
+        """
+        if not self.use_mmap:
+            return self.fd.read(size)
+        pos = self.fd.tell()
+        mm = self._get_mmap()
+        end = len(mm)
+        if size >= 0:
+            end = min(end, pos + size)
+        if pos >= end:
+            return self.empty_bytes_msg
+        out = mm[pos:end]
+        self.fd.seek(end)
+        return out
+
+    def _read_frame(self):
+        r"""Read the first frame from the current position in the file,
+        reading progressively larger chunks until a complete frame is found or
+        the end of the file is reached.
+
+        Returns:
+            bytes: First frame. If a frame could not be located, an empty
+                string is returned.
+
+        """
+        prev_pos = self.fd.tell()
+        chunk = (self.read_chunk_size or self._frame_chunk_size)
+        out = self._read(chunk)
+        frame = self.serializer.get_first_frame(out)
+        while (not frame) and (len(out) == chunk):
+            more = self._read(chunk)
+            if not more:
+                break
+            out += more
+            chunk = len(out)
+            frame = self.serializer.get_first_frame(out)
+        if frame and (len(frame) != len(out)):
+            self.fd.seek(prev_pos + len(frame))
+        return frame
+
+    def _read_message(self):
+        r"""Read the next message from the file for read_meth 'read'.
+
+        Returns:
+            bytes: Message read from the file.
+
+        """
+        if self.serializer.is_framed:
+            return self._read_frame()
+        if self.read_chunk_size and (self.serializer._seritype == 'direct'):
+            return self._read(self.read_chunk_size)
+        return self._read()
+
     @property
     def remaining_bytes(self):
         r"""int: Remaining bytes in the file."""
         if self.is_closed or self.direction == 'send':
             return 0
-        pos = self.record_position()
         try:
             curpos = self.fd.tell()
-            self.fd.seek(0, os.SEEK_END)
-            endpos = self.fd.tell()
-            out = endpos - curpos
+            endpos = os.fstat(self.fd.fileno()).st_size
+            out = max(endpos - curpos, 0)
         except (ValueError, AttributeError, OSError):  # pragma: debug
             if self.is_open:
                 raise
@@ -504,7 +607,6 @@ class FileComm(CommBase.CommBase):
                     break
                 out += os.path.getsize(fname)
                 i += 1
-        self.change_position(*pos)
         return out
 
     @property
@@ -605,7 +707,7 @@ class FileComm(CommBase.CommBase):
             prev_pos = self.fd.tell()
             flag = True
             if self.read_meth == 'read':
-                out = self.fd.read()
+                out = self._read_message()
             elif self.read_meth == 'readline':
                 out = self.fd.readline()
         except BaseException:  # pragma: debug
@@ -635,13 +737,6 @@ class FileComm(CommBase.CommBase):
                     # concatenate
                     self.reset_position()
                     flag, out = self._recv()
-                elif (self.read_meth == 'read') and self.serializer.is_framed:
-                    # Rewind if more than one frame read
-                    len0 = len(out)
-                    out = self.serializer.get_first_frame(out)
-                    len1 = len(out)
-                    if (len1 > 0) and (len0 != len1):
-                        self.fd.seek(prev_pos + len1)
         return (flag, out)
 
     def purge(self):
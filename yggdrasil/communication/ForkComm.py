@@ -1,3 +1,4 @@
+import threading
 from yggdrasil.communication import CommBase, get_comm
 from yggdrasil.components import import_component
 
@@ -32,6 +33,8 @@ class ForkComm(CommBase.CommBase):
     Attributes:
         comm_list (list): Comms included in this fork.
         curr_comm_index (int): Index comm that next receive will be from.
+        recv_ready (threading.Event): Event set by comms in the fork when
+            a message becomes available to receive.
 
     """
 
@@ -41,6 +44,8 @@ class ForkComm(CommBase.CommBase):
         self.comm_list = []
         self.curr_comm_index = 0
         self.eof_recv = []
+        self.recv_ready = threading.Event()
+        self._notified = []
         address = kwargs.pop('address', None)
         if (comm in [None, 'ForkComm']):
             if isinstance(address, list):
@@ -65,6 +70,8 @@ class ForkComm(CommBase.CommBase):
             iname = ikw.pop('name')
             self.comm_list.append(get_comm(iname, **ikw))
             self.eof_recv.append(0)
+            self._notified.append(
+                self.comm_list[-1].add_recv_notifier(self.recv_ready))
         if ncomm > 0:
             kwargs['address'] = [x.address for x in self.comm_list]
         kwargs['comm'] = 'ForkComm'
@@ -155,6 +162,7 @@ class ForkComm(CommBase.CommBase):
         r"""Close the connection."""
         for x in self.comm_list:
             x.close(*args, **kwargs)
+            x.remove_recv_notifier(self.recv_ready)
 
     def close_in_thread(self, *args, **kwargs):  # pragma: debug
         r"""In a new thread, close the comm when it is empty."""
@@ -210,6 +218,11 @@ class ForkComm(CommBase.CommBase):
         r"""int: The number of outgoing messages in the connection."""
         return sum([x.n_msg_send for x in self.comm_list])
 
+    @property
+    def n_msg_batch_recv(self):
+        r"""int: The number of messages remaining from received batches."""
+        return sum([x.n_msg_batch_recv for x in self.comm_list])
+
     @property
     def n_msg_recv_drain(self):
         r"""int: The number of incoming messages in the connection to drain."""
@@ -220,6 +233,45 @@ class ForkComm(CommBase.CommBase):
         r"""int: The number of outgoing messages in the connection to drain."""
         return sum([x.n_msg_send_drain for x in self.comm_list])
 
+    def wait_for_recv(self, timeout=None):
+        r"""Block until there is a message waiting to be received from one
+        of the comms or the timeout is reached. If all of the comms can
+        provide notifications, this waits on the notifications rather than
+        polling the comms.
+
+        Args:
+            timeout (float, optional): Maximum time (in seconds) that should
+                be waited. Defaults to self.sleeptime.
+
+        Returns:
+            bool: True if a message is known to be waiting, False otherwise.
+
+        """
+        if timeout is None:
+            timeout = self.sleeptime
+        if not all(self._notified):
+            return super(ForkComm, self).wait_for_recv(timeout=timeout)
+        return self.recv_ready.wait(timeout)
+
+    def _may_have_recv(self, i):
+        r"""Determine if the ith comm could have a message waiting without
+        attempting to receive one.
+
+        Args:
+            i (int): Index of the comm to check.
+
+        Returns:
+            bool: False if the comm is known to not have a message waiting,
+                True otherwise.
+
+        """
+        x = self.comm_list[i]
+        if not x.is_open:
+            return False
+        if self._notified[i]:
+            return x.wait_for_recv(timeout=0)
+        return True
+
     def send(self, *args, **kwargs):
         r"""Send a message.
 
@@ -237,6 +289,24 @@ class ForkComm(CommBase.CommBase):
                 return out
         return out
 
+    def send_batch(self, msgs, **kwargs):
+        r"""Send a set of messages to each of the comms.
+
+        Args:
+            msgs (list): Messages to send.
+            **kwargs: All keywords arguments are passed to comm send_batch
+                method.
+
+        Returns:
+            bool: Success or failure of send.
+
+        """
+        for x in self.comm_list:
+            out = x.send_batch(msgs, **kwargs)
+            if not out:
+                return out
+        return out
+
     def recv(self, *args, **kwargs):
         r"""Receive a message.
 
@@ -257,11 +327,14 @@ class ForkComm(CommBase.CommBase):
         T = self.start_timeout(timeout, key_suffix='recv:forkd')
         out = None
         while ((not T.is_out) or first_comm) and self.is_open and (out is None):
+            # Cleared before checking the comms so that messages that arrive
+            # during the pass are not missed
+            self.recv_ready.clear()
             for i in range(len(self)):
                 if out is not None:
                     break
                 x = self.curr_comm
-                if x.is_open:
+                if self._may_have_recv(self.curr_comm_index % len(self)):
                     flag, msg = x.recv(*args, **kwargs)
                     if self.is_eof(msg):
                         self.eof_recv[self.curr_comm_index % len(self)] = 1
@@ -272,7 +345,13 @@ class ForkComm(CommBase.CommBase):
                 self.curr_comm_index += 1
             first_comm = False
             if out is None:
-                self.sleep()
+                wait = self.sleeptime
+                if all(self._notified):
+                    if T.max_time is False:
+                        wait = self.timeout
+                    else:
+                        wait = max(T.max_time - T.elapsed, 0)
+                self.wait_for_recv(timeout=wait)
         self.stop_timeout(key_suffix='recv:forkd')
         if out is None:
             if self.is_closed:
@@ -17,3 +17,5 @@ class ObjFileComm(PlyFileComm):
         'data format for 3D structures.')
     _default_serializer = 'obj'
     _default_extension = '.obj'
+    _schema_excluded_from_inherit = (
+        PlyFileComm._schema_excluded_from_inherit + ['plyformat'])
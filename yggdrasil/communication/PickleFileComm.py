@@ -1,3 +1,4 @@
+from yggdrasil import backwards
 from yggdrasil.communication import FileComm
 
 
@@ -15,3 +16,68 @@ class PickleFileComm(FileComm.FileComm):
                                    'Python objects.')
     _default_serializer = 'pickle'
     _default_extension = '.pkl'
+
+    def __init__(self, *args, **kwargs):
+        self._unpickler = None
+        super(PickleFileComm, self).__init__(*args, **kwargs)
+
+    def _file_close(self):
+        self._unpickler = None
+        super(PickleFileComm, self)._file_close()
+
+    def _get_unpickler(self, source, pos):
+        r"""Get an unpickler that streams from the provided source, reusing
+        the existing unpickler if it was created for the same source and the
+        last object it loaded ended at the current position.
+
+        Args:
+            source (file, mmap.mmap): File or memory map to read from.
+            pos (int): Current position in the source.
+
+        Returns:
+            pickle.Unpickler: Unpickler reading from the source.
+
+        """
+        if ((self._unpickler is None) or (self._unpickler[0] is not source)
+                or (self._unpickler[1] != pos)):
+            self._unpickler = [source, pos, backwards.pickle.Unpickler(source)]
+        return self._unpickler[2]
+
+    def _read_frame(self):
+        r"""Read the first frame from the current position in the file by
+        loading the next pickled object with an unpickler that streams from
+        the file. The loaded object is passed to the serializer so that the
+        frame is not unpickled a second time when it is deserialized.
+
+        Returns:
+            bytes: First frame. If a frame could not be located, an empty
+                string is returned.
+
+        """
+        prev_pos = self.fd.tell()
+        if self.use_mmap:
+            source = self._get_mmap()
+            if prev_pos >= len(source):
+                return self.empty_bytes_msg
+            source.seek(prev_pos)
+        else:
+            source = self.fd
+        unpickler = self._get_unpickler(source, prev_pos)
+        try:
+            obj = unpickler.load()
+        except (EOFError, backwards.pickle.UnpicklingError, ValueError,
+                IndexError):
+            # Raised when the frame is incomplete
+            self._unpickler = None
+            self.fd.seek(prev_pos)
+            return self.empty_bytes_msg
+        end = source.tell()
+        self._unpickler[1] = end
+        if self.use_mmap:
+            frame = source[prev_pos:end]
+        else:
+            self.fd.seek(prev_pos)
+            frame = self.fd.read(end - prev_pos)
+        self.fd.seek(end)
+        self.serializer.cache_frame(frame, obj)
+        return frame
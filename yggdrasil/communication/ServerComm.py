@@ -18,6 +18,8 @@ class ServerComm(CommBase.CommBase):
         response_kwargs (dict): Keyword arguments for the response comm.
         icomm (Comm): Request comm.
         ocomm (Comm): Response comm for last request.
+        response_comms (dict): Response comms for clients that reuse the
+            same response address for every request, keyed by address.
 
     """
 
@@ -35,6 +37,8 @@ class ServerComm(CommBase.CommBase):
         self.response_kwargs = response_kwargs
         self.icomm = get_comm(icomm_name, **icomm_kwargs)
         self.ocomm = None
+        self.response_comms = dict()
+        self._request_id = None
         self.response_kwargs.setdefault('comm', self.icomm.comm_class)
         self.response_kwargs.setdefault('recv_timeout', self.icomm.recv_timeout)
         self.response_kwargs.setdefault('language', self.icomm.language)
@@ -127,6 +131,8 @@ class ServerComm(CommBase.CommBase):
             self.ocomm.close()
         for ocomm in self._used_response_comms.values():
             ocomm.close()
+        for ocomm in self.response_comms.values():
+            ocomm.close()
         super(ServerComm, self).close(*args, **kwargs)
 
     @property
@@ -151,21 +157,44 @@ class ServerComm(CommBase.CommBase):
 
     # RESPONSE COMM
     def create_response_comm(self):
-        r"""Create a response comm based on information from the last header."""
+        r"""Create a response comm based on information from the last header.
+        If the client uses the same response address for every request, the
+        response comm is reused for subsequent requests from that client."""
         if not isinstance(self.icomm._last_header, dict):  # pragma: debug
             raise RuntimeError("No header received with last message.")
         elif 'response_address' not in self.icomm._last_header:  # pragma: debug
             raise RuntimeError("Last header does not contain response address.")
-        comm_kwargs = dict(address=self.icomm._last_header['response_address'],
+        header = self.icomm._last_header
+        address = header['response_address']
+        self._request_id = header.get('request_id', None)
+        if header.get('persistent_response', False):
+            if address not in self.response_comms:
+                comm_kwargs = dict(address=address, direction='send',
+                                   is_response_server=True,
+                                   skip_component_schema_normalization=True,
+                                   **self.response_kwargs)
+                self.response_comms[address] = get_comm(
+                    '%s.server_response_comm.%d' % (
+                        self.name, len(self.response_comms)),
+                    **comm_kwargs)
+            self.ocomm = self.response_comms[address]
+            return
+        comm_kwargs = dict(address=address,
                            direction='send', is_response_server=True,
-                           single_use=True, **self.response_kwargs)
+                           single_use=True,
+                           skip_component_schema_normalization=True,
+                           **self.response_kwargs)
         self.ocomm = get_comm(self.name + '.server_response_comm',
                               **comm_kwargs)
 
     def remove_response_comm(self):
         r"""Remove response comm."""
         self.icomm._last_header = None
+        self._request_id = None
         # self.ocomm.close_on_empty(no_wait=True)
+        if not self.ocomm.single_use:
+            self.ocomm = None
+            return
         self._used_response_comms[self.ocomm.name] = self.ocomm
         self.ocomm = None
 
@@ -186,10 +215,30 @@ class ServerComm(CommBase.CommBase):
         #     return False
         if self.ocomm is None:  # pragma: debug
             raise RuntimeError("There is no registered response comm.")
+        if self._request_id is not None:
+            kwargs.setdefault('header_kwargs', {})
+            kwargs['header_kwargs'].setdefault('request_id', self._request_id)
         out = self.ocomm.send(*args, **kwargs)
         self.remove_response_comm()
         return out
 
+    def send_batch(self, msgs, **kwargs):
+        r"""Send a set of messages. Each message is sent separately so
+        that every response is paired with its own response comm.
+
+        Args:
+            msgs (list): Messages to send.
+            **kwargs: Keyword arguments are passed to send.
+
+        Returns:
+            bool: Success or failure of sending the messages.
+
+        """
+        for x in msgs:
+            if not self.send(x, **kwargs):
+                return False
+        return True
+
     # RECV METHODS
     def recv(self, *args, **kwargs):
         r"""Receive a message from the input comm and open a new response comm
@@ -0,0 +1,479 @@
+import os
+import mmap
+import uuid
+import errno
+import select
+import struct
+import logging
+import tempfile
+import threading
+from yggdrasil import platform
+from yggdrasil.communication import CommBase, AsyncComm
+logger = logging.getLogger(__name__)
+try:
+    import fcntl
+    _shm_installed = (platform._is_linux or platform._is_mac)
+except ImportError:  # pragma: windows
+    logger.debug("Could not import fcntl. "
+                 + "Shared memory support will be disabled.")
+    fcntl = None
+    _shm_installed = False
+if os.path.isdir('/dev/shm'):
+    _shm_dir = '/dev/shm'
+else:  # pragma: no cover
+    _shm_dir = tempfile.gettempdir()
+_shm_prefix = 'ygg_shm_'
+_shm_header = struct.Struct('<5Q')
+_shm_header_size = 64
+_shm_length = struct.Struct('<Q')
+
+
+class ShmRingBuffer(object):
+    r"""Ring buffer of length-prefixed messages in a memory mapped file.
+    The header contains the capacity of the buffer, the total number of
+    bytes written and read, and the total number of messages written and
+    read. Access is serialized between processes by locking the file and
+    between threads by a lock. Receivers are notified of new messages via
+    a named pipe that senders write a single byte to.
+
+    Args:
+        name (str, optional): Name of an existing buffer that should be
+            opened. Defaults to None and a new buffer is created.
+        size (int, optional): Capacity (in bytes) of a new buffer. Defaults
+            to ShmComm._bufferSize. Ignored if name is provided.
+
+    Attributes:
+        name (str): Name of the buffer.
+        path (str): Path to the file backing the buffer.
+        capacity (int): Number of bytes that can be stored in the buffer.
+
+    """
+
+    def __init__(self, name=None, size=None):
+        create = (name is None)
+        if create:
+            name = _shm_prefix + uuid.uuid4().hex
+        if size is None:
+            size = ShmComm._bufferSize
+        self.name = name
+        self.path = os.path.join(_shm_dir, name)
+        self.lock = threading.RLock()
+        self.fd = None
+        self.sigfd = None
+        self.mm = None
+        try:
+            if create:
+                self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_EXCL,
+                                  0o600)
+                os.ftruncate(self.fd, _shm_header_size + size)
+                os.mkfifo(self.sigpath, 0o600)
+            else:
+                self.fd = os.open(self.path, os.O_RDWR)
+            self.mm = mmap.mmap(self.fd, os.fstat(self.fd).st_size)
+            if create:
+                _shm_header.pack_into(self.mm, 0, size, 0, 0, 0, 0)
+            self.sigfd = os.open(self.sigpath, os.O_RDWR | os.O_NONBLOCK)
+        except BaseException:
+            self.close()
+            if create:
+                self.remove()
+            raise
+        self.capacity = _shm_header.unpack_from(self.mm, 0)[0]
+
+    @property
+    def sigpath(self):
+        r"""str: Path to the named pipe used to signal new messages."""
+        return self.path + '.sig'
+
+    @property
+    def closed(self):
+        r"""bool: True if the buffer has been closed."""
+        return (self.mm is None)
+
+    def close(self):
+        r"""Close the mapping and file descriptors for this process."""
+        with self.lock:
+            if self.mm is not None:
+                self.mm.close()
+                self.mm = None
+            for k in ['fd', 'sigfd']:
+                if getattr(self, k) is not None:
+                    os.close(getattr(self, k))
+                    setattr(self, k, None)
+
+    def remove(self):
+        r"""Remove the files backing the buffer. Processes that already have
+        the buffer open can continue to use it until they close it."""
+        for x in [self.path, self.sigpath]:
+            try:
+                os.remove(x)
+            except OSError as e:  # pragma: debug
+                if e.errno != errno.ENOENT:
+                    raise
+
+    def _acquire(self):
+        self.lock.acquire()
+        if self.mm is None:
+            self.lock.release()
+            raise ValueError("Shared memory buffer is closed.")
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+
+    def _release(self):
+        fcntl.flock(self.fd, fcntl.LOCK_UN)
+        self.lock.release()
+
+    def _write(self, pos, data):
+        off = pos % self.capacity
+        first = min(len(data), self.capacity - off)
+        start = _shm_header_size + off
+        self.mm[start:(start + first)] = data[:first]
+        if first < len(data):
+            rest = len(data) - first
+            self.mm[_shm_header_size:(_shm_header_size + rest)] = data[first:]
+
+    def _read(self, pos, size):
+        off = pos % self.capacity
+        first = min(size, self.capacity - off)
+        start = _shm_header_size + off
+        out = self.mm[start:(start + first)]
+        if first < size:
+            rest = size - first
+            out += self.mm[_shm_header_size:(_shm_header_size + rest)]
+        return out
+
+    @property
+    def n_msg(self):
+        r"""int: Number of messages in the buffer."""
+        self._acquire()
+        try:
+            nput, nget = _shm_header.unpack_from(self.mm, 0)[3:]
+        finally:
+            self._release()
+        return nput - nget
+
+    def put(self, payload):
+        r"""Add a message to the buffer.
+
+        Args:
+            payload (bytes): Message to add.
+
+        Returns:
+            bool: True if the message was added, False if there is not
+                currently enough space in the buffer.
+
+        Raises:
+            ValueError: If the message is larger than the buffer.
+
+        """
+        size = _shm_length.size + len(payload)
+        if size > self.capacity:
+            raise ValueError(("Message of %d bytes exceeds the capacity of "
+                              + "the shared memory buffer (%d bytes).")
+                             % (len(payload), self.capacity))
+        self._acquire()
+        try:
+            _, head, tail, nput, nget = _shm_header.unpack_from(self.mm, 0)
+            if (self.capacity - (head - tail)) < size:
+                return False
+            self._write(head, _shm_length.pack(len(payload)))
+            self._write(head + _shm_length.size, memoryview(payload))
+            _shm_header.pack_into(self.mm, 0, self.capacity, head + size,
+                                  tail, nput + 1, nget)
+            self.notify()
+        finally:
+            self._release()
+        return True
+
+    def get(self):
+        r"""Remove the next message from the buffer.
+
+        Returns:
+            bytes: Message or None if there are not any messages.
+
+        """
+        self._acquire()
+        try:
+            _, head, tail, nput, nget = _shm_header.unpack_from(self.mm, 0)
+            if nput == nget:
+                return None
+            size = _shm_length.unpack(self._read(tail, _shm_length.size))[0]
+            out = self._read(tail + _shm_length.size, size)
+            _shm_header.pack_into(self.mm, 0, self.capacity, head,
+                                  tail + _shm_length.size + size,
+                                  nput, nget + 1)
+        finally:
+            self._release()
+        return out
+
+    def notify(self):
+        r"""Signal receivers that there is a message in the buffer."""
+        try:
+            os.write(self.sigfd, b'\x00')
+        except OSError as e:  # pragma: debug
+            # The pipe being full means receivers have yet to drain it and
+            # will still wake.
+            if getattr(e, 'errno', None) != errno.EAGAIN:
+                raise
+
+    def wait(self, timeout):
+        r"""Wait for a signal that a message was added to the buffer.
+
+        Args:
+            timeout (float): Maximum time (in seconds) that should be waited.
+
+        """
+        sigfd = self.sigfd
+        if sigfd is None:  # pragma: debug
+            return
+        try:
+            ready = select.select([sigfd], [], [], timeout)[0]
+            if ready:
+                os.read(sigfd, 4096)
+        except (OSError, ValueError, select.error) as e:  # pragma: debug
+            # The pipe was drained by another thread or closed
+            if getattr(e, 'errno', errno.EAGAIN) not in [errno.EAGAIN,
+                                                         errno.EBADF]:
+                raise
+
+
+def get_segment(name=None):
+    r"""Create or open a shared memory ring buffer and register it.
+
+    Args:
+        name (str, optional): If provided, name of an existing buffer that
+            should be opened. Defaults to None and a new buffer is created.
+
+    Returns:
+        :class:`ShmRingBuffer`: Ring buffer.
+
+    """
+    if _shm_installed:
+        out = ShmRingBuffer(name)
+        CommBase.register_comm('ShmComm', out.name, out)
+        return out
+    else:  # pragma: windows
+        logger.warning("Shared memory not installed. Buffer cannot be returned.")
+        return None
+
+
+def remove_segment(segment):
+    r"""Remove a shared memory ring buffer and unregister it.
+
+    Args:
+        segment (:class:`ShmRingBuffer`): Ring buffer.
+
+    Raises:
+        KeyError: If the provided buffer is not registered.
+
+    """
+    if not CommBase.is_registered('ShmComm', segment.name):
+        raise KeyError("Segment not registered.")
+    CommBase.unregister_comm('ShmComm', segment.name)
+
+
+class ShmServer(CommBase.CommServer):
+    r"""Shared memory server object for cleaning up server buffer."""
+
+    def terminate(self, *args, **kwargs):
+        CommBase.unregister_comm('ShmComm', self.srv_address)
+        super(ShmServer, self).terminate(*args, **kwargs)
+
+
+class ShmComm(AsyncComm.AsyncComm):
+    r"""Class for handling I/O via a ring buffer in shared memory between
+    processes on the same host.
+
+    Attributes:
+        q (:class:`ShmRingBuffer`): Ring buffer.
+
+    Developer Notes:
+        Messages are copied into the buffer by the sender and out of the
+        buffer by the receiver. The buffer is backed by a file in /dev/shm
+        (or the temporary directory if /dev/shm does not exist) so that it
+        can be opened by name from any process on the host. Removing the
+        buffer only removes the files; processes that already opened the
+        buffer can continue to receive any messages remaining in it.
+
+    """
+
+    _commtype = 'shm'
+    _schema_subtype_description = ('Ring buffer in shared memory for '
+                                   'processes on the same host.')
+    _maxMsgSize = 2**20
+    _bufferSize = 2**22
+    address_description = ("The name of a shared memory buffer.")
+
+    def _init_before_open(self, **kwargs):
+        r"""Initialize empty buffer and server class."""
+        self.q = None
+        self._server_class = ShmServer
+        super(ShmComm, self)._init_before_open(**kwargs)
+
+    @classmethod
+    def underlying_comm_class(self):
+        r"""str: Name of underlying communication class."""
+        return 'ShmComm'
+
+    @classmethod
+    def close_registry_entry(cls, value):
+        r"""Close a registry entry."""
+        value.remove()
+        return True
+
+    @classmethod
+    def new_comm_kwargs(cls, *args, **kwargs):
+        r"""Initialize communication with new buffer."""
+        if 'address' not in kwargs:
+            kwargs.setdefault('address', 'generate')
+        return args, kwargs
+
+    def bind(self):
+        r"""Bind to a new buffer if address is generate."""
+        if not self._bound:
+            if self.address == 'generate':
+                self._bound = True
+                self.q = get_segment()
+                self.address = self.q.name
+        super(ShmComm, self).bind()
+
+    def open_after_bind(self):
+        r"""Open the connection by getting the buffer from the bound address."""
+        if self.q is None:
+            self.q = get_segment(self.address)
+
+    def _open_direct(self):
+        r"""Open the buffer."""
+        if not self.is_open_direct:
+            self.bind()
+            self.open_after_bind()
+            self.debug("shm: %s", self.q.name)
+
+    def _close_direct(self, skip_remove=False):
+        r"""Close the buffer."""
+        # Remove the buffer
+        dont_close = (skip_remove or self.is_client)
+        if (self._bound or (self.q is not None)) and (not dont_close):
+            # Dont close for client because server will not be able
+            # to unregister the comm
+            self.unregister_comm(self.address, dont_close=dont_close)
+        if self.q is not None:
+            self.q.close()
+        self.q = None
+        self._bound = False
+
+    @property
+    def is_open_direct(self):
+        r"""bool: True if the buffer is open."""
+        q = self.q
+        return ((q is not None) and (not q.closed))
+
+    def confirm_send(self, noblock=False):
+        r"""Confirm that sent message was received."""
+        if noblock:
+            return True
+        return (self.n_msg_direct_send == 0)
+
+    def confirm_recv(self, noblock=False):
+        r"""Confirm that message was received."""
+        return True
+
+    @property
+    def n_msg_direct_send(self):
+        r"""int: Number of messages in the buffer to send."""
+        if self.is_open_direct:
+            try:
+                return self.q.n_msg
+            except (AttributeError, ValueError):  # pragma: debug
+                if self.is_open_direct:
+                    raise
+        return 0
+
+    @property
+    def n_msg_direct_recv(self):
+        r"""int: Number of messages in the buffer to recv."""
+        return self.n_msg_direct_send
+
+    def wait_for_direct(self, direction=None, timeout=None):
+        r"""Block until the direct comm is ready or the timeout is reached.
+        For receipt, the named pipe used to signal new messages is selected
+        on so that the call returns as soon as a message is added.
+
+        Args:
+            direction (str, optional): Direction that readiness should be
+                checked for. Defaults to self.direction.
+            timeout (float, optional): Maximum time (in seconds) that should
+                be waited. Defaults to self.sleeptime.
+
+        Returns:
+            bool: True if the direct comm is ready, False otherwise.
+
+        """
+        if direction is None:
+            direction = self.direction
+        if timeout is None:
+            timeout = self.sleeptime
+        q = self.q
+        if (direction != 'recv') or (q is None):
+            return super(ShmComm, self).wait_for_direct(direction=direction,
+                                                        timeout=timeout)
+        if self.n_msg_direct_recv > 0:
+            return True
+        q.wait(timeout)
+        return (self.n_msg_direct_recv > 0)
+
+    def _send_direct(self, payload):
+        r"""Send a message to the comm directly.
+
+        Args:
+            payload (str): Message to send.
+
+        Returns:
+            bool: Success or failure of sending the message.
+
+        """
+        if not self.is_open_direct:  # pragma: debug
+            return False
+        try:
+            self.debug('Sending %d bytes', len(payload))
+            flag = self.q.put(payload)
+        except (AttributeError, ValueError):  # pragma: debug
+            if self.is_closed:
+                self.debug("Comm closed")
+                return False
+            raise
+        if not flag:  # pragma: debug
+            self.debug("Shared memory buffer full")
+            raise AsyncComm.AsyncTryAgain
+        self.debug('Sent %d bytes', len(payload))
+        return True
+
+    def _recv_direct(self):
+        r"""Receive a message from the comm directly.
+
+        Returns:
+            tuple (bool, str): The success or failure of receiving a message
+                and the message received.
+
+        """
+        self.debug("Message ready, reading it.")
+        try:
+            data = self.q.get()
+        except (AttributeError, ValueError):  # pragma: debug
+            if self.is_closed:
+                self.debug("Buffer closed")
+                return (False, self.empty_bytes_msg)
+            raise
+        if data is None:  # pragma: debug
+            return (True, self.empty_bytes_msg)
+        self.debug("Received %d bytes", len(data))
+        return (True, data)
+
+    def purge(self):
+        r"""Purge all messages from the comm."""
+        super(ShmComm, self).purge()
+        try:
+            while self.n_msg_direct > 0:  # pragma: debug
+                self.q.get()
+        except (AttributeError, ValueError):  # pragma: debug
+            if self.is_open_direct:
+                raise
@@ -17,7 +17,6 @@ _socket_type_pairs = [('PUSH', 'PULL'),
 _socket_send_types = [t[0] for t in _socket_type_pairs]
 _socket_recv_types = [t[1] for t in _socket_type_pairs]
 _socket_protocols = ['tcp', 'inproc', 'ipc', 'udp', 'pgm', 'epgm']
-_flag_zmq_filter = b'_ZMQFILTER_'
 _default_socket_type = 4
 _default_protocol = 'tcp'
 _wait_send_t = 0  # 0.0001
@@ -229,18 +228,22 @@ class ZMQProxy(CommBase.CommServer):
         r"""Receive single message from the client."""
         with self.lock:
             if not self.was_break:
-                return self.cli_socket.recv_multipart()
+                return self.cli_socket.recv_multipart(copy=False)
             else:  # pragma: debug
                 return None
 
     def server_send(self, msg):
-        r"""Send single message to the server."""
+        r"""Send single message to the server.
+
+        Args:
+            msg (list): Frames that should be forwarded to the server.
+
+        """
         if msg is None:  # pragma: debug
             return
         while not self.was_break:
             try:
-                self.srv_socket.send(msg, zmq.NOBLOCK)
-                # self.srv_socket.send_multipart(msg, zmq.NOBLOCK)
+                self.srv_socket.send_multipart(msg, zmq.NOBLOCK, copy=False)
                 break
             except zmq.ZMQError:
                 self.sleep(0.0001)
@@ -260,8 +263,9 @@ class ZMQProxy(CommBase.CommServer):
             message = self.client_recv()
             if message is not None:
                 self.debug('Forwarding message of size %d from %s',
-                           len(message[1]), message[0])
-                self.server_send(message[1])
+                           sum([len(m) for m in message[1:]]),
+                           message[0].bytes)
+                self.server_send(message[1:])
 
     def after_loop(self):
         r"""Close sockets after the loop finishes."""
@@ -681,7 +685,7 @@ class ZMQComm(AsyncComm.AsyncComm):
         """
         if self.direction == 'send':
             return msg, None
-        header = self.serializer.parse_header(msg.split(_flag_zmq_filter)[-1])
+        header = self.serializer.parse_header(msg)
         address = header.get('zmq_reply', None)
         if (address is None):
             address = self.reply_socket_address
@@ -819,11 +823,13 @@ class ZMQComm(AsyncComm.AsyncComm):
         with self.socket_lock:
             return (self._openned and not self.socket.closed)
 
-    def is_message(self, flags):
+    def is_message(self, flags, timeout=1):
         r"""Poll the socket for a message.
 
         Args:
             flags (int): ZMQ poll flags.
+            timeout (int, optional): Time (in milliseconds) that the socket
+                should be polled for. Defaults to 1.
 
         Returns:
             bool: True if there is a message matching the flags, False otherwise.
@@ -834,12 +840,45 @@ class ZMQComm(AsyncComm.AsyncComm):
         with self.socket_lock:
             if self.is_open_direct:
                 try:
-                    out = self.socket.poll(timeout=1, flags=flags)
+                    out = self.socket.poll(timeout=timeout, flags=flags)
                 except zmq.ZMQError:  # pragma: debug
                     # self.exception('Error polling')
                     pass
         return bool(out)
         
+    def wait_for_direct(self, direction=None, timeout=None):
+        r"""Block until the direct comm is ready or the timeout is reached.
+        The socket is polled so that the call returns as soon as a message
+        arrives (or a reply handshake is initiated for sent messages).
+
+        Args:
+            direction (str, optional): Direction that readiness should be
+                checked for. Defaults to self.direction.
+            timeout (float, optional): Maximum time (in seconds) that should
+                be waited. Defaults to self.sleeptime.
+
+        Returns:
+            bool: True if the direct comm is ready, False otherwise.
+
+        """
+        if direction is None:
+            direction = self.direction
+        if timeout is None:
+            timeout = self.sleeptime
+        timeout_ms = max(1, int(1000.0 * timeout))
+        if direction == 'recv':
+            if self.is_open_direct:
+                return self.is_message(zmq.POLLIN, timeout=timeout_ms)
+        elif ((self.reply_socket_send is not None)
+              and (not self.reply_socket_send.closed)):
+            try:
+                return bool(self.reply_socket_send.poll(
+                    timeout=timeout_ms, flags=zmq.POLLIN))
+            except zmq.ZMQError:  # pragma: debug
+                pass
+        self.sleep(timeout)
+        return False
+
     @property
     def n_msg_direct_recv(self):
         r"""int: Number of messages currently being routed from recv."""
@@ -991,23 +1030,25 @@ class ZMQComm(AsyncComm.AsyncComm):
             return False
         if identity is None:
             identity = self.dealer_identity
-        topic = backwards.as_bytes(topic)
-        identity = backwards.as_bytes(identity)
-        if self.socket_type_name == 'PUB':
-            total_msg = topic + _flag_zmq_filter + msg
-        else:
-            total_msg = msg
-        total_msg = self.check_reply_socket_send(total_msg)
+        # Routing information is sent in separate frames ahead of the
+        # message so that the message body is never copied into a new
+        # buffer and can be sent without copying it into ZeroMQ
+        frames = []
+        if self.socket_type_name == 'ROUTER':
+            frames.append(backwards.as_bytes(identity))
+        elif self.socket_type_name == 'PUB':
+            frames.append(backwards.as_bytes(topic))
+        total_msg = self.check_reply_socket_send(msg)
+        frames.append(total_msg)
         kwargs.setdefault('flags', zmq.NOBLOCK)
+        kwargs.setdefault('copy', False)
         with self.socket_lock:
             try:
                 if self.socket.closed:  # pragma: debug
                     self.error("Socket closed")
                     return False
                 self.special_debug("Sending %d bytes to %s", len(total_msg), self.address)
-                if self.socket_type_name == 'ROUTER':
-                    self.socket.send(identity, zmq.SNDMORE)
-                self.socket.send(total_msg, **kwargs)
+                self.socket.send_multipart(frames, **kwargs)
                 self.special_debug("Sent %d bytes to %s", len(total_msg), self.address)
                 self._n_zmq_sent += 1
             except zmq.ZMQError as e:  # pragma: debug
@@ -1050,22 +1091,27 @@ class ZMQComm(AsyncComm.AsyncComm):
                 if self.socket.closed:  # pragma: debug
                     self.error("Socket closed")
                     return (False, self.empty_bytes_msg)
-                if self.socket_type_name == 'ROUTER':
-                    identity = self.socket.recv(flags)
-                    self._recv_identities.add(identity)
                 kwargs.setdefault('flags', flags)
-                total_msg = self.socket.recv(**kwargs)
+                kwargs.setdefault('copy', False)
+                frames = self.socket.recv_multipart(**kwargs)
             except zmq.ZMQError:  # pragma: debug
                 self.exception("Error receiving")
                 return (False, self.empty_bytes_msg)
+        # Strip routing frames
+        if self.socket_type_name == 'ROUTER':
+            identity = frames.pop(0).bytes
+            self._recv_identities.add(identity)
+        elif self.socket_type_name == 'SUB':
+            topic = frames.pop(0).bytes
+            assert(topic == self.topic_filter)
+        # Messages are copied out of ZeroMQ exactly once
+        if len(frames) == 1:
+            total_msg = frames[0].bytes
+        else:  # pragma: debug
+            total_msg = backwards.as_bytes('').join([f.buffer for f in frames])
         self.debug("Recv %d bytes from %s", len(total_msg), self.address)
         # Interpret headers
-        total_msg, k = self.check_reply_socket_recv(total_msg)
-        if self.socket_type_name == 'SUB':
-            topic, msg = total_msg.split(_flag_zmq_filter)
-            assert(topic == self.topic_filter)
-        else:
-            msg = total_msg
+        msg, k = self.check_reply_socket_recv(total_msg)
         # Confirm receipt
         if k is not None:
             self._n_zmq_recv[k] += 1
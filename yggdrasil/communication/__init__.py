@@ -1,4 +1,5 @@
 from yggdrasil.components import import_component
+_non_component_modules = ['tracing.py']
 
 
 def determine_suffix(no_suffix=False, reverse_names=False,
@@ -1,5 +1,6 @@
 import numpy as np
 from yggdrasil import units, backwards
+from yggdrasil.tools import is_vectorizable_batch, iter_batch
 from yggdrasil.components import ComponentBase
 
 
@@ -35,6 +36,54 @@ class FilterBase(ComponentBase):
         """
         raise NotImplementedError
 
+    def evaluate_filter_batch(self, x):
+        r"""Call filter on an entire batch of messages at once.
+
+        Args:
+            x (np.ndarray, pandas.DataFrame): Batch of messages where each
+                element/row is a message.
+
+        Returns:
+            np.ndarray: Boolean array with one element for each message in the
+                batch, True if the message will pass through the filter, False
+                otherwise.
+
+        Raises:
+            NotImplementedError: If the filter cannot be applied to a batch
+                all at once.
+
+        """
+        raise NotImplementedError
+
+    def filter_batch(self, x):
+        r"""Call filter on a batch of messages. If the batch is an array or
+        data frame and the filter implements evaluate_filter_batch (e.g. a
+        statement filter with vectorize set), the filter is applied to the
+        entire batch at once using NumPy semantics. Otherwise, the filter is
+        applied to each message in turn.
+
+        Args:
+            x (list, np.ndarray, pandas.DataFrame): Batch of messages. For
+                arrays and data frames, each element/row along the first axis
+                is a message.
+
+        Returns:
+            np.ndarray: Boolean array with one element for each message in the
+                batch, True if the message will pass through the filter, False
+                otherwise.
+
+        """
+        if is_vectorizable_batch(x):
+            try:
+                out = np.asarray(self.evaluate_filter_batch(x))
+            except (NotImplementedError, ValueError, TypeError,
+                    KeyError, IndexError):
+                out = None
+            if ((isinstance(out, np.ndarray) and (out.dtype == bool)
+                 and (out.shape == (len(x), )))):
+                return out
+        return np.array([self(ix) for ix in iter_batch(x)], dtype=bool)
+
     def __call__(self, x):
         r"""Call filter on the provided message.
 
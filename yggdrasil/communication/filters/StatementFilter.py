@@ -1,6 +1,7 @@
 import numpy as np
+import pandas as pd
 from yggdrasil import units
-from yggdrasil.tools import safe_eval
+from yggdrasil.tools import safe_eval, compile_statement
 from yggdrasil.communication.filters.FilterBase import FilterBase
 
 
@@ -14,19 +15,28 @@ class StatementFilter(FilterBase):
             should only use a limited set of builtins and the math library (See
             yggdrasil.tools.safe_eval). If more complex relationships are required,
             use the FunctionFilter class.
+        vectorize (bool, optional): If True, the statement is evaluated for
+            an entire batch of messages at once when a batch that is an array
+            or data frame is passed to filter_batch. This should only be set
+            if the statement is applied element-wise (i.e. it does not reduce
+            over or broadcast against the message). Defaults to False and the
+            statement is evaluated for each message in turn.
 
     Attributes:
         statement (str): Python statement that will be evaluated to determine if
             messages should or should not pass the filter.
+        code (code): Compiled version of statement.
 
     """
     _filtertype = 'statement'
     _schema_required = ['statement']
-    _schema_properties = {'statement': {'type': 'string'}}
+    _schema_properties = {'statement': {'type': 'string'},
+                          'vectorize': {'type': 'boolean', 'default': False}}
 
     def __init__(self, *args, **kwargs):
         super(StatementFilter, self).__init__(*args, **kwargs)
         self.statement = self.statement.replace('%x%', 'x')
+        self.code = compile_statement(self.statement)
 
     def evaluate_filter(self, x):
         r"""Call filter on the provided message.
@@ -38,7 +48,27 @@ class StatementFilter(FilterBase):
             bool: True if the message will pass through the filter, False otherwise.
 
         """
-        return safe_eval(self.statement, x=x)
+        return safe_eval(self.code, x=x)
+
+    def evaluate_filter_batch(self, x):
+        r"""Call filter on an entire batch of messages at once.
+
+        Args:
+            x (np.ndarray, pandas.DataFrame): Batch of messages where each
+                element/row is a message.
+
+        Returns:
+            np.ndarray: Boolean array with one element for each message in the
+                batch, True if the message will pass through the filter, False
+                otherwise.
+
+        Raises:
+            NotImplementedError: If vectorize is False.
+
+        """
+        if not self.vectorize:
+            raise NotImplementedError("Statement is not vectorized.")
+        return safe_eval(self.code, x=x)
 
     @classmethod
     def get_testing_options(cls):
@@ -49,10 +79,29 @@ class StatementFilter(FilterBase):
                 pass/fail for those keywords.
         
         """
-        out = [{'kwargs': {'statement': '%x% != 2'},
-                'pass': [1, 3], 'fail': [2]},
+        out = [{'kwargs': {'statement': '%x% != 2', 'vectorize': True},
+                'pass': [1, 3], 'fail': [2],
+                'batch': [(np.array([1, 2, 3]),
+                           np.array([True, False, True]))]},
+               {'kwargs': {'statement': '%x% == max(array([%x%]).flatten())'},
+                'pass': [1, 3], 'fail': [],
+                'batch': [(np.array([1, 2, 3]),
+                           np.array([True, True, True]))]},
                {'kwargs': {'statement': '%x% != array([0, 0, 0])'},
-                'pass': [np.ones(3, int)], 'fail': [np.zeros(3, int)]}]
+                'pass': [np.ones(3, int)], 'fail': [np.zeros(3, int)],
+                'batch': [(np.array([np.ones(3, int), np.zeros(3, int)]),
+                           np.array([True, False]))]},
+               {'kwargs': {'statement': '%x% != array([0, 1, 2])'},
+                'pass': [3], 'fail': [0],
+                'batch': [(np.array([0, 0, 0]),
+                           np.array([False, False, False]))]},
+               {'kwargs': {'statement': "%x%['a'] > 1", 'vectorize': True},
+                'pass': [{'a': 2}], 'fail': [{'a': 1}],
+                'batch': [(np.array([(1, 'a'), (2, 'b')],
+                                    dtype=[('a', 'i4'), ('b', 'S1')]),
+                           np.array([False, True])),
+                          (pd.DataFrame({'a': [2, 1, 3]}),
+                           np.array([True, False, True]))]}]
         if units._use_unyt:
             out.append({'kwargs': {'statement': '%x% != '
                                    + repr(units.add_units(1, 'cm'))},
@@ -1,3 +1,4 @@
+import numpy as np
 from yggdrasil.tests import YggTestClass
 
 
@@ -36,3 +37,14 @@ class TestFilterBase(YggTestClass):
                 self.assert_equal(inst(msg), False)
             for msg, err in x.get('error', []):
                 self.assert_raises(err, inst, msg)
+
+    def test_filter_batch(self):
+        r"""Test filter_batch."""
+        for x in self.get_options():
+            inst = self.import_cls(**x.get('kwargs', {}))
+            msgs = x.get('pass', []) + x.get('fail', [])
+            mask = np.array([True for _ in x.get('pass', [])]
+                            + [False for _ in x.get('fail', [])], dtype=bool)
+            np.testing.assert_array_equal(inst.filter_batch(msgs), mask)
+            for msgs, mask in x.get('batch', []):
+                np.testing.assert_array_equal(inst.filter_batch(msgs), mask)
@@ -26,3 +26,52 @@ class TestAsyncComm(test_CommBase.TestCommBase):
         self.recv_instance.stop_backlog()
         self.do_send_recv(send_kwargs={'no_confirm': True},
                           recv_kwargs={'no_confirm': True})
+
+    def test_wait_for_recv(self):
+        r"""Test waiting for a message to be available for receipt."""
+        if self.comm in ['CommBase', 'AsyncComm']:
+            return
+        assert(not self.recv_instance.wait_for_recv(timeout=self.sleeptime))
+        flag = self.send_instance.send(self.test_msg)
+        assert(flag)
+        assert(self.recv_instance.wait_for_recv(timeout=self.timeout))
+        flag, msg_recv = self.recv_instance.recv(timeout=self.timeout)
+        assert(flag)
+        self.assert_equal(msg_recv, self.test_msg)
+
+    def test_backlog_limits(self):
+        r"""Test high/low water marks on the send and recv backlogs."""
+        if self.comm in ['CommBase', 'AsyncComm']:
+            return
+        for inst, direction in [(self.send_instance, 'send'),
+                                (self.recv_instance, 'recv')]:
+            add = getattr(inst, 'add_backlog_%s' % direction)
+            pop = getattr(inst, 'pop_backlog_%s' % direction)
+            space = getattr(inst, 'backlog_%s_space' % direction)
+            inst.backlog_max_count = 4
+            inst.backlog_max_bytes = 6
+            inst.backlog_low_water = 0.5
+            inst.backlog_timeout = self.sleeptime
+            # Hold the lock so that the backlog thread cannot drain messages
+            with inst.backlog_thread.lock:
+                add(b'ab')
+                add(b'ab')
+                assert(space.is_set())
+                add(b'ab')
+                assert(not space.is_set())
+                assert(not inst.wait_for_backlog_space(direction=direction))
+                if direction == 'send':
+                    assert(not inst._send(b'ab'))
+                pop()
+                assert(not space.is_set())
+                pop()
+                assert(space.is_set())
+                assert(inst.wait_for_backlog_space(direction=direction))
+                pop()
+                # Count limit
+                inst.backlog_max_bytes = 0
+                for i in range(4):
+                    add(b'ab')
+                assert(not space.is_set())
+                inst.purge()
+                assert(space.is_set())
@@ -586,6 +586,44 @@ class TestCommBase(YggTestClassInfo):
         self.do_send_recv('send_nolimit', 'recv_nolimit', self.msg_long,
                           print_status=True)
 
+    def test_send_recv_batch(self, nrecv=1):
+        r"""Test send/recv of a batch of messages."""
+        if self.comm in ['CommBase', 'AsyncComm']:
+            return
+        msg_send = [self.test_msg for _ in range(3)]
+        flag = self.send_instance.send_batch(msg_send)
+        assert(flag)
+        flag, msg = self.recv_instance.recv(timeout=self.timeout)
+        assert(flag)
+        msg_recv = [msg]
+        # Messages remaining from the batch are counted as waiting
+        nbatch = self.recv_instance.n_msg_batch_recv
+        if not (self.send_instance.is_file or self.send_instance.is_client
+                or self.recv_instance.is_server):
+            self.assert_equal(nbatch, len(msg_send) - 1)
+        assert(self.recv_instance.n_msg_recv >= nbatch)
+        assert(self.recv_instance.n_msg_recv_drain >= nbatch)
+        T = self.recv_instance.start_timeout(self.timeout)
+        while (not T.is_out) and (len(msg_recv) < nrecv * len(msg_send)):
+            flag, msgs = self.recv_instance.recv_batch(timeout=self.timeout)
+            assert(flag)
+            msg_recv += msgs
+        self.recv_instance.stop_timeout()
+        self.assert_equal(msg_recv, nrecv * msg_send)
+
+    def test_chunk_message(self):
+        r"""Test splitting a message into chunks no larger than maxMsgSize."""
+        if self.send_instance.maxMsgSize == 0:
+            return
+        msg = backwards.as_bytes(
+            'a' * int(2.5 * self.send_instance.maxMsgSize))
+        chunks = list(self.send_instance.chunk_message(msg))
+        assert_equal(len(chunks), 3)
+        for x in chunks:
+            assert(isinstance(x, backwards.bytes_type))
+            assert(len(x) <= self.send_instance.maxMsgSize)
+        assert_equal(backwards.as_bytes('').join(chunks), msg)
+
     def test_send_recv_array(self):
         r"""Test send/recv of a array message."""
         msg_send = getattr(self, 'test_msg_array', None)
@@ -40,6 +40,30 @@ def test_wait_for_creation():
     recv_instance.remove_file()
 
 
+def test_read_chunk_size():
+    r"""Test receiving a file in chunks."""
+    msg_send = b'Test message\n' * 10
+    name = 'temp_file_chunks.txt'
+    kwargs = {'in_temp': True, 'comm': 'FileComm'}
+    send_instance = new_comm(name, direction='send', **kwargs)
+    assert(send_instance.send(msg_send))
+    send_instance.close()
+    for use_mmap in [False, True]:
+        recv_instance = new_comm(name, direction='recv', read_chunk_size=16,
+                                 use_mmap=use_mmap, **kwargs)
+        msg_recv = []
+        while True:
+            assert(len(msg_recv) <= len(msg_send))
+            flag, msg = recv_instance.recv()
+            if not flag:
+                break
+            assert(len(msg) <= 16)
+            msg_recv.append(msg)
+        assert_equal(b''.join(msg_recv), msg_send)
+        recv_instance.close()
+    send_instance.remove_file()
+
+
 class TestFileComm(parent.TestCommBase):
     r"""Test for FileComm communication class."""
 
@@ -76,6 +100,11 @@ class TestFileComm(parent.TestCommBase):
         r"""Disabled: Test send/recv of a large message."""
         pass  # pragma: no cover
 
+    @unittest.skipIf(True, 'File comm')
+    def test_send_recv_batch(self):
+        r"""Disabled: Test send/recv of a batch of messages."""
+        pass  # pragma: no cover
+
     @unittest.skipIf(True, 'File comm')
     def test_work_comm(self):
         r"""Disabled: Test creating/removing a work comm."""
@@ -170,3 +199,14 @@ class TestFileComm_readline(TestFileComm):
         out = super(TestFileComm_readline, self).testing_options
         out['recv'] = out['send']
         return out
+
+
+class TestFileComm_mmap(TestFileComm):
+    r"""Test for FileComm communication class with use_mmap = True."""
+
+    @property
+    def inst_kwargs(self):
+        r"""dict: Keyword arguments for tested class."""
+        out = super(TestFileComm_mmap, self).inst_kwargs
+        out['use_mmap'] = True
+        return out
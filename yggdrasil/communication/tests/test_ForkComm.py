@@ -39,6 +39,23 @@ class TestForkComm(parent.TestCommBase):
         r"""Disabled: Test creating/removing a work comm."""
         pass
 
+    def test_recv_notification(self):
+        r"""Test that the fork is notified when any of its comms receive a
+        message and that messages are received from each comm in turn."""
+        assert(all(self.recv_instance._notified))
+        assert(not self.recv_instance.wait_for_recv(timeout=0))
+        msgs = [self.test_msg for x in self.send_instance.comm_list]
+        for x in reversed(self.send_instance.comm_list):
+            assert(x.send(self.test_msg))
+        assert(self.recv_instance.wait_for_recv(timeout=self.timeout))
+        for x in self.recv_instance.comm_list:
+            assert(x.wait_for_recv(timeout=self.timeout))
+        for i in range(len(msgs)):
+            flag, msg = self.recv_instance.recv(timeout=self.timeout)
+            assert(flag)
+            self.assert_equal(msg, msgs[i])
+        self.assert_equal(self.recv_instance.curr_comm_index % self.ncomm, 0)
+
     def do_send_recv(self, *args, **kwargs):
         r"""Generic send/recv of a message."""
         if ((('eof' not in kwargs.get('send_meth', 'None'))
@@ -67,6 +84,11 @@ class TestForkComm(parent.TestCommBase):
         kwargs['nrecv'] = self.ncomm
         super(TestForkComm, self).test_purge(**kwargs)
 
+    def test_send_recv_batch(self, **kwargs):
+        r"""Test send/recv of a batch of messages."""
+        kwargs['nrecv'] = self.ncomm
+        super(TestForkComm, self).test_send_recv_batch(**kwargs)
+
 
 class TestForkCommList(TestForkComm):
     r"""Tests for ForkComm communication class with construction from address."""
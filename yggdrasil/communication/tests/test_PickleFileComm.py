@@ -1,7 +1,61 @@
+from yggdrasil import backwards
+from yggdrasil.tests import assert_equal
+from yggdrasil.communication import new_comm
 from yggdrasil.communication.tests import test_FileComm as parent
 
 
+def test_read_frames():
+    r"""Test reading pickled objects one frame at a time, including a
+    frame that is incomplete."""
+    objects = [{'a': 1}, list(range(100)), b'Test message']
+    contents = b''.join(backwards.pickle.dumps(x) for x in objects)
+    name = 'temp_file_frames.pkl'
+    kwargs = {'in_temp': True, 'comm': 'PickleFileComm'}
+    send_instance = new_comm(name, direction='send', **kwargs)
+    send_instance.close()
+    with open(send_instance.address, 'wb') as fd:
+        fd.write(contents[:-2])
+    for use_mmap in [False, True]:
+        recv_instance = new_comm(name, direction='recv', use_mmap=use_mmap,
+                                 **kwargs)
+        for x in objects[:-1]:
+            assert_equal(recv_instance._read_frame(),
+                         backwards.pickle.dumps(x))
+            assert_equal(recv_instance.serializer._frame_cache[1], x)
+        pos = recv_instance.fd.tell()
+        assert_equal(recv_instance._read_frame(), b'')
+        assert_equal(recv_instance.fd.tell(), pos)
+        recv_instance.close()
+    with open(send_instance.address, 'wb') as fd:
+        fd.write(contents)
+    for use_mmap in [False, True]:
+        recv_instance = new_comm(name, direction='recv', use_mmap=use_mmap,
+                                 **kwargs)
+        for x in objects:
+            flag, msg = recv_instance.recv()
+            assert(flag)
+            assert_equal(msg, x)
+            assert_equal(recv_instance.serializer._frame_cache, None)
+        flag, msg = recv_instance.recv()
+        assert(not flag)
+        recv_instance.close()
+    send_instance.remove_file()
+
+
 class TestPickleFileComm(parent.TestFileComm):
     r"""Test for PickleFileComm communication class."""
 
     comm = 'PickleFileComm'
+
+
+class TestPickleFileComm_chunked(TestPickleFileComm):
+    r"""Test for PickleFileComm communication class with frames read in
+    small memory mapped chunks."""
+
+    @property
+    def inst_kwargs(self):
+        r"""dict: Keyword arguments for tested class."""
+        out = super(TestPickleFileComm_chunked, self).inst_kwargs
+        out['read_chunk_size'] = 8
+        out['use_mmap'] = True
+        return out
@@ -0,0 +1,82 @@
+import os
+import unittest
+import copy
+from yggdrasil.tests import assert_raises, assert_equal
+from yggdrasil.communication import new_comm
+from yggdrasil.communication import ShmComm, CommBase
+from yggdrasil.communication.tests import test_AsyncComm
+
+
+_shm_installed = ShmComm.ShmComm.is_installed(language='python')
+
+
+@unittest.skipIf(not _shm_installed, "Shared memory not installed")
+def test_segment():
+    r"""Test creation/removal of shared memory buffer."""
+    seg = ShmComm.get_segment()
+    assert(CommBase.is_registered('ShmComm', seg.name))
+    assert(os.path.isfile(seg.path))
+    CommBase.unregister_comm('ShmComm', seg.name, dont_close=True)
+    assert_raises(KeyError, ShmComm.remove_segment, seg)
+    CommBase.register_comm('ShmComm', seg.name, seg)
+    ShmComm.remove_segment(seg)
+    assert(not CommBase.is_registered('ShmComm', seg.name))
+    assert(not os.path.isfile(seg.path))
+    seg.close()
+    assert(seg.closed)
+
+
+@unittest.skipIf(not _shm_installed, "Shared memory not installed")
+def test_ring_buffer():
+    r"""Test wrapping of messages around the end of the ring buffer."""
+    seg = ShmComm.ShmRingBuffer(size=64)
+    try:
+        other = ShmComm.ShmRingBuffer(seg.name)
+        msg = b'x' * 20
+        for i in range(5):
+            imsg = msg + str(i).encode('utf-8')
+            assert(seg.put(imsg))
+            assert(seg.put(imsg))
+            assert(not seg.put(imsg))
+            assert_equal(other.n_msg, 2)
+            assert_equal(other.get(), imsg)
+            assert_equal(other.get(), imsg)
+            assert_equal(other.get(), None)
+        assert_raises(ValueError, seg.put, b'x' * 64)
+        other.close()
+        assert_raises(ValueError, other.put, msg)
+    finally:
+        seg.remove()
+        seg.close()
+
+
+@unittest.skipIf(not _shm_installed, "Shared memory not installed")
+class TestShmComm(test_AsyncComm.TestAsyncComm):
+    r"""Test for ShmComm communication class."""
+
+    comm = 'ShmComm'
+    attr_list = (copy.deepcopy(test_AsyncComm.TestAsyncComm.attr_list)
+                 + ['q'])
+
+    def test_wait_for_direct(self):
+        r"""Test waking on the signal for a new message."""
+        assert(not self.recv_instance.wait_for_recv(timeout=0.01))
+        self.send_instance.sched_task(self.sleeptime, self.send_instance.send,
+                                      args=[self.test_msg])
+        assert(self.recv_instance.wait_for_recv(timeout=self.timeout))
+        flag, msg_recv = self.recv_instance.recv(timeout=self.timeout)
+        assert(flag)
+        self.assert_equal(msg_recv, self.test_msg)
+
+
+@unittest.skipIf(_shm_installed, "Shared memory installed")
+def test_segment_not_installed():  # pragma: windows
+    r"""Test return of get_segment if shared memory is not installed."""
+    assert_equal(ShmComm.get_segment(), None)
+
+
+@unittest.skipIf(_shm_installed, "Shared memory installed")
+def test_not_running():  # pragma: windows
+    r"""Test raise of an error if shared memory is not installed."""
+    comm_kwargs = dict(comm='ShmComm', direction='send', reverse_names=True)
+    assert_raises(RuntimeError, new_comm, 'test', **comm_kwargs)
@@ -0,0 +1,101 @@
+import os
+import json
+import shutil
+import tempfile
+from yggdrasil.tests import assert_equal
+from yggdrasil.communication import new_comm, get_comm, tracing
+
+
+def test_trace_comm():
+    r"""Test recording of events for messages passed between comms."""
+    old_trace = os.environ.get('YGG_TRACE', None)
+    trace_dir = tempfile.mkdtemp()
+    os.environ['YGG_TRACE'] = trace_dir
+    tracing.reset_tracer()
+    try:
+        assert_equal(tracing.get_trace_dir(), trace_dir)
+        send_comm = new_comm('test_trace', direction='send',
+                             reverse_names=True)
+        recv_comm = get_comm('test_trace', **send_comm.opp_comm_kwargs())
+        try:
+            # The last message is large enough to be sent in parts and is
+            # sent with an existing ID as it would be by a connection
+            msgs = [b'hello', b'goodbye', b'x' * (2 * send_comm.maxMsgSize)]
+            for i, msg in enumerate(msgs):
+                if i == 2:
+                    assert(send_comm.send(
+                        msg, header_kwargs={'trace_id': 'forwarded'}))
+                else:
+                    assert(send_comm.send(msg))
+                flag, msg_recv = recv_comm.recv(timeout=10)
+                assert(flag)
+                assert_equal(msg_recv, msg)
+            # Trace IDs are not treated as serializer metadata
+            assert('trace_id' not in recv_comm.serializer.extra_kwargs)
+        finally:
+            send_comm.close()
+            recv_comm.close()
+        tracing.reset_tracer()
+        events = tracing.load_trace_events(trace_dir)
+        for x in ['serialize', 'send', 'deserialize']:
+            assert_equal(len([e for e in events if e['stage'] == x]), 3)
+        assert_equal(len(set(e['id'] for e in events)), 3)
+        assert_equal(sorted(e['stage'] for e in events
+                            if e['id'] == 'forwarded'),
+                     ['deserialize', 'recv', 'recv', 'send', 'serialize'])
+        summary = tracing.export_traces(trace_dir, nbins=2)
+        assert_equal(len(summary), 1)
+        for v in summary.values():
+            assert_equal(v['count'], 3)
+            assert_equal(sum(v['latency']['counts']), 3)
+            assert(v['latency']['min'] >= 0)
+        with open(os.path.join(trace_dir, 'trace_chrome.json'), 'r') as fd:
+            chrome = json.load(fd)
+        assert_equal(len([x for x in chrome['traceEvents'] if x['ph'] == 'X']),
+                     len(events))
+    finally:
+        if old_trace is None:
+            del os.environ['YGG_TRACE']
+        else:  # pragma: debug
+            os.environ['YGG_TRACE'] = old_trace
+        tracing.reset_tracer()
+        shutil.rmtree(trace_dir)
+    assert_equal(tracing.get_tracer(), None)
+
+
+def test_remove_trace_files():
+    r"""Test that only files created by tracing are removed."""
+    trace_dir = tempfile.mkdtemp()
+    try:
+        tracer = tracing.MessageTracer(trace_dir)
+        tracer.record('send', 'a', tracer.time())
+        tracer.flush()
+        tracing.export_traces(trace_dir)
+        other = os.path.join(trace_dir, 'trace_notes.txt')
+        with open(other, 'w') as fd:
+            fd.write('keep')
+        assert_equal(len(os.listdir(trace_dir)), 4)
+        tracing.remove_trace_files(trace_dir)
+        assert_equal(os.listdir(trace_dir), ['trace_notes.txt'])
+    finally:
+        shutil.rmtree(trace_dir)
+
+
+def test_trace_model():
+    r"""Test recording of the time a model spends handling a message."""
+    trace_dir = tempfile.mkdtemp()
+    try:
+        tracer = tracing.MessageTracer(trace_dir)
+        tracer.record_model_send()
+        assert_equal(tracer.events, [])
+        tracer.record_model_recv('a')
+        tracer.record_model_send()
+        tracer.record_model_send()
+        assert_equal(len(tracer.events), 1)
+        assert_equal(tracer.events[0]['stage'], 'model')
+        assert_equal(tracer.events[0]['id'], 'a')
+        tracer.flush()
+        assert_equal(tracer.events, [])
+        assert_equal(len(tracing.load_trace_events(trace_dir)), 1)
+    finally:
+        shutil.rmtree(trace_dir)
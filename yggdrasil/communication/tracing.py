@@ -0,0 +1,380 @@
+r"""Module for recording and exporting message level timing information.
+
+When the environment variable 'YGG_TRACE' (or the 'trace' option in the
+'[debug]' section of the config file) is set to a directory, each process
+participating in an integration records timestamps for the stages that a
+message passes through (serialization, transport, deserialization, filters,
+transforms, and the time a Python model spends handling a message). Events
+are keyed by the 'trace_id' field of the message header so that the same
+message can be followed from one process to the next. Each process writes its events
+to a separate file in the trace directory when it exits and the events can
+then be combined into a Chrome trace (viewable in chrome://tracing or
+Perfetto) and a summary of per connection latencies.
+
+"""
+import os
+import re
+import json
+import time
+import uuid
+import atexit
+import socket
+import threading
+import numpy as np
+
+
+_trace_env = 'YGG_TRACE'
+_event_file_regex = re.compile(r'^trace_.+_\d+\.jsonl$')
+_export_files = ['trace_chrome.json', 'trace_summary.json']
+_tracer = None
+_tracer_lock = threading.RLock()
+
+
+def get_trace_dir():
+    r"""Determine the directory where trace events should be saved.
+
+    Returns:
+        str: Full path to the trace directory. None is returned if tracing
+            is not enabled.
+
+    """
+    out = os.environ.get(_trace_env, None)
+    if not out:
+        return None
+    return os.path.abspath(out)
+
+
+def get_tracer():
+    r"""Get the tracer for the current process.
+
+    Returns:
+        MessageTracer: Tracer that events should be recorded with. None is
+            returned if tracing is not enabled.
+
+    """
+    global _tracer
+    trace_dir = get_trace_dir()
+    if trace_dir is None:
+        return None
+    with _tracer_lock:
+        if (_tracer is None) or (_tracer.trace_dir != trace_dir):
+            if _tracer is not None:
+                _tracer.flush()
+            _tracer = MessageTracer(trace_dir)
+        return _tracer
+
+
+def reset_tracer():
+    r"""Flush and discard the tracer for the current process."""
+    global _tracer
+    with _tracer_lock:
+        if _tracer is not None:
+            _tracer.flush()
+        _tracer = None
+
+
+def new_message_id():
+    r"""Create a new unique message ID.
+
+    Returns:
+        str: Message ID.
+
+    """
+    return str(uuid.uuid4())
+
+
+class MessageTracer(object):
+    r"""Class for recording events that occur as messages are passed
+    through the comms in a process.
+
+    Args:
+        trace_dir (str): Directory where events should be saved.
+
+    Attributes:
+        trace_dir (str): Directory where events should be saved.
+        pid (int): ID of the process that events are recorded for.
+        process_name (str): Name of the model running in the process or
+            'runner' if the process is not a model.
+        fname (str): Full path to the file where events are saved.
+        events (list): Events that have not yet been saved.
+
+    """
+
+    def __init__(self, trace_dir):
+        self.trace_dir = trace_dir
+        self.pid = os.getpid()
+        self.process_name = os.environ.get('YGG_MODEL_NAME', 'runner')
+        self.fname = os.path.join(trace_dir, 'trace_%s_%d.jsonl'
+                                  % (socket.gethostname(), self.pid))
+        self.events = []
+        self.lock = threading.Lock()
+        self._model_recv = None
+        atexit.register(self.flush)
+
+    @staticmethod
+    def time():
+        r"""float: Current time in seconds since the epoch. Wall clock time
+        is used so that times from different processes can be compared."""
+        return time.time()
+
+    def record(self, stage, comm, start, end=None, msg_id=None,
+               address=None, **kwargs):
+        r"""Record an event.
+
+        Args:
+            stage (str): Name of the stage that the message went through
+                (e.g. 'serialize', 'send', 'recv', 'deserialize', 'filter',
+                'transform', 'model').
+            comm (str): Name of the comm, connection, or model that
+                processed the message.
+            start (float): Time when the stage began.
+            end (float, optional): Time when the stage ended. Defaults to
+                the current time.
+            msg_id (str, optional): ID of the message from its header.
+                Defaults to None.
+            address (str, optional): Address of the comm that processed
+                the message. Defaults to None.
+            **kwargs: Additional keyword arguments are stored with the
+                event (e.g. the number of bytes).
+
+        """
+        if end is None:
+            end = self.time()
+        event = dict(stage=stage, comm=comm, start=start, end=end,
+                     id=msg_id, address=address, pid=self.pid,
+                     tid=threading.current_thread().ident,
+                     process=self.process_name)
+        event.update(kwargs)
+        self.events.append(event)
+
+    def record_model_recv(self, msg_id, t=None):
+        r"""Record when a model received a message so that the time spent
+        handling it can be recorded when the model next sends a message.
+
+        Args:
+            msg_id (str): ID of the message that was received.
+            t (float, optional): Time when the message was received.
+                Defaults to the current time.
+
+        """
+        if t is None:
+            t = self.time()
+        self._model_recv = (msg_id, t)
+
+    def record_model_send(self, t=None):
+        r"""Record the time a model spent handling the last message it
+        received when it sends a message.
+
+        Args:
+            t (float, optional): Time when the message was sent. Defaults to
+                the current time.
+
+        """
+        last = self._model_recv
+        if last is None:
+            return
+        self._model_recv = None
+        self.record('model', self.process_name, last[1], end=t,
+                    msg_id=last[0])
+
+    def flush(self):
+        r"""Save recorded events to the trace file."""
+        with self.lock:
+            events, self.events = self.events, []
+            if not events:
+                return
+            if not os.path.isdir(self.trace_dir):
+                os.makedirs(self.trace_dir)
+            with open(self.fname, 'a') as fd:
+                for x in events:
+                    fd.write(json.dumps(x) + '\n')
+
+
+def get_event_files(trace_dir):
+    r"""Get the files in a trace directory that events were saved to by
+    MessageTracer instances.
+
+    Args:
+        trace_dir (str): Directory containing trace files.
+
+    Returns:
+        list: Full paths to the event files.
+
+    """
+    if not os.path.isdir(trace_dir):
+        return []
+    return [os.path.join(trace_dir, x) for x in sorted(os.listdir(trace_dir))
+            if _event_file_regex.match(x)]
+
+
+def remove_trace_files(trace_dir):
+    r"""Remove the event files and exported traces from a trace directory.
+    Other files in the directory are not touched.
+
+    Args:
+        trace_dir (str): Directory containing trace files.
+
+    """
+    fnames = get_event_files(trace_dir)
+    fnames += [os.path.join(trace_dir, x) for x in _export_files]
+    for x in fnames:
+        if os.path.isfile(x):
+            os.remove(x)
+
+
+def load_trace_events(trace_dir):
+    r"""Load the events recorded by all of the processes using a trace
+    directory.
+
+    Args:
+        trace_dir (str): Directory containing trace files.
+
+    Returns:
+        list: Events sorted by start time.
+
+    """
+    out = []
+    for fname in get_event_files(trace_dir):
+        with open(fname, 'r') as fd:
+            for line in fd:
+                if line.strip():
+                    out.append(json.loads(line))
+    out.sort(key=lambda x: x['start'])
+    return out
+
+
+def create_chrome_trace(events):
+    r"""Create a Chrome trace from a set of events.
+
+    Args:
+        events (list): Events returned by load_trace_events.
+
+    Returns:
+        dict: Trace in the Chrome trace event format.
+
+    """
+    out = []
+    processes = {}
+    for x in events:
+        processes.setdefault(x['pid'], x['process'])
+        args = dict(id=x['id'], comm=x['comm'])
+        for k in ['address', 'nbytes']:
+            if x.get(k, None) is not None:
+                args[k] = x[k]
+        out.append({'name': x['stage'], 'cat': x['comm'], 'ph': 'X',
+                    'ts': 1.0e6 * x['start'],
+                    'dur': 1.0e6 * (x['end'] - x['start']),
+                    'pid': x['pid'], 'tid': x['tid'], 'args': args})
+    for pid, name in processes.items():
+        out.append({'name': 'process_name', 'ph': 'M', 'pid': pid,
+                    'args': {'name': name}})
+    return {'traceEvents': out, 'displayTimeUnit': 'ms'}
+
+
+def compute_latencies(events):
+    r"""Compute the latency for each message passed through each
+    connection. Messages are matched between the sending and receiving
+    comms using the address of the comm and the message ID.
+
+    Args:
+        events (list): Events returned by load_trace_events.
+
+    Returns:
+        dict: Mapping between connection descriptors ('<sender> ->
+            <receiver>') and lists of (latency, transit) tuples for each
+            message where latency is the time (in seconds) between the start
+            of the sender's serialization and the end of the receiver's
+            deserialization and transit is the time between the end of the
+            send and the end of the receive (which includes any time spent
+            waiting in a backlog).
+
+    """
+    sent = {}
+    recv = {}
+    for x in events:
+        if (x['id'] is None) or (x['address'] is None):
+            continue
+        key = (x['address'], x['id'])
+        if x['stage'] in ['serialize', 'send']:
+            sent.setdefault(key, []).append(x)
+        elif x['stage'] in ['recv', 'deserialize']:
+            recv.setdefault(key, []).append(x)
+    out = {}
+    for key, rx in recv.items():
+        sx = sent.get(key, [])
+        if not sx:
+            continue
+        sx_send = [x['end'] for x in sx if x['stage'] == 'send']
+        rx_recv = [x['end'] for x in rx if x['stage'] == 'recv']
+        name = '%s -> %s' % (sx[0]['comm'], rx[0]['comm'])
+        latency = max(x['end'] for x in rx) - min(x['start'] for x in sx)
+        transit = None
+        if sx_send and rx_recv:
+            transit = min(rx_recv) - max(sx_send)
+        out.setdefault(name, []).append((latency, transit))
+    return out
+
+
+def summarize_latencies(latencies, nbins=10):
+    r"""Summarize the latencies for each connection as a histogram.
+
+    Args:
+        latencies (dict): Latencies returned by compute_latencies.
+        nbins (int, optional): Number of bins that should be used for the
+            histograms. Defaults to 10.
+
+    Returns:
+        dict: Mapping between connection descriptors and dictionaries of
+            statistics for the latency and transit time of messages passed
+            through the connection.
+
+    """
+    out = {}
+    for name, values in latencies.items():
+        out[name] = {'count': len(values)}
+        for i, k in enumerate(['latency', 'transit']):
+            x = np.array([v[i] for v in values if v[i] is not None])
+            if len(x) == 0:
+                continue
+            counts, edges = np.histogram(x, bins=nbins)
+            out[name][k] = {'mean': float(np.mean(x)),
+                            'min': float(np.min(x)),
+                            'max': float(np.max(x)),
+                            'p50': float(np.percentile(x, 50)),
+                            'p90': float(np.percentile(x, 90)),
+                            'p99': float(np.percentile(x, 99)),
+                            'counts': counts.tolist(),
+                            'bin_edges': edges.tolist()}
+    return out
+
+
+def export_traces(trace_dir, chrome_file=None, summary_file=None, nbins=10):
+    r"""Export the events recorded in a trace directory as a Chrome trace
+    and a summary of the per connection latencies.
+
+    Args:
+        trace_dir (str): Directory containing trace files.
+        chrome_file (str, optional): Full path to the file where the Chrome
+            trace should be saved. Defaults to 'trace_chrome.json' in the
+            trace directory.
+        summary_file (str, optional): Full path to the file where the
+            latency summary should be saved. Defaults to
+            'trace_summary.json' in the trace directory.
+        nbins (int, optional): Number of bins that should be used for the
+            latency histograms. Defaults to 10.
+
+    Returns:
+        dict: Latency summary returned by summarize_latencies.
+
+    """
+    if chrome_file is None:
+        chrome_file = os.path.join(trace_dir, _export_files[0])
+    if summary_file is None:
+        summary_file = os.path.join(trace_dir, _export_files[1])
+    events = load_trace_events(trace_dir)
+    with open(chrome_file, 'w') as fd:
+        json.dump(create_chrome_trace(events), fd)
+    out = summarize_latencies(compute_latencies(events), nbins=nbins)
+    with open(summary_file, 'w') as fd:
+        json.dump(out, fd, indent=4, sort_keys=True)
+    return out
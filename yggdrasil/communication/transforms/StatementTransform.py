@@ -1,6 +1,6 @@
 import numpy as np
 from yggdrasil import units
-from yggdrasil.tools import safe_eval
+from yggdrasil.tools import safe_eval, compile_statement
 from yggdrasil.communication.transforms.TransformBase import TransformBase
 
 
@@ -13,19 +13,28 @@ class StatementTransform(TransformBase):
             The statement should only use a limited set of builtins and the math
             library (See yggdrasil.tools.safe_eval). If more complex relationships
             are required, use the FunctionTransform class.
+        vectorize (bool, optional): If True, the statement is evaluated for
+            an entire batch of messages at once when a batch that is an array
+            or data frame is passed to transform_batch. This should only be
+            set if the statement is applied element-wise (i.e. it does not
+            reduce over or broadcast against the message). Defaults to False
+            and the statement is evaluated for each message in turn.
 
     Attributes:
         statement (str): Python statement that will be evaluated to transform
             messages.
+        code (code): Compiled version of statement.
 
     """
     _transformtype = 'statement'
     _schema_required = ['statement']
-    _schema_properties = {'statement': {'type': 'string'}}
+    _schema_properties = {'statement': {'type': 'string'},
+                          'vectorize': {'type': 'boolean', 'default': False}}
 
     def __init__(self, *args, **kwargs):
         super(StatementTransform, self).__init__(*args, **kwargs)
         self.statement = self.statement.replace('%x%', 'x')
+        self.code = compile_statement(self.statement)
 
     def evaluate_transform(self, x, no_copy=False):
         r"""Call transform on the provided message.
@@ -40,7 +49,29 @@ class StatementTransform(TransformBase):
             bool: True if the message will pass through the transform, False otherwise.
 
         """
-        return safe_eval(self.statement, x=x)
+        return safe_eval(self.code, x=x)
+
+    def evaluate_transform_batch(self, x, no_copy=False):
+        r"""Call transform on an entire batch of messages at once.
+
+        Args:
+            x (np.ndarray, pandas.DataFrame): Batch of messages where each
+                element/row is a message.
+            no_copy (bool, optional): If True, the transformation occurs in
+                place. Otherwise a copy is created and transformed. Defaults
+                to False.
+
+        Returns:
+            object: The transformed messages with one element/row for each
+                message in the batch.
+
+        Raises:
+            NotImplementedError: If vectorize is False.
+
+        """
+        if not self.vectorize:
+            raise NotImplementedError("Statement is not vectorized.")
+        return safe_eval(self.code, x=x)
 
     @classmethod
     def get_testing_options(cls):
@@ -52,10 +83,18 @@ class StatementTransform(TransformBase):
                 keywords.
         
         """
-        out = [{'kwargs': {'statement': '%x%**3'},
-                'in/out': [(1, 1), (2, 8)]},
+        out = [{'kwargs': {'statement': '%x%**3', 'vectorize': True},
+                'in/out': [(1, 1), (2, 8)],
+                'batch': [(np.array([1, 2]), np.array([1, 8]))]},
                {'kwargs': {'statement': '%x% * array([1, 1, 1])'},
-                'in/out': [(1, np.ones(3, int)), (2, 2 * np.ones(3, int))]}]
+                'in/out': [(1, np.ones(3, int)), (2, 2 * np.ones(3, int))],
+                'batch': [(np.array([1, 2]),
+                           [np.ones(3, int), 2 * np.ones(3, int)]),
+                          (np.array([1.0, 2.0, 3.0]),
+                           [np.ones(3), 2 * np.ones(3), 3 * np.ones(3)])]},
+               {'kwargs': {'statement': '%x% - min(array([%x%]).flatten())'},
+                'in/out': [(1.0, 0.0), (2.0, 0.0)],
+                'batch': [(np.array([1.0, 2.0, 3.0]), [0.0, 0.0, 0.0])]}]
         if units._use_unyt:
             out.append({'kwargs': {'statement': '%x% * '
                                    + repr(units.add_units(1, 'cm'))},
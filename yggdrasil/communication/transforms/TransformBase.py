@@ -1,3 +1,4 @@
+from yggdrasil.tools import is_vectorizable_batch, iter_batch
 from yggdrasil.components import ComponentBase
 
 
@@ -77,6 +78,60 @@ class TransformBase(ComponentBase):
         """
         raise NotImplementedError
 
+    def evaluate_transform_batch(self, x, no_copy=False):
+        r"""Call transform on an entire batch of messages at once.
+
+        Args:
+            x (np.ndarray, pandas.DataFrame): Batch of messages where each
+                element/row is a message.
+            no_copy (bool, optional): If True, the transformation occurs in
+                place. Otherwise a copy is created and transformed. Defaults
+                to False.
+
+        Returns:
+            object: The transformed messages with one element/row for each
+                message in the batch.
+
+        Raises:
+            NotImplementedError: If the transform cannot be applied to a batch
+                all at once.
+
+        """
+        raise NotImplementedError
+
+    def transform_batch(self, x, no_copy=False):
+        r"""Call transform on a batch of messages. If the batch is an array or
+        data frame and the transform implements evaluate_transform_batch (e.g.
+        a statement transform with vectorize set), the transform is applied to
+        the entire batch at once using NumPy semantics. Otherwise, the
+        transform is applied to each message in turn.
+
+        Args:
+            x (list, np.ndarray, pandas.DataFrame): Batch of messages. For
+                arrays and data frames, each element/row along the first axis
+                is a message.
+            no_copy (bool, optional): If True, the transformation occurs in
+                place. Otherwise a copy is created and transformed. Defaults
+                to False.
+
+        Returns:
+            object: The transformed messages. If the transform was applied to
+                the entire batch at once, this will be an array/data frame with
+                one element/row for each message. Otherwise, it will be a list
+                of transformed messages.
+
+        """
+        if is_vectorizable_batch(x):
+            try:
+                out = self.evaluate_transform_batch(x, no_copy=no_copy)
+            except (NotImplementedError, ValueError, TypeError,
+                    KeyError, IndexError):
+                out = None
+            if ((hasattr(out, 'shape') and (len(out.shape) > 0)
+                 and (out.shape[0] == len(x)))):
+                return out
+        return [self(ix, no_copy=no_copy) for ix in iter_batch(x)]
+
     def __call__(self, x, no_copy=False):
         r"""Call transform on the provided message.
 
@@ -36,6 +36,17 @@ class TestTransformBase(YggTestClass):
                 else:
                     self.assert_equal(inst(msg_in), msg_out)
 
+    def test_transform_batch(self):
+        r"""Test transform_batch."""
+        for x in self.get_options():
+            inst = self.import_cls(**x.get('kwargs', {}))
+            pairs = [(msg_in, msg_out) for msg_in, msg_out in x.get('in/out', [])
+                     if not isinstance(msg_out, type(BaseException))]
+            self.assert_equal(inst.transform_batch([p[0] for p in pairs]),
+                              [p[1] for p in pairs])
+            for msgs_in, msgs_out in x.get('batch', []):
+                self.assert_equal(inst.transform_batch(msgs_in), msgs_out)
+
     def test_transform_type(self):
         r"""Test transform_type."""
         for x in self.get_options():
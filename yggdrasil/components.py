@@ -2,6 +2,7 @@ import os
 import glob
 import copy
 import six
+import json
 import importlib
 # import warnings
 from collections import OrderedDict
@@ -14,6 +15,10 @@ _registry_defaults = {}
 _registry_base_classes = {}
 _registry_class2subtype = {}
 _registry_complete = False
+_registry_manifest = None
+_registry_manifest_fname = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '.ygg_registry.json'))
+_component_schema_cache = {}
 _comptype2key = {'comm': 'commtype',
                  'file': 'filetype',
                  'model': 'language',
@@ -129,6 +134,149 @@ def import_all_components(comptype):
                                     % (mod, xbase))
 
 
+def create_registry_manifest(schema=None):
+    r"""Create a manifest describing the classes and modules that implement
+    each component subtype so that components can be imported without
+    importing every component module or loading the schema.
+
+    Args:
+        schema (SchemaRegistry, optional): Schema that the manifest should be
+            created from. Defaults to the schema returned by
+            yggdrasil.schema.get_schema.
+
+    Returns:
+        dict: Mapping from component type to dictionaries containing the
+            default subtype ('default_subtype'), the name of the component
+            base class ('base_class'), a mapping from subtypes to class names
+            ('subtypes'), and a mapping from class names to the modules
+            containing the classes ('modules').
+
+    """
+    global _registry_manifest
+    if schema is None:
+        from yggdrasil.schema import get_schema
+        schema = get_schema()
+    # Prevent recursion while the base classes are imported
+    old_manifest = _registry_manifest
+    _registry_manifest = {}
+    try:
+        out = OrderedDict()
+        for k in sorted(schema.keys()):
+            s = schema[k]
+            modules = OrderedDict()
+            for x in s.classes:
+                if x in _registry.get(k, {}):
+                    modules[x] = _registry[k][x].__module__
+                else:
+                    modules[x] = 'yggdrasil.%s.%s' % (_comptype2mod[k], x)
+            out[k] = OrderedDict([
+                ('default_subtype', s.default_subtype),
+                ('base_class', _registry_base_classes.get(
+                    k, s.base_subtype_class.__name__)),
+                ('subtypes', OrderedDict(sorted(s.subtype2class.items()))),
+                ('modules', modules)])
+    finally:
+        _registry_manifest = old_manifest
+    return out
+
+
+def save_registry_manifest(manifest, fname=None):
+    r"""Save a registry manifest to a file.
+
+    Args:
+        manifest (dict): Manifest created by create_registry_manifest.
+        fname (str, optional): Full path to the file that the manifest should
+            be saved to. Defaults to _registry_manifest_fname.
+
+    """
+    if fname is None:
+        fname = _registry_manifest_fname
+    with open(fname, 'w') as fd:
+        json.dump(manifest, fd, indent=4)
+
+
+def clear_registry_manifest(remove_file=False):
+    r"""Clear the loaded registry manifest so that it is reloaded (or
+    recreated) the next time it is needed.
+
+    Args:
+        remove_file (bool, optional): If True, the manifest file is also
+            removed. Defaults to False.
+
+    """
+    global _registry_manifest
+    _registry_manifest = None
+    if remove_file and os.path.isfile(_registry_manifest_fname):
+        os.remove(_registry_manifest_fname)
+
+
+def get_registry_manifest():
+    r"""Get the registry manifest mapping component subtypes to the classes
+    and modules that implement them. If the manifest file does not exist,
+    it is created from the schema.
+
+    Returns:
+        dict: Registry manifest.
+
+    """
+    global _registry_manifest
+    if _registry_manifest is None:
+        if os.path.isfile(_registry_manifest_fname):
+            with open(_registry_manifest_fname, 'r') as fd:
+                _registry_manifest = json.load(fd)
+        else:
+            manifest = create_registry_manifest()
+            save_registry_manifest(manifest)
+            _registry_manifest = manifest
+    return _registry_manifest
+
+
+def clear_component_schema_cache():
+    r"""Clear the cached schemas used to parse component keyword arguments
+    so that they are recreated from the current schema."""
+    _component_schema_cache.clear()
+
+
+def get_component_validation_schema(comptype, subtype,
+                                    excluded_from_validation=None):
+    r"""Get the relaxed schema used to parse and validate the keyword
+    arguments for a component. The result is cached for each combination of
+    arguments.
+
+    Args:
+        comptype (str): Component type.
+        subtype (str): Component subtype.
+        excluded_from_validation (list, optional): Properties that should be
+            removed from the schema used for validation. Defaults to None
+            and all properties are validated.
+
+    Returns:
+        tuple(list, dict, str): The names of properties in the component
+            schema (including those excluded from validation), the schema
+            that should be used for validation, and the key identifying the
+            validation schema in the validator cache.
+
+    """
+    if excluded_from_validation is None:
+        excluded_from_validation = []
+    key = (comptype, subtype, tuple(excluded_from_validation))
+    out = _component_schema_cache.get(key, None)
+    if out is None:
+        from yggdrasil.schema import get_schema
+        from yggdrasil.metaschema import get_schema_key
+        s = get_schema().get_component_schema(
+            comptype, subtype, relaxed=True,
+            allow_instance_definitions=True)
+        props = list(s['properties'].keys())
+        # Remove properties that shouldn't be validated in class
+        for k in excluded_from_validation:
+            if k in s['properties']:
+                del s['properties'][k]
+        out = (props, s, get_schema_key(s))
+        _component_schema_cache[key] = out
+    return out
+
+
 def import_component(comptype, subtype=None, without_schema=False,
                      **kwargs):
     r"""Dynamically import a component by name.
@@ -174,6 +322,9 @@ def import_component(comptype, subtype=None, without_schema=False,
     # Set default based on registry to avoid schema if possible
     if (subtype is None) and (comptype in _registry_defaults):
         subtype = _registry_defaults.get(comptype, None)
+    if (subtype is None) and (not without_schema):
+        subtype = get_registry_manifest().get(comptype, {}).get(
+            'default_subtype', None)
     # Check registered components to prevent importing multiple times
     if subtype in _registry.get(comptype, {}):
         out_cls = _registry[comptype][subtype]
@@ -181,10 +332,19 @@ def import_component(comptype, subtype=None, without_schema=False,
         out_cls = _registry[comptype][_registry_class2subtype[comptype][subtype]]
     else:
         # Get class name
+        manifest = get_registry_manifest().get(comptype, {})
         if without_schema:
             if subtype is None:  # pragma: debug
                 raise ValueError("subtype must be provided if without_schema is True.")
             class_name = subtype
+        elif (subtype in manifest.get('modules', {})):
+            class_name = subtype
+        elif (subtype in manifest.get('subtypes', {})):
+            class_name = manifest['subtypes'][subtype]
+        elif ((comptype == 'comm') and (subtype in get_registry_manifest().get(
+                'file', {}).get('subtypes', {}))):
+            # Files are subclasses of comms
+            return import_component('file', subtype)
         else:
             from yggdrasil.schema import get_schema
             s = get_schema().get(comptype, None)
@@ -207,8 +367,10 @@ def import_component(comptype, subtype=None, without_schema=False,
                             pass
                     raise ValueError("Unrecognized %s subtype: %s"
                                      % (comptype, subtype))
+        mod_name = manifest.get('modules', {}).get(
+            class_name, 'yggdrasil.%s.%s' % (mod, class_name))
         try:
-            out_mod = importlib.import_module('yggdrasil.%s.%s' % (mod, class_name))
+            out_mod = importlib.import_module(mod_name)
         except ImportError:  # pragma: debug
             import_all_components(comptype)
             return import_component(comptype, subtype=subtype,
@@ -277,8 +439,11 @@ def get_component_base_class(comptype, subtype=None, without_schema=False,
         ComponentBase: Component base class.
 
     """
+    manifest = get_registry_manifest().get(comptype, {})
     if comptype in _registry_base_classes:
         base_class_name = _registry_base_classes[comptype]
+    elif manifest.get('base_class', None) is not None:
+        base_class_name = manifest['base_class']
     else:
         default_class = import_component(comptype, subtype=subtype,
                                          without_schema=without_schema,
@@ -468,8 +633,10 @@ class ComponentBase(object):
     Args:
         skip_component_schema_normalization (bool, optional): If True, the
             schema will not be used to normalize/validate input keyword
-            arguments (e.g. in case they were already parsed). Defaults to
-            False.
+            arguments (e.g. in case they were already parsed or the component
+            is created internally from trusted keyword arguments). Defaults
+            to False unless the YGG_SKIP_COMPONENT_VALIDATION environment
+            variable is set.
         **kwargs: Keyword arguments are added to the class as attributes
             according to the class attributes _schema_properties and
             _schema_excluded_from_class. Keyword arguments not added to the
@@ -555,20 +722,16 @@ class ComponentBase(object):
                     kwargs[k] = kwargs[k].split()
         # Parse keyword arguments using schema
         if (comptype is not None) and (subtype is not None):
-            from yggdrasil.schema import get_schema
-            s = get_schema().get_component_schema(
-                comptype, subtype, relaxed=True,
-                allow_instance_definitions=True)
-            props = list(s['properties'].keys())
+            props, s, s_key = get_component_validation_schema(
+                comptype, subtype,
+                excluded_from_validation=(
+                    self._schema_excluded_from_class_validation))
             if not skip_component_schema_normalization:
                 from yggdrasil import metaschema
                 kwargs.setdefault(self._schema_subtype_key, subtype)
-                # Remove properties that shouldn't ve validated in class
-                for k in self._schema_excluded_from_class_validation:
-                    if k in s['properties']:
-                        del s['properties'][k]
                 # Validate and normalize
-                metaschema.validate_instance(kwargs, s, normalize=False)
+                metaschema.validate_instance(kwargs, s, normalize=False,
+                                             schema_key=s_key)
                 # TODO: Normalization performance needs improvement
                 # import pprint
                 # print('before')
@@ -327,6 +327,7 @@ def locate_file(fname, environment_variable='PATH', directory_list=None):
 env_map = [('debug', 'ygg', 'YGG_DEBUG'),
            ('debug', 'rmq', 'RMQ_DEBUG'),
            ('debug', 'client', 'YGG_CLIENT_DEBUG'),
+           ('debug', 'trace', 'YGG_TRACE'),
            ('jsonschema', 'validate_components', 'YGG_SKIP_COMPONENT_VALIDATION'),
            ('jsonschema', 'validate_all_messages', 'YGG_VALIDATE_ALL_MESSAGES'),
            ('rmq', 'namespace', 'YGG_NAMESPACE'),
@@ -11,6 +11,7 @@ class BuildToolBase(CompilerBase):
 
     is_build_tool = True
     build_language = None
+    cacheable = False
 
     @classmethod
     def get_default_target_language(cls):
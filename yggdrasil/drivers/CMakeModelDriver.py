@@ -522,6 +522,7 @@ class CMakeBuilder(LinkerBase):
                                 ('target', '--target'),
                                 ('configuration', '--config')])
     executable_ext = ''
+    cacheable = False
 
     @classmethod
     def call(cls, *args, **kwargs):
@@ -6,7 +6,8 @@ from yggdrasil.drivers.ClientResponseDriver import ClientResponseDriver
 # Client recvs response from local client input comm
 # ----
 # Client request driver recvs from local client output comm
-# Client request driver creates client response driver
+# Client request driver creates client response driver (or reuses the one
+#   for the client's response address if the client reuses it)
 # Client request driver sends to server request comm (w/ response comm header)
 # ----
 # Client response driver recvs from client response comm
@@ -48,7 +49,9 @@ class ClientRequestDriver(ConnectionDriver):
         comm (str): The comm class that should be used to communicate with the
             server request driver.
         comm_address (str): Address for the server request driver.
-        response_drivers (list): Response drivers created for each request.
+        response_drivers (list): Response drivers created for each request
+            or, for client models that reuse their response address, for each
+            client model response address.
 
     """
 
@@ -78,6 +81,7 @@ class ClientRequestDriver(ConnectionDriver):
         super(ClientRequestDriver, self).__init__(model_request_name, **kwargs)
         self.env[self.icomm.name] = self.icomm.address
         self.response_drivers = []
+        self._persistent_response_drivers = dict()
         self.comm = comm
         self.comm_address = self.ocomm.opp_address
         self._block_response = False
@@ -126,6 +130,7 @@ class ClientRequestDriver(ConnectionDriver):
             for x in self.response_drivers:
                 x.terminate()
             self.response_drivers = []
+            self._persistent_response_drivers = dict()
 
     def close_comm(self):
         r"""Close response drivers."""
@@ -150,7 +155,9 @@ class ClientRequestDriver(ConnectionDriver):
 
     def send_message(self, *args, **kwargs):
         r"""Start a response driver for a request message and send message with
-        header.
+        header. If the client model uses the same response address for every
+        request, a single response driver is started for that address and is
+        reused for all subsequent requests.
 
         Args:
             *args: Arguments are passed to parent class send_message.
@@ -165,26 +172,43 @@ class ClientRequestDriver(ConnectionDriver):
         # Start response driver
         is_eof = kwargs.get('is_eof', False)
         if not is_eof:
+            persistent = self.last_header.get('persistent_response', False)
             with self.lock:
                 if (not self.is_comm_open) or self._block_response:  # pragma: debug
                     return False
-                drv_args = [self.model_response_address]
-                drv_kwargs = dict(comm=self.comm, msg_id=self.request_id,
-                                  request_name=self.name)
-                self.debug("Creating response comm: address = %s, request_id = %s",
-                           self.model_response_address, self.request_id)
-                try:
-                    response_driver = ClientResponseDriver(*drv_args, **drv_kwargs)
-                    self.response_drivers.append(response_driver)
-                    response_driver.start()
-                    self.debug("Started response comm: address = %s, request_id = %s",
+                response_driver = None
+                if persistent:
+                    response_driver = self._persistent_response_drivers.get(
+                        self.model_response_address, None)
+                    if (response_driver is not None) and (not response_driver.is_valid):
+                        response_driver = None  # pragma: debug
+                if response_driver is None:
+                    drv_args = [self.model_response_address]
+                    drv_kwargs = dict(comm=self.comm, msg_id=self.request_id,
+                                      request_name=self.name,
+                                      persistent=persistent)
+                    self.debug("Creating response comm: address = %s, "
+                               "request_id = %s",
                                self.model_response_address, self.request_id)
-                except BaseException:  # pragma: debug
-                    self.exception("Could not create/start response driver.")
-                    return False
+                    try:
+                        response_driver = ClientResponseDriver(*drv_args,
+                                                               **drv_kwargs)
+                        self.response_drivers.append(response_driver)
+                        response_driver.start()
+                        self.debug("Started response comm: address = %s, "
+                                   "request_id = %s",
+                                   self.model_response_address, self.request_id)
+                    except BaseException:  # pragma: debug
+                        self.exception("Could not create/start response driver.")
+                        return False
+                    if persistent:
+                        self._persistent_response_drivers[
+                            self.model_response_address] = response_driver
             # Send response address in header
             kwargs.setdefault('header_kwargs', {})
             kwargs['header_kwargs'].setdefault(
                 'response_address', response_driver.response_address)
             kwargs['header_kwargs'].setdefault('request_id', self.request_id)
+            if persistent:
+                kwargs['header_kwargs'].setdefault('persistent_response', True)
         return super(ClientRequestDriver, self).send_message(*args, **kwargs)
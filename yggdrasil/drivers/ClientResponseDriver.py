@@ -13,6 +13,10 @@ class ClientResponseDriver(ConnectionDriver):
             tools.get_default_comm().
         msg_id (str, optional): ID associate with the request message this
             driver was created to respond to. Defaults to new unique ID.
+        persistent (bool, optional): If True, the driver will forward the
+            responses to all requests sent by a client that uses the same
+            response address for every request. Otherwise, the driver is
+            stopped after forwarding a single response. Defaults to False.
         **kwargs: Additional keyword arguments are passed to parent class.
 
     Attributes:
@@ -20,13 +24,15 @@ class ClientResponseDriver(ConnectionDriver):
             server response driver.
         msg_id (str): ID associate with the request message this driver was
             created to respond to.
+        persistent (bool): If True, the driver forwards responses to multiple
+            requests.
 
     """
 
     _connection_type = None
 
     def __init__(self, model_response_address, request_name=None,
-                 comm=None, msg_id=None, **kwargs):
+                 comm=None, msg_id=None, persistent=False, **kwargs):
         if msg_id is None:
             msg_id = str(uuid.uuid4())
         response_name = 'ClientResponse.%s' % msg_id
@@ -46,12 +52,41 @@ class ClientResponseDriver(ConnectionDriver):
             ocomm_kws['address'] = model_response_address
         kwargs['ocomm_kws'] = ocomm_kws
         # Overall keywords
-        kwargs['single_use'] = True
+        kwargs['single_use'] = (not persistent)
         super(ClientResponseDriver, self).__init__(response_name, **kwargs)
         self.comm = comm
         self.msg_id = msg_id
+        self.persistent = persistent
 
     @property
     def response_address(self):
         r"""str: Address of response comm."""
         return self.icomm.address
+
+    def send_eof(self):
+        r"""Response channels are not closed with an EOF message.
+
+        Returns:
+            bool: False as no message is sent.
+
+        """
+        return False
+
+    def send_message(self, *args, **kwargs):
+        r"""Send a response, passing on the ID of the request it belongs to
+        so that the client model can match it to the request.
+
+        Args:
+            *args: Arguments are passed to parent class send_message.
+            **kwargs: Keyword arguments are passed to parent class send_message.
+
+        Returns:
+            bool: Success or failure of send.
+
+        """
+        header = self.icomm._last_header
+        if isinstance(header, dict) and ('request_id' in header):
+            kwargs.setdefault('header_kwargs', {})
+            kwargs['header_kwargs'].setdefault('request_id',
+                                               header['request_id'])
+        return super(ClientResponseDriver, self).send_message(*args, **kwargs)
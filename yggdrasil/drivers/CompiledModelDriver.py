@@ -2,14 +2,24 @@ import os
 import re
 import six
 import copy
+import shutil
+import hashlib
+import functools
 import logging
+import tempfile
 import warnings
+import threading
 import subprocess
+import multiprocessing
 from collections import OrderedDict
 from yggdrasil import platform, backwards, tools, scanf
 from yggdrasil.config import ygg_cfg, locate_file
 from yggdrasil.drivers.ModelDriver import ModelDriver, remove_products
 from yggdrasil.components import import_component
+try:
+    from Queue import Queue
+except ImportError:
+    from queue import Queue  # python 3.x
 
 
 logger = logging.getLogger(__name__)
@@ -21,6 +31,189 @@ _conda_prefix = tools.get_conda_prefix()
 _system_suffix = ""
 if _conda_prefix is not None:
     _system_suffix = '_' + os.path.basename(_conda_prefix)
+_tool_version_cache = {}
+_compilation_semaphore = None
+_dependency_lock = threading.RLock()
+_include_regex = re.compile(br'^[ \t]*#[ \t]*include[ \t]*[<"]([^>"]+)[>"]',
+                            re.MULTILINE)
+
+
+def get_build_cache_dir():
+    r"""Determine the directory where compilation products are cached.
+
+    Returns:
+        str: Full path to the build cache directory. None is returned if
+            caching of compilation products is disabled via the 'cache'
+            option in the 'compilation' section of the config file.
+
+    """
+    if ygg_cfg.get('compilation', 'cache', 'True').lower() != 'true':
+        return None
+    out = ygg_cfg.get('compilation', 'cache_dir', None)
+    if not out:
+        out = os.path.join(os.path.expanduser('~'), '.yggdrasil_cache', 'build')
+    return out
+
+
+def get_build_cache_max_entries():
+    r"""Determine the maximum number of entries that should be kept in the
+    build cache.
+
+    Returns:
+        int: Maximum number of entries from the 'cache_max_entries' option in
+            the 'compilation' section of the config file. Values less than 1
+            indicate that the number is not limited.
+
+    """
+    return int(ygg_cfg.get('compilation', 'cache_max_entries', None) or 200)
+
+
+def get_build_cache_entries():
+    r"""Get the entries in the build cache.
+
+    Returns:
+        list: Full paths to the directories containing the products for each
+            entry in the build cache.
+
+    """
+    cache_dir = get_build_cache_dir()
+    if (cache_dir is None) or (not os.path.isdir(cache_dir)):
+        return []
+    out = []
+    for x in os.listdir(cache_dir):
+        xdir = os.path.join(cache_dir, x)
+        if os.path.isdir(xdir):
+            out += [os.path.join(xdir, k) for k in os.listdir(xdir)
+                    if k.startswith(x) and (len(k) == 64)]
+    return out
+
+
+def get_compilation_jobs():
+    r"""Determine the maximum number of compilation processes that should be
+    run concurrently.
+
+    Returns:
+        int: Number of compilation jobs from the 'jobs' option in the
+            'compilation' section of the config file. If not set, the number
+            of CPUs is returned.
+
+    """
+    out = ygg_cfg.get('compilation', 'jobs', None)
+    if out:
+        return max(int(out), 1)
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:  # pragma: debug
+        return 1
+
+
+def get_compilation_semaphore():
+    r"""Get the semaphore used to limit the number of concurrent compilation
+    processes across all threads.
+
+    Returns:
+        threading.BoundedSemaphore: Compilation semaphore.
+
+    """
+    global _compilation_semaphore
+    if _compilation_semaphore is None:
+        _compilation_semaphore = threading.BoundedSemaphore(
+            get_compilation_jobs())
+    return _compilation_semaphore
+
+
+def run_compilation_tasks(tasks, dependencies=None, jobs=None):
+    r"""Run compilation tasks concurrently, only starting each task once all
+    of the tasks that it depends on have completed.
+
+    Args:
+        tasks (OrderedDict): Mapping between task names and functions that
+            should be called (without arguments) to perform the tasks. Tasks
+            that are ready are started in the order they appear.
+        dependencies (dict, optional): Mapping between task names and the
+            names of tasks that must be completed first. Names of
+            dependencies that are not in tasks are ignored. Defaults to None
+            and tasks are assumed to be independent.
+        jobs (int, optional): Maximum number of tasks that should be run at
+            once. Defaults to get_compilation_jobs(). If 1, tasks are run in
+            the calling thread.
+
+    Returns:
+        dict: Mapping between task names and the values returned by the
+            task functions.
+
+    Raises:
+        RuntimeError: If the dependencies are circular.
+        Exception: The first error raised by a task is re-raised after all
+            running tasks have finished with the name of the failed task
+            stored as its task_name attribute. Tasks that have not started
+            are skipped.
+
+    """
+    if dependencies is None:
+        dependencies = {}
+    if jobs is None:
+        jobs = get_compilation_jobs()
+    pending = list(tasks.keys())
+    complete = Queue()
+    results = {}
+    errors = []
+    nrunning = 0
+
+    def run_task(name):
+        try:
+            complete.put((name, tasks[name](), None))
+        except BaseException as e:
+            complete.put((name, None, e))
+
+    while True:
+        for name in list(pending):
+            if errors or (nrunning >= jobs):
+                break
+            if all((d in results) for d in dependencies.get(name, [])
+                   if (d in tasks) and (d != name)):
+                pending.remove(name)
+                nrunning += 1
+                if jobs == 1:
+                    run_task(name)
+                else:
+                    t = threading.Thread(target=run_task, args=(name,))
+                    t.daemon = True
+                    t.start()
+        if nrunning == 0:
+            break
+        name, result, error = complete.get()
+        nrunning -= 1
+        if error is None:
+            results[name] = result
+        else:
+            errors.append((name, error))
+    if errors:
+        name, error = errors[0]
+        logger.error("Compilation task '%s' failed.", name)
+        error.task_name = name
+        raise error
+    if pending:
+        raise RuntimeError("Circular dependencies between compilation "
+                           "tasks: %s" % pending)
+    return results
+
+
+def _link_file(src, dst):
+    r"""Hard link a file to a new location, copying it if a hard link
+    cannot be created (e.g. between file systems).
+
+    Args:
+        src (str): Full path to the existing file.
+        dst (str): Full path to the new file.
+
+    """
+    if os.path.isfile(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except (OSError, AttributeError):
+        shutil.copy2(src, dst)
 
 
 def get_compilation_tool_registry(tooltype):
@@ -226,6 +419,10 @@ class CompilationToolBase(object):
         remove_product_exts (list): List of extensions or directories matching
             entries in product_exts and product_files that should be removed
             during cleanup. Be careful when adding files to this list.
+        cacheable (bool): If True, products created by the tool are stored in
+            the build cache and reused by later calls with the same command,
+            input file contents (including included headers), and tool
+            version.
 
     """
 
@@ -259,6 +456,7 @@ class CompilationToolBase(object):
     product_files = []
     source_product_exts = []
     remove_product_exts = []
+    cacheable = True
 
     _language_ext = None  # only update once per class
     
@@ -770,6 +968,218 @@ class CompilationToolBase(object):
                 if isrc in products:  # pragma: debug
                     products.remove(isrc)
 
+    @classmethod
+    def get_tool_version(cls, executable=None):
+        r"""Determine the version of the tool executable. Versions are cached
+        so that the executable is only called once for each process.
+
+        Args:
+            executable (str, optional): Executable that the version should be
+                determined for. Defaults to cls.get_executable().
+
+        Returns:
+            str: Output from calling the executable with cls.version_flags.
+                An empty string is returned if the version could not be
+                determined.
+
+        """
+        if executable is None:
+            executable = cls.get_executable()
+        if executable not in _tool_version_cache:
+            out = ''
+            try:
+                proc = tools.popen_nobuffer([executable] + cls.version_flags)
+                output, err = proc.communicate()
+                out = backwards.as_str(output)
+            except (subprocess.CalledProcessError, OSError):  # pragma: debug
+                pass
+            _tool_version_cache[executable] = out
+        return _tool_version_cache[executable]
+
+    @classmethod
+    def get_flag_prefix(cls, key):
+        r"""Get the string that prefixes values for a flag that is formatted
+        with the value (e.g. '-I' for include directories).
+
+        Args:
+            key (str): Flag key in cls.flag_options.
+
+        Returns:
+            str: Flag prefix. None is returned if the flag is not supported
+                or is not formatted with the value.
+
+        """
+        flag = cls.flag_options.get(key, None)
+        if isinstance(flag, dict):
+            flag = flag.get('key', None)
+        if ((not isinstance(flag, backwards.string_types))
+                or (not flag.endswith('%s'))):
+            return None
+        return flag[:-2]
+
+    @classmethod
+    def get_cache_key(cls, cmd, out, working_dir=None):
+        r"""Get the key for products in the build cache. The key is a hash of
+        the command, the working directory, the tool version, the |yggdrasil|
+        version, and the contents of all files in the command including any
+        headers that they include that can be located.
+
+        Args:
+            cmd (list): Command that will be used to create the product.
+            out (str): Full path to the product that will be created.
+            working_dir (str, optional): Directory where the command will be
+                called. Defaults to None and the current working directory is
+                used.
+
+        Returns:
+            str: Key for products in the build cache.
+
+        """
+        from yggdrasil import __version__
+        if working_dir is None:
+            working_dir = os.getcwd()
+        h = hashlib.sha256()
+        for x in [__version__, cls.toolname, cls.get_tool_version(cmd[0]),
+                  working_dir] + cmd:
+            h.update(backwards.as_bytes(x) + b'\0')
+        # Directories that should be searched for headers & libraries
+        prefix = {}
+        for k in ['include_dirs', 'library_dirs', 'library_libs']:
+            prefix[k] = cls.get_flag_prefix(k)
+        include_dirs = []
+        library_dirs = []
+        libraries = []
+        for x in cmd:
+            if prefix['include_dirs'] and x.startswith(prefix['include_dirs']):
+                include_dirs.append(x[len(prefix['include_dirs']):])
+            elif prefix['library_dirs'] and x.startswith(prefix['library_dirs']):
+                library_dirs.append(x[len(prefix['library_dirs']):])
+            elif prefix['library_libs'] and x.startswith(prefix['library_libs']):
+                libraries.append(x[len(prefix['library_libs']):])
+        # Files in the command and libraries in the library directories
+        files = []
+        for x in cmd[1:]:
+            if not os.path.isabs(x):
+                x = os.path.join(working_dir, x)
+            if (x != out) and os.path.isfile(x):
+                files.append(x)
+        for x in libraries:
+            for d in library_dirs:
+                for fmt in ['lib%s.a', 'lib%s.so', 'lib%s.dylib', '%s.lib']:
+                    ilib = os.path.join(d, fmt % x)
+                    if os.path.isfile(ilib):
+                        files.append(ilib)
+        # Contents of files and headers that they include
+        i = 0
+        while i < len(files):
+            with open(files[i], 'rb') as fd:
+                contents = fd.read()
+            h.update(backwards.as_bytes(files[i]) + b'\0' + contents + b'\0')
+            if cls.tooltype == 'compiler':
+                idirs = [os.path.dirname(files[i])] + include_dirs
+                for incl in _include_regex.findall(contents):
+                    incl = backwards.as_str(incl)
+                    for d in idirs:
+                        iincl = os.path.normpath(os.path.join(d, incl))
+                        if os.path.isfile(iincl):
+                            if iincl not in files:
+                                files.append(iincl)
+                            break
+            i += 1
+        return h.hexdigest()
+
+    @classmethod
+    def get_cache_entry(cls, key):
+        r"""Get the path to the directory containing products for a key in the
+        build cache.
+
+        Args:
+            key (str): Key for products in the build cache.
+
+        Returns:
+            str: Full path to the directory where products are cached. None is
+                returned if the build cache is disabled.
+
+        """
+        cache_dir = get_build_cache_dir()
+        if cache_dir is None:
+            return None
+        return os.path.join(cache_dir, key[:2], key)
+
+    @classmethod
+    def restore_cached_products(cls, key, src, out, products=None):
+        r"""Link products from the build cache into the output directory.
+
+        Args:
+            key (str): Key for products in the build cache.
+            src (list): Input arguments to compilation call that would have been
+                used to generate the output file.
+            out (str): Full path to the primary product.
+            products (list, optional): Existing Python list that restored
+                products should be appended to. Defaults to None and is
+                ignored.
+
+        Returns:
+            bool: True if the products were restored, False otherwise.
+
+        """
+        entry = cls.get_cache_entry(key)
+        if (entry is None) or (not os.path.isfile(
+                os.path.join(entry, os.path.basename(out)))):
+            return False
+        out_dir = os.path.dirname(out)
+        try:
+            for x in sorted(os.listdir(entry)):
+                _link_file(os.path.join(entry, x), os.path.join(out_dir, x))
+        except (OSError, IOError):  # pragma: debug
+            logger.debug("Could not restore cached products for %s" % out)
+            return False
+        tools.touch_cache_entry(entry)
+        if products is not None:
+            cls.append_product(products, src, out)
+        logger.debug("%s %s restored %s from the build cache."
+                     % (cls.tooltype.title(), cls.toolname, out))
+        return True
+
+    @classmethod
+    def add_cached_products(cls, key, src, out):
+        r"""Add products to the build cache. If there are more than the
+        maximum number of entries in the cache afterwards, the least recently
+        used entries are removed.
+
+        Args:
+            key (str): Key for products in the build cache.
+            src (list): Input arguments to compilation call that was used to
+                generate the output file.
+            out (str): Full path to the primary product.
+
+        """
+        entry = cls.get_cache_entry(key)
+        if (entry is None) or os.path.isdir(entry) or (not os.path.isfile(out)):
+            return
+        out_dir = os.path.dirname(out)
+        products = []
+        cls.append_product(products, src, out)
+        tmp = None
+        try:
+            if not os.path.isdir(os.path.dirname(entry)):
+                os.makedirs(os.path.dirname(entry))
+            tmp = tempfile.mkdtemp(dir=os.path.dirname(entry))
+            for x in products:
+                if os.path.isfile(x) and (os.path.dirname(x) == out_dir):
+                    _link_file(x, os.path.join(tmp, os.path.basename(x)))
+            # Rename is atomic so concurrent builds don't see partial entries
+            os.rename(tmp, entry)
+            tmp = None
+        except (OSError, IOError):  # pragma: debug
+            logger.debug("Could not add products for %s to the build cache."
+                         % out)
+        finally:
+            if (tmp is not None) and os.path.isdir(tmp):
+                shutil.rmtree(tmp)
+        tools.prune_cache(get_build_cache_entries(),
+                          get_build_cache_max_entries())
+
     @classmethod
     def call(cls, args, language=None, skip_flags=False, dry_run=False,
              out=None, overwrite=False, products=None, allow_error=False,
@@ -873,14 +1283,23 @@ class CompilationToolBase(object):
                 if out != 'clean':
                     cls.append_product(products, args, out)
                 return out
+        # Use products from the build cache if the inputs are unchanged
+        cache_key = None
+        if (not skip_flags) and (out != 'clean') and cls.cacheable:
+            if get_build_cache_dir() is not None:
+                cache_key = cls.get_cache_key(cmd, out, working_dir=working_dir)
+                if cls.restore_cached_products(cache_key, args, out,
+                                               products=products):
+                    return out
         # Run command
         output = ''
         try:
             if (not skip_flags) and ('env' not in unused_kwargs):
                 unused_kwargs['env'] = cls.set_env()
             logger.debug('Command: "%s"' % ' '.join(cmd))
-            proc = tools.popen_nobuffer(cmd, **unused_kwargs)
-            output, err = proc.communicate()
+            with get_compilation_semaphore():
+                proc = tools.popen_nobuffer(cmd, **unused_kwargs)
+                output, err = proc.communicate()
             output = backwards.as_str(output)
             if (proc.returncode != 0) and (not allow_error):
                 raise RuntimeError("Command '%s' failed with code %d:\n%s."
@@ -905,6 +1324,8 @@ class CompilationToolBase(object):
                 logger.debug("%s %s produced %s"
                              % (cls.tooltype.title(), cls.toolname, out))
                 cls.append_product(products, args, out)
+                if cache_key is not None:
+                    cls.add_cached_products(cache_key, args, out)
             return out
         return output
 
@@ -1282,10 +1703,17 @@ class CompilerBase(CompilationToolBase):
                 kwargs_link = tool.extract_kwargs(kwargs, compiler=cls)
             else:
                 kwargs.pop('linker_language', None)
-            obj_list = []
-            for isrc, iout in zip(args, out_comp):
-                iobj = cls.call(isrc, out=iout, dont_link=True, **kwargs)
-                obj_list.append(iobj)
+            # Compile sources concurrently with separate copies of the
+            # keywords, except for the shared list of products
+            products = kwargs.pop('products', None)
+            tasks = OrderedDict()
+            for i, (isrc, iout) in enumerate(zip(args, out_comp)):
+                ikws = copy.deepcopy(kwargs)
+                ikws['products'] = products
+                tasks[i] = functools.partial(cls.call, isrc, out=iout,
+                                             dont_link=True, **ikws)
+            obj_results = run_compilation_tasks(tasks)
+            obj_list = [obj_results[i] for i in range(len(args))]
             if dont_link:
                 return obj_list
             # Link/archive
@@ -1664,6 +2092,7 @@ class BuildToolBase(CompilerBase):  # pragma: in progress
     tooltype = 'buildtool'
     flag_options = OrderedDict()
     default_buildfile = None
+    cacheable = False
     _schema_properties = {
         'buildfile': {'type': 'string'},
         'builddir': {'type': 'string'},
@@ -1720,6 +2149,9 @@ class CompiledModelDriver(ModelDriver):
             will be determined based on configuration options for the language
             (if present), the linker defaults, and the default_linker_flags
             class attribute.
+        skip_compile (bool, optional): If True, the model will not be compiled
+            when the driver is created and the build method must be called
+            before the model is run. Defaults to False.
         **kwargs: Additional keyword arguments are passed to parent class.
 
     Class Attributes:
@@ -1765,15 +2197,20 @@ class CompiledModelDriver(ModelDriver):
         super(CompiledModelDriver, self).__init__(name, args, **kwargs)
         # Compile
         if not skip_compile:
-            try:
-                self.compile_dependencies()
-                self.compile_model()
-                self.products.append(self.model_file)
-            except BaseException:
-                self.remove_products()
-                raise
-            assert(os.path.isfile(self.model_file))
-            self.debug("Compiled %s", self.model_file)
+            self.build()
+
+    def build(self):
+        r"""Compile the model and any dependencies, removing products if
+        there is an error."""
+        try:
+            self.compile_dependencies()
+            self.compile_model()
+            self.products.append(self.model_file)
+        except BaseException:
+            self.remove_products()
+            raise
+        assert(os.path.isfile(self.model_file))
+        self.debug("Compiled %s", self.model_file)
 
     def parse_arguments(self, args, **kwargs):
         r"""Sort model arguments to determine which one is the executable
@@ -2768,19 +3205,32 @@ class CompiledModelDriver(ModelDriver):
         
     @classmethod
     def compile_dependencies(cls, **kwargs):
-        r"""Compile any required internal libraries, including the interface."""
+        r"""Compile any required internal libraries, including the interface.
+        Libraries that do not depend on each other are compiled concurrently
+        and only one thread compiles dependencies at a time so that models
+        being compiled in parallel do not build the same library."""
         kwargs.setdefault('products', [])
-        base_libraries = []
-        for x in cls.base_languages:
-            base_cls = import_component('model', x)
-            base_libraries.append(base_cls.interface_library)
-            base_cls.compile_dependencies(**kwargs)
-        if (((cls.interface_library is not None) and cls.is_installed()
-             and (cls.interface_library not in base_libraries))):
-            # cls.call_compiler(cls.interface_library)
-            dep_order = cls.get_dependency_order(cls.interface_library)
-            for k in dep_order[::-1]:
-                cls.call_compiler(k, **kwargs)
+        with _dependency_lock:
+            base_libraries = []
+            for x in cls.base_languages:
+                base_cls = import_component('model', x)
+                base_libraries.append(base_cls.interface_library)
+                base_cls.compile_dependencies(**kwargs)
+            if (((cls.interface_library is not None) and cls.is_installed()
+                 and (cls.interface_library not in base_libraries))):
+                # cls.call_compiler(cls.interface_library)
+                dep_order = cls.get_dependency_order(cls.interface_library)
+                tasks = OrderedDict()
+                dependencies = {}
+                for k in dep_order[::-1]:
+                    tasks[k] = functools.partial(cls.call_compiler, k, **kwargs)
+                    dependencies[k] = cls.internal_libraries.get(k, {}).get(
+                        'internal_dependencies', [])
+                jobs = None
+                if kwargs.get('dry_run', False):
+                    jobs = 1
+                run_compilation_tasks(tasks, dependencies=dependencies,
+                                      jobs=jobs)
 
     @classmethod
     def cleanup_dependencies(cls, products=None, **kwargs):
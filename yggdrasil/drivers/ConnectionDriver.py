@@ -4,7 +4,7 @@ import copy
 import numpy as np
 import threading
 from yggdrasil import backwards
-from yggdrasil.communication import new_comm
+from yggdrasil.communication import new_comm, tracing
 from yggdrasil.drivers.Driver import Driver
 from yggdrasil.components import (
     import_component, create_component, isinstance_component)
@@ -38,6 +38,12 @@ class ConnectionDriver(Driver):
         onexit (str, optional): Class method that should be called when a
             model that the connection interacts with exits, but before the
             connection driver is shut down. Defaults to None.
+        forward_batches (bool, optional): If True, the messages remaining
+            from a batch received by the input comm are forwarded together
+            via the output comm's send_batch method. This should only be set
+            if the messages are received via the Python interface as other
+            languages cannot unpack batches. Defaults to False and the
+            messages are forwarded one at a time.
         **kwargs: Additonal keyword arguments are passed to the parent class.
 
     Attributes:
@@ -58,6 +64,8 @@ class ConnectionDriver(Driver):
             loop.
         onexit (str): Class method that should be called when the corresponding
             model exits, but before the driver is shut down.
+        forward_batches (bool): If True, the messages remaining from a
+            received batch are forwarded as a batch.
 
     """
 
@@ -102,7 +110,8 @@ class ConnectionDriver(Driver):
         r"""bool: True if the connection is retreiving output from a model."""
         return (self._direction == 'output')
 
-    def __init__(self, name, translator=None, single_use=False, onexit=None, **kwargs):
+    def __init__(self, name, translator=None, single_use=False, onexit=None,
+                 forward_batches=False, **kwargs):
         super(ConnectionDriver, self).__init__(name, **kwargs)
         # Translator
         if translator is None:
@@ -119,6 +128,7 @@ class ConnectionDriver(Driver):
         if (onexit is not None) and (not hasattr(self, onexit)):
             raise ValueError("onexit '%s' is not a class method." % onexit)
         self.onexit = onexit
+        self.forward_batches = forward_batches
         # Attributes
         self._eof_sent = False
         self.single_use = single_use
@@ -134,6 +144,7 @@ class ConnectionDriver(Driver):
         self.nskip = 0
         self.state = 'started'
         self.close_state = ''
+        self._tracer = tracing.get_tracer()
         # Add comms and print debug info
         self._init_comms(name, **kwargs)
         # self.debug('    env: %s', str(self.env))
@@ -495,6 +506,49 @@ class ConnectionDriver(Driver):
         else:
             return flag
 
+    def forward_batch(self):
+        r"""Receive the messages remaining from a batch received by the input
+        comm, process them, and send them together via the output comm's
+        send_batch method rather than one at a time.
+
+        Returns:
+            bool: Success or failure of send.
+
+        """
+        with self.lock:
+            if self.icomm.is_closed:
+                return False
+            flag, msgs = self.icomm.recv_batch(
+                max_n=self.icomm.n_msg_batch_recv, timeout=0)
+        if not flag:  # pragma: debug
+            return flag
+        self.nrecv += len(msgs)
+        batch = []
+        for msg in msgs:
+            msg = self.on_message(msg)
+            if msg is False:  # pragma: debug
+                self.error('Could not process message.')
+                return False
+            elif self.ocomm.is_empty_send(msg):
+                self.nskip += 1
+                continue
+            batch.append(msg)
+        self.nproc += len(batch)
+        if not batch:
+            return True
+        kwargs = {}
+        if (self._tracer is not None) and (self.last_message_id is not None):
+            kwargs['header_kwargs'] = {'trace_id': self.last_message_id}
+        with self.lock:
+            if self.ocomm.is_closed:
+                return False
+            flag = self.ocomm.send_batch(batch, **kwargs)
+        if flag:
+            self.nsent += len(batch)
+            self.debug('Sent batch of %d messages to %s.', len(batch),
+                       self.ocomm.address)
+        return flag
+
     def on_eof(self):
         r"""Actions to take when EOF received.
 
@@ -522,10 +576,23 @@ class ConnectionDriver(Driver):
         """
         if (self.ocomm._send_serializer) and self.icomm.serializer.initialized:
             self.update_serializer(msg)
+        if (self._tracer is not None) and self.translator:
+            t_start = self._tracer.time()
         for t in self.translator:
             msg = t(msg)
+        if (self._tracer is not None) and self.translator:
+            self._tracer.record('transform', self.name, t_start,
+                                msg_id=self.last_message_id)
         return msg
 
+    @property
+    def last_message_id(self):
+        r"""str: ID of the last message received by the input comm."""
+        header = getattr(self.icomm, '_last_header', None)
+        if isinstance(header, dict):
+            return header.get('trace_id', None)
+        return None
+
     def update_serializer(self, msg):
         r"""Update the serializer for the output comm based on input."""
         sinfo = self.icomm.serializer.typedef
@@ -700,7 +767,7 @@ class ConnectionDriver(Driver):
         if self.icomm.is_empty_recv(msg):
             self.state = 'waiting'
             self.verbose_debug(':run: Waiting for next message.')
-            self.sleep()
+            self.icomm.wait_for_recv(timeout=self.sleeptime)
             return
         self.nrecv += 1
         self.state = 'received'
@@ -730,7 +797,13 @@ class ConnectionDriver(Driver):
         self.debug('Processed message.')
         # Send a message
         self.state = 'sending'
-        ret = self.send_message(msg)
+        if (self._tracer is not None) and (self.last_message_id is not None):
+            # Pass the message ID on so the message can be traced through
+            # the connection
+            ret = self.send_message(
+                msg, header_kwargs={'trace_id': self.last_message_id})
+        else:
+            ret = self.send_message(msg)
         if ret is False:
             self.error('Could not send message.')
             self.set_break_flag()
@@ -739,3 +812,10 @@ class ConnectionDriver(Driver):
         self.nsent += 1
         self.state = 'sent'
         self.debug('Sent message to %s.', self.ocomm.address)
+        # Forward the remainder of a received batch as a batch
+        if ((self.forward_batches and self.icomm.n_msg_batch_recv
+             and (not self.forward_batch()))):
+            self.error('Could not forward batch.')
+            self.set_break_flag()
+            self.set_close_state('sending')
+            return
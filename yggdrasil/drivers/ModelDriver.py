@@ -108,6 +108,11 @@ class ModelDriver(Driver):
         client_of (str, list, optional): The names of one or more servers that
             this model is a client of. Defaults to empty list. Use of client_of
             with function is not currently supported.
+        copies (int, optional): Number of copies of the model that should be
+            run. This is currently only supported for server models
+            (is_server) that do not have any other inputs or outputs.
+            Requests from clients are dispatched to the copy with the fewest
+            outstanding requests. Defaults to 1.
         overwrite (bool, optional): If True, any existing model products
             (compilation products, wrapper scripts, etc.) are removed prior to
             the run. If False, the products are not removed. Defaults to True.
@@ -216,6 +221,7 @@ class ModelDriver(Driver):
             started.
         client_of (list): The names of server models that this model is a
             client of.
+        copies (int): Number of copies of the model that are run.
         with_strace (bool): If True, the command is run with strace or dtrace.
         strace_flags (list): Flags to pass to strace/dtrace.
         with_valgrind (bool): If True, the command is run with valgrind.
@@ -256,6 +262,7 @@ class ModelDriver(Driver):
         'is_server': {'type': 'boolean', 'default': False},
         'client_of': {'type': 'array', 'items': {'type': 'string'},
                       'default': []},
+        'copies': {'type': 'integer', 'default': 1, 'minimum': 1},
         'with_strace': {'type': 'boolean', 'default': False},
         'strace_flags': {'type': 'array',
                          'default': ['-e', 'trace=memory'],
@@ -986,6 +993,10 @@ class ModelDriver(Driver):
         env['YGG_MODEL_INDEX'] = str(self.model_index)
         env['YGG_MODEL_LANGUAGE'] = self.language
         env['YGG_MODEL_NAME'] = self.name
+        if 'YGG_DEFAULT_COMM' not in env:
+            # Prevent the model process from checking every comm/language
+            env['YGG_DEFAULT_COMM'] = import_component(
+                'comm', 'default')._commtype
         return env
 
     def before_start(self, no_queue_thread=False, **kwargs):
@@ -17,6 +17,7 @@ class PythonModelDriver(InterpretedModelDriver):
     supported_comm_options = {
         'ipc': {'platforms': ['MacOS', 'Linux'],
                 'libraries': ['sysv_ipc']},
+        'shm': {'platforms': ['MacOS', 'Linux']},
         'zmq': {'libraries': ['zmq']},
         'rmq': {'libraries': ['pika']}}
     type_map = {
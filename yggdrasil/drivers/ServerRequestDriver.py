@@ -1,3 +1,6 @@
+import copy
+import threading
+from yggdrasil.communication import new_comm
 from yggdrasil.drivers.ConnectionDriver import ConnectionDriver
 from yggdrasil.drivers.ServerResponseDriver import ServerResponseDriver
 from yggdrasil.drivers.ClientRequestDriver import YGG_CLIENT_INI
@@ -17,14 +20,25 @@ class ServerRequestDriver(ConnectionDriver):
             tools.get_default_comm().
         comm_address (str, optional): Address for the client request driver.
             Defaults to None and a new address is generated.
+        copies (int, optional): Number of copies of the server model that
+            requests should be dispatched to. Each request is sent to the
+            copy with the fewest outstanding requests. Defaults to 1.
         **kwargs: Additional keyword arguments are passed to parent class.
 
     Attributes:
         comm (str): The comm class that should be used to communicate
             with the server driver. Defaults to tools.get_default_comm().
         comm_address (str): Address for the client request driver.
-        response_drivers (list): Response drivers created for each request.
+        response_drivers (list): Response drivers created for each request
+            or, for clients that reuse their response address, for each
+            client response address and server model copy.
         nclients (int): Number of clients signed on.
+        worker_comms (list): Comms used to forward requests to each copy of
+            the server model. The first entry is the output comm.
+        worker_env (list): Environment variables that should be passed to
+            each copy of the server model.
+        worker_load (list): Number of outstanding requests for each copy of
+            the server model.
 
     """
 
@@ -32,7 +46,7 @@ class ServerRequestDriver(ConnectionDriver):
     _direction = 'input'
 
     def __init__(self, model_request_name, request_name=None,
-                 comm=None, comm_address=None, **kwargs):
+                 comm=None, comm_address=None, copies=1, **kwargs):
         if request_name is None:
             request_name = model_request_name + '_SERVER'
         # Input communicator
@@ -54,10 +68,27 @@ class ServerRequestDriver(ConnectionDriver):
         super(ServerRequestDriver, self).__init__(model_request_name, **kwargs)
         self.env[self.ocomm.name] = self.ocomm.address
         self.response_drivers = []
+        self._persistent_response_drivers = dict()
         self.nclients = 0
         self.comm = comm
         self.comm_address = self.icomm.address  # opp_address
         self._block_response = False
+        # Comms for additional copies of the server model
+        self.worker_comms = [self.ocomm]
+        try:
+            for i in range(1, copies):
+                self.worker_comms.append(new_comm(**copy.deepcopy(self.ocomm_kws)))
+        except BaseException:
+            self.close_comm()
+            raise
+        self.worker_env = []
+        for x in self.worker_comms:
+            ienv = dict(self.env, **x.opp_comms)
+            ienv[x.name] = x.address
+            self.worker_env.append(ienv)
+        self.worker_load = [0 for x in self.worker_comms]
+        self._request_worker = dict()
+        self._worker_lock = threading.Lock()
 
     @property
     def last_header(self):
@@ -95,10 +126,27 @@ class ServerRequestDriver(ConnectionDriver):
             for x in self.response_drivers:
                 x.terminate()
             self.response_drivers = []
+            self._persistent_response_drivers = dict()
+
+    def open_comm(self):
+        r"""Open the communicators, including those for model copies."""
+        super(ServerRequestDriver, self).open_comm()
+        with self.lock:
+            if self._comm_closed:
+                return
+            try:
+                for x in self.worker_comms[1:]:
+                    x.open()
+            except BaseException:
+                self.close_comm()
+                raise
 
     def close_comm(self):
         r"""Close response drivers."""
         self.close_response_drivers()
+        with self.lock:
+            for x in getattr(self, 'worker_comms', [])[1:]:
+                x.close()
         super(ServerRequestDriver, self).close_comm()
 
     def printStatus(self, *args, **kwargs):
@@ -107,6 +155,29 @@ class ServerRequestDriver(ConnectionDriver):
         for x in self.response_drivers:
             x.printStatus(*args, **kwargs)
 
+    def update_serializer(self, msg):
+        r"""Update the serializers for the output comms based on input."""
+        super(ServerRequestDriver, self).update_serializer(msg)
+        sinfo = self.ocomm.serializer.typedef
+        sinfo.update(self.ocomm.serializer.serializer_info)
+        sinfo.pop('seritype', None)
+        for x in self.worker_comms[1:]:
+            x.serializer.initialize_serializer(sinfo)
+            x.serializer.update_serializer(skip_type=True,
+                                           **self.icomm._last_header)
+
+    def on_response(self, request_id):
+        r"""Record that the server model responded to a request.
+
+        Args:
+            request_id (str): ID of the request that was responded to.
+
+        """
+        with self._worker_lock:
+            worker = self._request_worker.pop(request_id, None)
+            if worker is not None:
+                self.worker_load[worker] -= 1
+
     def on_client_exit(self):
         r"""Close input comm to stop the loop."""
         self.debug('')
@@ -146,8 +217,36 @@ class ServerRequestDriver(ConnectionDriver):
                 return msg
         return super(ServerRequestDriver, self).on_message(msg)
     
+    def _send_message(self, *args, **kwargs):
+        r"""Send a single message to one copy of the server model.
+
+        Args:
+            *args: Arguments are passed to the output comm send method.
+            worker (int, optional): Index of the server model copy that the
+                message should be sent to. Defaults to 0.
+            **kwargs: Keyword arguments are passed to the output comm send
+                method.
+
+        Returns:
+            bool: Success or failure of send.
+
+        """
+        worker = kwargs.pop('worker', 0)
+        if worker == 0:
+            return super(ServerRequestDriver, self)._send_message(*args, **kwargs)
+        with self.lock:
+            x = self.worker_comms[worker]
+            if x.is_closed:
+                return False
+            return x.send(*args, **kwargs)
+
     def send_message(self, *args, **kwargs):
-        r"""Send a single message.
+        r"""Send a single message. If the client uses the same response address
+        for every request, a single response driver is started for that address
+        (and server model copy) and is reused for all subsequent requests from
+        the client. If there are multiple copies of the server model, the
+        request is sent to the copy with the fewest outstanding requests and
+        EOF messages are sent to every copy.
 
         Args:
             *args: Arguments are passed to parent class send_message.
@@ -161,27 +260,60 @@ class ServerRequestDriver(ConnectionDriver):
             return False
         # Start response driver
         is_eof = kwargs.get('is_eof', False)
-        if not is_eof:
-            self.debug("Starting new ServerResponseDriver at: %s" %
-                       self.response_address)
-            with self.lock:
-                if (not self.is_comm_open) or self._block_response:  # pragma: debug
-                    self.debug("Comm closed, not creating response driver.")
-                    return False
+        if is_eof:
+            flag = True
+            for i in range(len(self.worker_comms)):
+                kwargs['worker'] = i
+                if not super(ServerRequestDriver, self).send_message(
+                        *args, **kwargs):
+                    flag = False  # pragma: debug
+            return flag
+        persistent = self.last_header.get('persistent_response', False)
+        with self.lock:
+            if (not self.is_comm_open) or self._block_response:  # pragma: debug
+                self.debug("Comm closed, not creating response driver.")
+                return False
+            with self._worker_lock:
+                worker = min(range(len(self.worker_load)),
+                             key=self.worker_load.__getitem__)
+            response_key = (self.response_address, worker)
+            response_driver = None
+            if persistent:
+                response_driver = self._persistent_response_drivers.get(
+                    response_key, None)
+                if (response_driver is not None) and (not response_driver.is_valid):
+                    response_driver = None  # pragma: debug
+            if response_driver is None:
+                self.debug("Starting new ServerResponseDriver at: %s" %
+                           self.response_address)
                 drv_args = [self.response_address]
                 drv_kwargs = dict(comm=self.comm, msg_id=self.request_id,
-                                  request_name=self.name)
+                                  request_name=self.name,
+                                  persistent=persistent,
+                                  on_response=self.on_response)
                 try:
-                    response_driver = ServerResponseDriver(*drv_args, **drv_kwargs)
+                    response_driver = ServerResponseDriver(*drv_args,
+                                                           **drv_kwargs)
                     self.response_drivers.append(response_driver)
                     response_driver.start()
                     self.debug("ServerResponseDriver started.")
                 except BaseException:  # pragma: debug
                     self.exception("Could not create/start response driver.")
                     return False
-            # Send response address in header
-            kwargs.setdefault('header_kwargs', {})
-            kwargs['header_kwargs'].setdefault(
-                'response_address', response_driver.model_response_address)
-            kwargs['header_kwargs'].setdefault('request_id', self.request_id)
+                if persistent:
+                    self._persistent_response_drivers[
+                        response_key] = response_driver
+            if persistent:
+                response_driver.add_request(self.request_id)
+            with self._worker_lock:
+                self.worker_load[worker] += 1
+                self._request_worker[self.request_id] = worker
+        # Send response address in header
+        kwargs.setdefault('header_kwargs', {})
+        kwargs['header_kwargs'].setdefault(
+            'response_address', response_driver.model_response_address)
+        kwargs['header_kwargs'].setdefault('request_id', self.request_id)
+        if persistent:
+            kwargs['header_kwargs'].setdefault('persistent_response', True)
+        kwargs['worker'] = worker
         return super(ServerRequestDriver, self).send_message(*args, **kwargs)
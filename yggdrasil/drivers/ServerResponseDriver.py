@@ -1,4 +1,5 @@
 import uuid
+import collections
 from yggdrasil.drivers.ConnectionDriver import ConnectionDriver
 
 
@@ -13,6 +14,13 @@ class ServerResponseDriver(ConnectionDriver):
             tools.get_default_comm().
         msg_id (str, optional): ID associate with the request message this
             driver was created to respond to. Defaults to new unique ID.
+        persistent (bool, optional): If True, the driver will forward the
+            responses to all requests from a client that uses the same
+            response address for every request. Otherwise, the driver is
+            stopped after forwarding a single response. Defaults to False.
+        on_response (callable, optional): Function that should be called
+            with the request ID each time a response is received from the
+            server model. Defaults to None.
         **kwargs: Additional keyword arguments are passed to parent class.
 
     Attributes:
@@ -20,13 +28,21 @@ class ServerResponseDriver(ConnectionDriver):
             with the server driver. Defaults to tools.get_default_comm().
         msg_id (str): ID associate with the request message this driver was
             created to respond to.
+        persistent (bool): If True, the driver forwards responses to multiple
+            requests.
+        pending_requests (collections.deque): IDs of the requests forwarded
+            to the server model that have not been responded to, in the order
+            they were forwarded.
+        on_response (callable): Function called with the request ID each
+            time a response is received from the server model.
 
     """
 
     _connection_type = None
 
     def __init__(self, response_address, comm=None, msg_id=None,
-                 request_name=None, **kwargs):
+                 request_name=None, persistent=False, on_response=None,
+                 **kwargs):
         if msg_id is None:
             msg_id = str(uuid.uuid4())
         response_name = 'ServerResponse.%s' % msg_id
@@ -37,6 +53,7 @@ class ServerResponseDriver(ConnectionDriver):
         icomm_kws['comm'] = None
         icomm_kws['name'] = 'server_model_response.' + msg_id
         icomm_kws['is_response_server'] = True
+        icomm_kws['skip_component_schema_normalization'] = True
         kwargs['icomm_kws'] = icomm_kws
         # Output communicator to client response driver
         ocomm_kws = kwargs.get('ocomm_kws', {})
@@ -44,12 +61,19 @@ class ServerResponseDriver(ConnectionDriver):
         ocomm_kws['name'] = response_name
         if response_address is not None:
             ocomm_kws['address'] = response_address
+        ocomm_kws['skip_component_schema_normalization'] = True
         kwargs['ocomm_kws'] = ocomm_kws
         # Overall keywords
-        kwargs['single_use'] = True
+        kwargs['single_use'] = (not persistent)
+        kwargs.setdefault('skip_component_schema_normalization', True)
         super(ServerResponseDriver, self).__init__(response_name, **kwargs)
         self.comm = comm
         self.msg_id = msg_id
+        self.persistent = persistent
+        self.on_response = on_response
+        self.pending_requests = collections.deque()
+        if not persistent:
+            self.pending_requests.append(msg_id)
         
     @property
     def model_response_name(self):
@@ -68,3 +92,53 @@ class ServerResponseDriver(ConnectionDriver):
         r"""str: The address of the channel used to send responses to the client
         response driver."""
         return self.ocomm.address
+
+    def add_request(self, request_id):
+        r"""Register a request that has been forwarded to the server model and
+        that this driver will receive the response for.
+
+        Args:
+            request_id (str): ID of the request.
+
+        """
+        with self.lock:
+            self.pending_requests.append(request_id)
+
+    def send_eof(self):
+        r"""Response channels are not closed with an EOF message.
+
+        Returns:
+            bool: False as no message is sent.
+
+        """
+        return False
+
+    def send_message(self, *args, **kwargs):
+        r"""Send a response with the ID of the request it belongs to in the
+        header. If the server model did not return the request ID, responses
+        are assumed to be in the same order as the requests.
+
+        Args:
+            *args: Arguments are passed to parent class send_message.
+            **kwargs: Keyword arguments are passed to parent class send_message.
+
+        Returns:
+            bool: Success or failure of send.
+
+        """
+        header = self.icomm._last_header
+        request_id = None
+        if isinstance(header, dict):
+            request_id = header.get('request_id', None)
+        with self.lock:
+            if request_id is None:
+                if self.pending_requests:
+                    request_id = self.pending_requests.popleft()
+            elif request_id in self.pending_requests:
+                self.pending_requests.remove(request_id)
+        if request_id is not None:
+            if self.on_response is not None:
+                self.on_response(request_id)
+            kwargs.setdefault('header_kwargs', {})
+            kwargs['header_kwargs'].setdefault('request_id', request_id)
+        return super(ServerResponseDriver, self).send_message(*args, **kwargs)
@@ -1,4 +1,8 @@
 import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
 from yggdrasil.config import ygg_cfg
 from yggdrasil.tests import assert_equal, assert_raises, YggTestClass
 from yggdrasil.drivers import CompiledModelDriver
@@ -43,6 +47,104 @@ def test_CompilationToolBase():
                   invalid='invalid')
 
 
+def test_build_cache():
+    r"""Test reuse of compilation products from the build cache and removal
+    of the least recently used products."""
+    from yggdrasil.drivers.CModelDriver import CModelDriver
+    if not CModelDriver.is_language_installed():  # pragma: no cover
+        return
+    tool = CModelDriver.get_tool('compiler')
+    old_cfg = {k: ygg_cfg.get('compilation', k, '') for k in
+               ['cache', 'cache_dir', 'cache_max_entries']}
+    cache_dir = tempfile.mkdtemp()
+    working_dir = tempfile.mkdtemp()
+    ygg_cfg.set('compilation', 'cache', 'True')
+    ygg_cfg.set('compilation', 'cache_dir', cache_dir)
+    ygg_cfg.set('compilation', 'cache_max_entries', '2')
+    try:
+        assert_equal(CompiledModelDriver.get_build_cache_dir(), cache_dir)
+        src = os.path.join(working_dir, 'cache_test.c')
+        hdr = os.path.join(working_dir, 'cache_test.h')
+        out = os.path.join(working_dir, 'cache_test.o')
+        with open(src, 'w') as fd:
+            fd.write('#include "cache_test.h"\nint test(void) { return X; }\n')
+
+        def compile_key(x):
+            with open(hdr, 'w') as fd:
+                fd.write('#define X %d\n' % x)
+            products = []
+            assert_equal(tool.call(src, out=out, dont_link=True, overwrite=True,
+                                   products=products, working_dir=working_dir),
+                         out)
+            assert(out in products)
+            return sorted(CompiledModelDriver.get_build_cache_entries())
+
+        keys1 = compile_key(1)
+        assert_equal(len(keys1), 1)
+        ino = os.stat(out).st_ino
+        # Unchanged inputs are linked from the cache
+        assert_equal(compile_key(1), keys1)
+        assert_equal(os.stat(out).st_ino, ino)
+        # Changes to an included header result in a new entry
+        assert_equal(len(compile_key(2)), 2)
+        # The least recently used entry is removed once the limit is reached
+        os.utime(keys1[0], (0, 0))
+        keys3 = compile_key(3)
+        assert_equal(len(keys3), 2)
+        assert(keys1[0] not in keys3)
+        # Cache can be disabled
+        ygg_cfg.set('compilation', 'cache', 'False')
+        assert_equal(CompiledModelDriver.get_build_cache_dir(), None)
+        compile_key(4)
+        ygg_cfg.set('compilation', 'cache', 'True')
+        assert_equal(sorted(CompiledModelDriver.get_build_cache_entries()),
+                     keys3)
+    finally:
+        for k, v in old_cfg.items():
+            ygg_cfg.set('compilation', k, v)
+        shutil.rmtree(cache_dir)
+        shutil.rmtree(working_dir)
+
+
+def test_run_compilation_tasks():
+    r"""Test running compilation tasks concurrently in dependency order."""
+    order = []
+    lock = threading.Lock()
+
+    def task(x):
+        def run():
+            with lock:
+                order.append(x)
+            return x * 2
+        return run
+
+    def error():
+        raise ValueError("Test error")
+
+    tasks = OrderedDict([(x, task(x)) for x in 'abcd'])
+    dependencies = {'a': ['b', 'c'], 'b': ['d'], 'c': ['d', 'e']}
+    for jobs in [1, 3]:
+        order[:] = []
+        assert_equal(CompiledModelDriver.run_compilation_tasks(
+            tasks, dependencies=dependencies, jobs=jobs),
+            {x: x * 2 for x in 'abcd'})
+        assert_equal(order[0], 'd')
+        assert_equal(order[-1], 'a')
+    assert_equal(CompiledModelDriver.run_compilation_tasks(OrderedDict()), {})
+    tasks['e'] = error
+    try:
+        CompiledModelDriver.run_compilation_tasks(
+            tasks, dependencies=dependencies, jobs=2)
+    except ValueError as e:
+        assert_equal(e.task_name, 'e')
+    else:  # pragma: debug
+        raise AssertionError("Error in task not raised.")
+    tasks.pop('e')
+    dependencies['d'] = ['a']
+    assert_raises(RuntimeError, CompiledModelDriver.run_compilation_tasks,
+                  tasks, dependencies=dependencies)
+
+
 class DummyCompiler(CompiledModelDriver.CompilerBase):
     r"""Dummy test class."""
     _dont_register = True
@@ -29,7 +29,8 @@ class TestConnectionParam(parent.TestParam):
     def __init__(self, *args, **kwargs):
         super(TestConnectionParam, self).__init__(*args, **kwargs)
         self.attr_list += ['icomm_kws', 'ocomm_kws', 'icomm', 'ocomm',
-                           'nrecv', 'nproc', 'nsent', 'state', 'translator']
+                           'nrecv', 'nproc', 'nsent', 'state', 'translator',
+                           'forward_batches']
         # self.timeout = 1.0
 
     @property
@@ -351,6 +352,24 @@ class TestConnectionDriver(TestConnectionParam, parent.TestDriver):
         if self.comm_name != 'CommBase':
             self.assert_equal(self.instance.n_msg, 0)
 
+    def test_send_recv_batch(self):
+        r"""Test that batches are only forwarded as batches if
+        forward_batches is set and are otherwise forwarded as individual
+        messages."""
+        nbatch = 3
+        flag = self.send_comm.send_batch([self.test_msg for _ in range(nbatch)])
+        if self.comm_name == 'CommBase':
+            return
+        assert(flag)
+        nbuffered = 0
+        for i in range(nbatch * self.nmsg_recv):
+            flag, msg_recv = self.recv_comm.recv(timeout=self.timeout)
+            assert(flag)
+            self.assert_msg_equal(msg_recv, self.test_msg)
+            nbuffered = max(nbuffered, self.recv_comm.n_msg_batch_recv)
+        self.assert_equal(nbuffered > 0, self.instance.forward_batches)
+        self.assert_equal(self.instance.n_msg, 0)
+
     def test_send_recv_nolimit(self):
         r"""Test sending/receiving large message."""
         assert(len(self.msg_long) > self.maxMsgSize)
@@ -381,7 +400,18 @@ class TestConnectionDriver(TestConnectionParam, parent.TestDriver):
         assert(self.instance.is_comm_closed)
 
 
-class TestConnectionDriverFork(TestConnectionDriver):
+class TestConnectionDriverForwardBatches(TestConnectionDriver):
+    r"""Test class for the ConnectionDriver class forwarding batches."""
+
+    @property
+    def inst_kwargs(self):
+        r"""dict: Keyword arguments for tested class."""
+        out = super(TestConnectionDriverForwardBatches, self).inst_kwargs
+        out['forward_batches'] = True
+        return out
+
+
+class TestConnectionDriverFork(TestConnectionDriverForwardBatches):
     r"""Test class for the ConnectionDriver class between fork comms."""
 
     def setup(self, *args, **kwargs):
@@ -99,6 +99,11 @@ class TestFileInputDriver(TestFileInputParam, parent.TestConnectionDriver):
         r"""Disabled: Test sending/receiving large message."""
         pass  # pragma: no cover
 
+    @unittest.skipIf(True, 'File driver')
+    def test_send_recv_batch(self):
+        r"""Disabled: Test that batches are forwarded as batches."""
+        pass  # pragma: no cover
+
 
 # Dynamically create tests based on registered file classes
 s = get_schema()
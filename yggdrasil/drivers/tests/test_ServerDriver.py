@@ -2,6 +2,7 @@ import uuid
 from yggdrasil.tests import assert_raises, assert_equal
 import yggdrasil.drivers.tests.test_ConnectionDriver as parent
 from yggdrasil import runner, tools
+from yggdrasil.communication import new_comm
 
 
 class TestServerParam(parent.TestConnectionParam):
@@ -168,3 +169,54 @@ class TestServerDriver(TestServerParam, parent.TestConnectionDriver):
     def test_send_recv_nolimit(self):
         r"""Test routing of a large message between client and server."""
         self.test_send_recv(msg_send=self.msg_long)
+
+    def test_send_recv_batch(self):
+        r"""Disabled: Requests and responses are not sent as batches."""
+        pass
+
+
+class TestServerDriverCopies(TestServerDriver):
+    r"""Test class for ServerDriver class with multiple server model copies."""
+
+    @property
+    def inst_kwargs(self):
+        r"""dict: Keyword arguments for tested class."""
+        out = super(TestServerDriverCopies, self).inst_kwargs
+        out['copies'] = 2
+        return out
+
+    def test_worker_env(self):
+        r"""Test that each copy gets a different request address."""
+        assert_equal(len(self.instance.worker_comms), 2)
+        assert_equal(len(self.instance.worker_env), 2)
+        addresses = [x.address for x in self.instance.worker_comms]
+        for env, x in zip(self.instance.worker_env, addresses):
+            assert_equal(env[self.instance.ocomm.name], x)
+        assert(addresses[0] != addresses[1])
+
+    def test_send_recv_copies(self):
+        r"""Test dispatch of requests to the least busy copy."""
+        recv_kws = self.instance.worker_comms[1].opp_comm_kwargs()
+        recv_kws['comm'] = 'ServerComm'
+        recv_comm2 = new_comm(self.name + '_copy1', **recv_kws)
+        try:
+            msgs = [self.test_msg + b'1', self.test_msg + b'2']
+            futures = [self.send_comm.call_async(x) for x in msgs]
+            # Each copy gets one request
+            for x, msg in zip([self.recv_comm, recv_comm2], msgs):
+                flag, srv_msg = x.recv(timeout=self.route_timeout)
+                assert(flag)
+                assert_equal(srv_msg, msg)
+            assert_equal(self.instance.worker_load, [1, 1])
+            # Respond out of order
+            flag = recv_comm2.send(msgs[1])
+            assert(flag)
+            flag = self.recv_comm.send(msgs[0])
+            assert(flag)
+            for x, msg in zip(futures, msgs):
+                flag, cli_msg = x.result(timeout=self.route_timeout)
+                assert(flag)
+                assert_equal(cli_msg, msg)
+            assert_equal(self.instance.worker_load, [0, 0])
+        finally:
+            recv_comm2.close()
@@ -52,3 +52,7 @@ class TestServerResponseDriver(TestServerResponseParam,
         super(TestServerResponseDriver, self).test_send_recv_nolimit()
         assert(self.instance._used)
         assert(not self.instance.is_valid)
+
+    def test_send_recv_batch(self):
+        r"""Disabled: Requests and responses are not sent as batches."""
+        pass
@@ -139,7 +139,9 @@ def YggRpcServer(name, infmt='%s', outfmt='%s'):
 
 def YggRpcClient(name, outfmt='%s', infmt='%s'):
     r"""Get class for handling requests and response to an RPC Server from a
-    client.
+    client. In addition to call, the returned comm provides call_async for
+    sending a request without waiting for the response and call_many for
+    sending a set of requests before gathering their responses.
 
     Args:
         name (str): The name of the server queues.
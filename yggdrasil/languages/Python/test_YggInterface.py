@@ -415,6 +415,24 @@ class TestYggRpcClient(TestYggOutput):
             msg_flag, msg_recv = self.instance.recv(self.timeout)
             assert(msg_flag)
             self.assert_equal(msg_recv, msg)
+
+    def test_call_many(self):
+        r"""Test pipelined calls."""
+        msgs = 2 * self.messages
+
+        def echo():
+            for i in range(len(msgs)):
+                flag, msg = self.test_comm.recv(self.timeout)
+                assert(flag)
+                flag = self.test_comm.send(msg)
+                assert(flag)
+
+        self.test_comm.sched_task(0.0, echo)
+        out = self.instance.call_many(msgs, timeout=self.timeout)
+        self.assert_equal(len(out), len(msgs))
+        for (msg_flag, msg_recv), msg in zip(out, msgs):
+            assert(msg_flag)
+            self.assert_equal(msg_recv, msg)
         
         
 class TestYggRpcClientMatlab(TestYggRpcClient):
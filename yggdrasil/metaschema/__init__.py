@@ -1,7 +1,10 @@
 import os
 import copy
 import pprint
+import threading
+import contextlib
 import jsonschema
+from collections import OrderedDict
 import yggdrasil
 from yggdrasil import backwards
 from yggdrasil.metaschema.encoder import encode_json, decode_json
@@ -16,6 +19,8 @@ _metaschema_fname = os.path.abspath(os.path.join(
     os.path.dirname(yggdrasil.__file__), _metaschema_fbase))
 _metaschema = None
 _validator = None
+_validator_cache = threading.local()
+_validator_cache_size = 128
 _base_schema = {u'$schema': u'http://json-schema.org/draft-04/schema'}
 
 
@@ -102,6 +107,19 @@ def get_metaschema():
     return copy.deepcopy(_metaschema)
 
 
+def get_metaschema_property_names():
+    r"""Get the names of the properties in the metaschema without copying it.
+
+    Returns:
+        list: Metaschema property names.
+
+    """
+    global _metaschema
+    if (_metaschema is None):
+        _metaschema = create_metaschema()
+    return list(_metaschema['properties'].keys())
+
+
 def get_validator(overwrite=False, normalizers=None, **kwargs):
     r"""Return the validator that includes ygg expansion types.
 
@@ -170,6 +188,72 @@ def validate_schema(obj):
     cls.check_schema(obj)
 
 
+def get_schema_key(schema):
+    r"""Get a key that uniquely identifies a schema based on its contents.
+
+    Args:
+        schema (dict): Schema to get a key for.
+
+    Returns:
+        str: JSON encoding of the schema with sorted keys or None if the
+            schema cannot be encoded.
+
+    """
+    try:
+        return encode_json(schema)
+    except (TypeError, ValueError):  # pragma: debug
+        return None
+
+
+@contextlib.contextmanager
+def cached_validator(schema, normalize=False, schema_key=None):
+    r"""Context that yields a validator instance for a schema. The schema is
+    only checked against the metaschema the first time it is encountered
+    and the validator instance is reused for subsequent calls with a schema
+    that has the same contents. Validators are cached for each thread and
+    the least recently used are discarded once there are more than
+    _validator_cache_size. Instances are removed from the cache while in use
+    so that recursive calls with the same schema get a new instance.
+
+    Args:
+        schema (dict): Schema that the validator should use.
+        normalize (bool, optional): If True, the validator will be used for
+            normalization, which stores state on the instance, so a new
+            instance is created for the cached schema. Defaults to False.
+        schema_key (str, optional): Key identifying the schema in the cache
+            that was previously returned by get_schema_key for the schema.
+            Defaults to None and the key is computed from the schema.
+
+    Yields:
+        jsonschema.IValidator: Validator instance for the schema.
+
+    """
+    cls = get_validator()
+    if getattr(_validator_cache, 'cls', None) is not cls:
+        _validator_cache.cls = cls
+        _validator_cache.validators = OrderedDict()
+    cache = _validator_cache.validators
+    key = schema_key
+    if key is None:
+        key = get_schema_key(schema)
+    out = None
+    if key is not None:
+        out = cache.pop(key, None)
+    if out is None:
+        cls.check_schema(schema)
+        out = cls(copy.deepcopy(schema))
+    try:
+        if normalize:
+            yield cls(out.schema)
+        else:
+            yield out
+    finally:
+        if key is not None:
+            cache[key] = out
+            while len(cache) > _validator_cache_size:
+                cache.popitem(last=False)
+
+
 # def normalize_schema(obj):
 #     r"""Normalize a schema against the metaschema.
 
@@ -190,15 +274,19 @@ def validate_instance(obj, schema, **kwargs):
     Args:
         obj (object): Object to be validated using the provided schema.
         schema (dict): Schema to use to validate the provided object.
+        schema_key (str, optional): Key identifying the schema in the
+            validator cache. Defaults to None and the key is computed from
+            the schema.
         **kwargs: Additional keyword arguments are passed to validate.
 
     Raises:
         ValidationError: If the object is not valid.
 
     """
-    cls = get_validator()
-    cls.check_schema(schema)
-    return cls(schema).validate(obj, **kwargs)
+    schema_key = kwargs.pop('schema_key', None)
+    with cached_validator(schema, normalize=kwargs.get('normalize', False),
+                          schema_key=schema_key) as v:
+        return v.validate(obj, **kwargs)
 
 
 def normalize_instance(obj, schema, **kwargs):
@@ -213,9 +301,8 @@ def normalize_instance(obj, schema, **kwargs):
         object: Normalized instance.
 
     """
-    cls = get_validator()
-    cls.check_schema(schema)
-    return cls(schema).normalize(obj, **kwargs)
+    with cached_validator(schema, normalize=True) as v:
+        return v.normalize(obj, **kwargs)
 
 
 def import_all_classes():
@@ -1,5 +1,6 @@
 import jsonschema
 import copy
+from yggdrasil.metaschema import validate_instance
 from yggdrasil.metaschema.datatypes import compare_schema
 from yggdrasil.metaschema.datatypes.MetaschemaType import MetaschemaType
 
@@ -177,8 +178,7 @@ class FixedMetaschemaType(MetaschemaType):
                                                         raise_errors=raise_errors):
             return False
         try:
-            jsonschema.validate(obj, cls.updated_fixed_properties(obj),
-                                cls=cls.validator())
+            validate_instance(obj, cls.updated_fixed_properties(obj))
         except (jsonschema.exceptions.ValidationError, AssertionError):
             if raise_errors:
                 raise
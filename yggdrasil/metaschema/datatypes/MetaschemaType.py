@@ -4,12 +4,13 @@ import uuid
 import pprint
 import importlib
 import jsonschema
-from yggdrasil import backwards, tools
+import numpy as np
+from yggdrasil import backwards, tools, units
 from yggdrasil.metaschema import (get_metaschema, get_validator, encoder,
                                   validate_instance)
 from yggdrasil.metaschema.datatypes import (
     MetaschemaTypeError, MetaschemaTypeMeta, compare_schema, YGG_MSG_HEAD,
-    get_type_class, conversions, is_default_typedef)
+    get_type_class, conversions, is_default_typedef, binary_buffers)
 from yggdrasil.metaschema.properties import get_metaschema_property
 
 
@@ -17,6 +18,69 @@ def _get_single_array_element(arr):
     return arr[0]
 
 
+def _align_buffer(n, alignment=8):
+    r"""Get the number of padding bytes required to align a position.
+
+    Args:
+        n (int): Position that should be aligned.
+        alignment (int, optional): Alignment in bytes. Defaults to 8.
+
+    Returns:
+        int: Number of bytes that should be added to n.
+
+    """
+    return (alignment - (n % alignment)) % alignment
+
+
+def _type_signature(obj):
+    r"""Get a signature for an object that can be compared cheaply to
+    determine if two objects will have the same encoded type metadata.
+
+    Args:
+        obj (object): Object to get the signature for.
+
+    Returns:
+        tuple: Python type, dtype, shape, units, and lengths of the object
+            and its members, or None if a signature cannot be determined
+            without encoding the type.
+
+    """
+    if hasattr(obj, 'units'):
+        out = _type_signature(units.get_data(obj))
+        if out is not None:
+            out = (type(obj), units.get_units(obj), out)
+    elif isinstance(obj, np.ndarray):
+        out = None
+        if not obj.dtype.hasobject:
+            out = (type(obj), obj.dtype, obj.shape)
+    elif isinstance(obj, np.generic):
+        out = (type(obj), obj.dtype)
+    elif isinstance(obj, (backwards.bytes_type, backwards.unicode_type)):
+        out = (type(obj), len(obj))
+    elif isinstance(obj, six.integer_types) and not isinstance(obj, bool):
+        # The precision of Python integers depends on their value
+        out = (type(obj), np.asarray(obj).dtype)
+    elif isinstance(obj, (bool, float, complex, type(None))):
+        out = (type(obj), )
+    elif isinstance(obj, (list, tuple)):
+        out = [type(obj)]
+        for x in obj:
+            out.append(_type_signature(x))
+            if out[-1] is None:
+                return None
+        out = tuple(out)
+    elif isinstance(obj, dict):
+        out = [type(obj)]
+        for k, v in obj.items():
+            out.append((k, _type_signature(v)))
+            if out[-1][1] is None:
+                return None
+        out = tuple(out)
+    else:
+        out = None
+    return out
+
+
 @six.add_metaclass(MetaschemaTypeMeta)
 class MetaschemaType(object):
     r"""Base type that should be subclassed by user defined types. Attributes
@@ -93,6 +157,8 @@ class MetaschemaType(object):
     
     def __init__(self, **typedef):
         self._typedef = {}
+        self._encode_cache = None
+        self._decode_cache = None
         typedef.setdefault('type', self.name)
         self.update_typedef(**typedef)
 
@@ -332,6 +398,9 @@ class MetaschemaType(object):
                 updated to.
 
         """
+        # Metadata cached for the previous type definition may no longer apply
+        self._encode_cache = None
+        self._decode_cache = None
         typename0 = self._typedef.get('type', None)
         typename1 = kwargs.get('type', None)
         # Check typename to make sure this is possible
@@ -573,7 +642,23 @@ class MetaschemaType(object):
         # Encode
         metadata = cls.encode_type(obj_t, typedef=typedef)
         data = cls.encode_data(obj_t, metadata)
-        # Add extra keyword arguments to metadata, ensuring type not overwritten
+        cls._add_metadata_kwargs(metadata, kwargs)
+        return metadata, data
+
+    @classmethod
+    def _add_metadata_kwargs(cls, metadata, kwargs):
+        r"""Add extra keyword arguments to metadata, ensuring type is not
+        overwritten.
+
+        Args:
+            metadata (dict): Metadata produced by the type encoder.
+            kwargs (dict): Extra keyword arguments to add to metadata.
+
+        Raises:
+            RuntimeError: If a keyword argument conflicts with a value set
+                by the type encoder.
+
+        """
         for k, v in kwargs.items():
             if (k in metadata) and (v != metadata[k]):
                 error_str = ("Key '%s' set by the type encoder.\n"
@@ -582,7 +667,6 @@ class MetaschemaType(object):
                                  k, pprint.pformat(v), pprint.pformat(metadata[k]))
                 raise RuntimeError(error_str)
             metadata[k] = v
-        return metadata, data
 
     @classmethod
     def decode(cls, metadata, data, typedef=None, typedef_validated=False,
@@ -632,8 +716,70 @@ class MetaschemaType(object):
         out = cls.transform_type(out, typedef)
         return out
 
+    def encode_fixed(self, obj, **kwargs):
+        r"""Encode an object that is not checked against the instance's type
+        definition (e.g. once the type of messages on a connection is fixed).
+        If the object has the same signature (type, dtype, shape, units) as
+        the previously encoded object and coercing/transforming that object
+        did not change its signature, the cached type metadata is reused
+        without re-encoding the type.
+
+        Args:
+            obj (object): Object to encode.
+            **kwargs: Additional keyword arguments are added to the metadata.
+
+        Returns:
+            tuple(dict, bytes): Encoded object with type definition and data
+                serialized to bytes.
+
+        """
+        key = _type_signature(obj)
+        if (key is not None) and self._encode_cache and (key == self._encode_cache[0]):
+            obj_t = obj
+            metadata = dict(self._encode_cache[1])
+        else:
+            obj_c = self.coerce_type(obj, typedef=self._typedef,
+                                     typedef_validated=True, **kwargs)
+            obj_t = self.transform_type(obj_c, self._typedef)
+            metadata = self.encode_type(obj_t, typedef=self._typedef)
+            if (key is not None) and (_type_signature(obj_t) == key):
+                self._encode_cache = (key, dict(metadata))
+            else:
+                self._encode_cache = None
+        data = self.encode_data(obj_t, metadata)
+        self._add_metadata_kwargs(metadata, kwargs)
+        return metadata, data
+
+    def decode_fixed(self, metadata, data):
+        r"""Decode an object without checking the metadata against the
+        instance's type definition. If the metadata matches the instance's
+        type and the decoded object has the same signature as the previously
+        decoded object, the type transformation is skipped when it did not
+        change the previous object.
+
+        Args:
+            metadata (dict): Meta data describing the data.
+            data (bytes): Encoded data.
+
+        Returns:
+            object: Decoded object.
+
+        """
+        if metadata.get('type', None) != self.name:
+            return self.decode(metadata, data, self._typedef,
+                               typedef_validated=True, dont_check=True)
+        out = self.decode_data(data, metadata)
+        key = _type_signature(out)
+        if (key is None) or (key != self._decode_cache):
+            out = self.transform_type(out, self._typedef)
+            if (key is not None) and (_type_signature(out) == key):
+                self._decode_cache = key
+            else:
+                self._decode_cache = None
+        return out
+
     def serialize(self, obj, no_metadata=False, dont_encode=False,
-                  dont_check=False, **kwargs):
+                  dont_check=False, binary=False, batch=False, **kwargs):
         r"""Serialize a message.
 
         Args:
@@ -646,12 +792,29 @@ class MetaschemaType(object):
             dont_check (bool, optional): If True, the object being serialized
                 will not be checked against the type definition. Defaults to
                 False.
+            binary (bool, optional): If True, array data will be appended to
+                the JSON serialization as raw buffers rather than being base64
+                encoded within it. The offset and size of each buffer is
+                recorded in the 'binary_buffers' header entry. Messages
+                serialized in this way can only be deserialized by Python.
+                Defaults to False.
+            batch (bool, optional): If True, obj is a list of objects of this
+                type that are serialized into a single message with one
+                header. Only the first object is checked against the type
+                definition and all of the objects must have the same type
+                metadata. The number of objects is recorded in the 'batch'
+                header entry. Defaults to False.
             **kwargs: Additional keyword arguments are added to the metadata.
 
         Returns:
             bytes, str: Serialized message.
 
+        Raises:
+            ValueError: If batch is True and obj is empty or the objects
+                do not share the same type metadata.
+
         """
+        buffers = None
         if ((isinstance(obj, backwards.bytes_type)
              and ((obj == tools.YGG_MSG_EOF) or kwargs.get('raw', False)
                   or dont_encode))):
@@ -659,17 +822,55 @@ class MetaschemaType(object):
             data = obj
             is_raw = True
         else:
-            metadata, data = self.encode(obj, typedef=self._typedef,
-                                         typedef_validated=True,
-                                         dont_check=dont_check, **kwargs)
-            is_raw = False
-        for k in ['size', 'data']:
+            if binary and (not no_metadata):
+                buffers = []
+            with binary_buffers(buffers):
+                if batch:
+                    if len(obj) == 0:
+                        raise ValueError("Cannot serialize an empty batch.")
+                    metadata, data = self.encode(obj[0], typedef=self._typedef,
+                                                 typedef_validated=True,
+                                                 dont_check=dont_check, **kwargs)
+                    data = [data]
+                    for x in obj[1:]:
+                        imetadata, idata = self.encode_fixed(x, **kwargs)
+                        if imetadata != metadata:
+                            raise ValueError(("Batched objects must have the "
+                                              "same type metadata.\n"
+                                              "First object:\n%s\n"
+                                              "Object %d:\n%s")
+                                             % (pprint.pformat(metadata),
+                                                len(data),
+                                                pprint.pformat(imetadata)))
+                        data.append(idata)
+                elif dont_check:
+                    metadata, data = self.encode_fixed(obj, **kwargs)
+                else:
+                    metadata, data = self.encode(obj, typedef=self._typedef,
+                                                 typedef_validated=True, **kwargs)
+                is_raw = False
+        for k in ['size', 'data', 'binary_buffers', 'batch']:
             if k in metadata:
                 raise RuntimeError("'%s' is a reserved keyword in the metadata." % k)
+        if batch:
+            metadata['batch'] = len(data)
         if not is_raw:
-            data = encoder.encode_json(data)
+            with binary_buffers(buffers):
+                data = encoder.encode_json(data)
         if no_metadata:
             return data
+        if buffers:
+            parts = [data]
+            offset = len(data)
+            metadata['binary_buffers'] = []
+            for x in buffers:
+                pad = _align_buffer(offset)
+                parts.append(pad * b' ')
+                offset += pad
+                metadata['binary_buffers'].append([offset, x.nbytes])
+                parts.append(x)
+                offset += x.nbytes
+            data = b''.join(parts)
         metadata['size'] = len(data)
         metadata.setdefault('id', str(uuid.uuid4()))
         metadata = encoder.encode_json(metadata)
@@ -704,10 +905,20 @@ class MetaschemaType(object):
         if not isinstance(msg, backwards.bytes_type):
             raise TypeError("Message to be deserialized is not bytes type.")
         # Check for header
-        if YGG_MSG_HEAD in msg:
+        if isinstance(metadata, dict) and metadata.get('binary_buffers', None):
+            # Raw buffers may contain the header marker so don't check for it
+            data = msg
+        elif YGG_MSG_HEAD in msg:
             if metadata is not None:
                 raise ValueError("Metadata in header and provided by keyword.")
-            _, metadata, data = msg.split(YGG_MSG_HEAD, 2)
+            ihead = msg.index(YGG_MSG_HEAD) + len(YGG_MSG_HEAD)
+            idata = msg.index(YGG_MSG_HEAD, ihead) + len(YGG_MSG_HEAD)
+            metadata = msg[ihead:(idata - len(YGG_MSG_HEAD))]
+            if no_data:
+                # Don't copy the body if only the header is required
+                data = memoryview(msg)[idata:]
+            else:
+                data = msg[idata:]
             if len(metadata) == 0:
                 metadata = dict(size=len(data))
             else:
@@ -733,9 +944,29 @@ class MetaschemaType(object):
               or (metadata.get('type', None) == 'direct') or dont_decode):
             return data, metadata
         else:
+            buffers = None
+            if metadata.get('binary_buffers', None):
+                data_view = memoryview(data)
+                buffers = [data_view[i:(i + n)]
+                           for i, n in metadata['binary_buffers']]
+                data = data[:metadata['binary_buffers'][0][0]]
             data = encoder.decode_json(data)
-            obj = self.decode(metadata, data, self._typedef,
-                              typedef_validated=True, dont_check=dont_check)
+            with binary_buffers(buffers):
+                if metadata.get('batch', False):
+                    # Objects in a batch share the type metadata so only the
+                    # first needs to be checked
+                    obj = []
+                    for x in data:
+                        if dont_check or obj:
+                            obj.append(self.decode_fixed(metadata, x))
+                        else:
+                            obj.append(self.decode(metadata, x, self._typedef,
+                                                   typedef_validated=True))
+                elif dont_check:
+                    obj = self.decode_fixed(metadata, data)
+                else:
+                    obj = self.decode(metadata, data, self._typedef,
+                                      typedef_validated=True)
         return obj, metadata
 
     # TESTING METHODS
@@ -8,7 +8,7 @@ from yggdrasil.metaschema.datatypes import _schema_dir
 from yggdrasil.metaschema.datatypes.JSONObjectMetaschemaType import (
     JSONObjectMetaschemaType)
 from yggdrasil.metaschema.datatypes.PlyMetaschemaType import (
-    PlyDict,
+    PlyDict, offset_indices,
     _index_type, _color_type, _coord_type,
     _index_conv, _color_conv, _coord_conv,
     _index_fmt, _color_fmt, _coord_fmt)
@@ -231,15 +231,7 @@ class ObjDict(PlyDict):
     @property
     def mesh(self):
         r"""list: Vertices for each face in the structure."""
-        mesh = []
-        for i in range(self.count_elements('faces')):
-            imesh = []
-            for f in self['faces']:
-                for v in f:
-                    imesh += [self['vertices'][v['vertex_index']][k]
-                              for k in ['x', 'y', 'z']]
-            mesh.append(imesh)
-        return mesh
+        return self._get_mesh(_as_obj=True)
 
     @classmethod
     def from_shape(cls, shape, d, conversion=1.0):  # pragma: lpy
@@ -373,8 +365,7 @@ class ObjDict(PlyDict):
             if k in solf:
                 if k not in self:
                     self[k] = []
-                for x in solf[k]:
-                    self[k].append([v + exist_map[k] for v in x])
+                self[k] += offset_indices(solf[k], exist_map[k])
         # Face/line fields
         for k in ['lines', 'faces']:
             if k in solf:
@@ -392,6 +383,7 @@ class ObjDict(PlyDict):
                 iele = copy.deepcopy(x)
                 iele['vertex_indices'] = [v + exist_map['vertex_index']
                                           for v in x['vertex_indices']]
+                self[k].append(iele)
         # Surfaces
         k = 'surfaces'
         if k in solf:
@@ -401,6 +393,7 @@ class ObjDict(PlyDict):
                 iele = copy.deepcopy(x)
                 iele['vertex_indices'] = [{ik: v[ik] + exist_map[ik] for ik in v.keys()}
                                           for v in x['vertex_indices']]
+                self[k].append(iele)
         # Merge material using first in list
         material = None
         for x in [self, solf]:
@@ -1,6 +1,7 @@
 import os
 import copy
 import warnings
+import itertools
 import numpy as np
 from yggdrasil import backwards
 from yggdrasil.metaschema.encoder import encode_json, decode_json
@@ -24,6 +25,9 @@ _map_ply2py = {'char': 'int8', 'uchar': 'uint8',
                'int': 'int32', 'uint': 'uint32',
                'float': 'float32', 'double': 'float64'}
 _map_py2ply = {v: k for k, v in _map_ply2py.items()}
+_map_plyformat2byteorder = {'ascii 1.0': None,
+                            'binary_little_endian 1.0': '<',
+                            'binary_big_endian 1.0': '>'}
 _default_element_order = ['material', 'vertices', 'faces', 'edges']
 _default_property_order = {'vertices': ['x', 'y', 'z', 'red', 'green', 'blue'],
                            'faces': [],
@@ -207,6 +211,231 @@ def translate_py2ply(py_obj):
     return _map_py2ply[type_np]
 
 
+def translate_ply2dtype(type_ply, byteorder='='):
+    r"""Get the numpy data types for a Ply property type string.
+
+    Args:
+        type_ply (str): Ply property type string (e.g. 'float' or
+            'list uchar int').
+        byteorder (str, optional): Byte order that should be used for the
+            data types. Defaults to '=' (native byte order).
+
+    Returns:
+        list: Numpy data type for the property. For list properties, this
+            will include two data types, one for the count and one for the
+            list items.
+
+    """
+    vars = type_ply.split()
+    if vars[0] == 'list':
+        vars = vars[1:]
+    return [np.dtype(translate_ply2py(v)).newbyteorder(byteorder) for v in vars]
+
+
+def elements2array(elements, properties=None):
+    r"""Convert a list of elements (dictionaries of properties) into a
+    structured array.
+
+    Args:
+        elements (list): Dictionaries of properties for each element.
+        properties (list, optional): Properties that should be included in
+            the array in the order they should be included. Defaults to all
+            of the properties of the first element in sorted order.
+
+    Returns:
+        np.ndarray: Structured array with one field for each property. List
+            properties (e.g. vertex_index) are stored as sub-arrays if all of
+            the elements have the same number of entries and as object fields
+            otherwise.
+
+    Raises:
+        ValueError: If any of the elements are missing a property.
+
+    """
+    if properties is None:
+        properties = []
+        if elements:
+            properties = get_key_order(elements[0].keys(), [])
+    fields = []
+    columns = []
+    for p in properties:
+        try:
+            col = [x[p] for x in elements]
+        except KeyError:
+            raise ValueError("Not all elements have property '%s'." % p)
+        if col and isinstance(col[0], (list, tuple, np.ndarray)):
+            if len(set(len(x) for x in col)) == 1:
+                arr = np.array(col)
+                fields.append((p, arr.dtype, arr.shape[1:]))
+            else:
+                arr = np.empty(len(col), dtype=object)
+                for i, x in enumerate(col):
+                    arr[i] = np.array(x)
+                fields.append((p, arr.dtype))
+        else:
+            arr = np.array(col)
+            fields.append((p, arr.dtype))
+        columns.append(arr)
+    out = np.empty(len(elements), dtype=fields)
+    for p, arr in zip(properties, columns):
+        out[p] = arr
+    return out
+
+
+def array2elements(arr, properties=None):
+    r"""Convert a structured array into a list of elements (dictionaries of
+    properties).
+
+    Args:
+        arr (np.ndarray): Structured array with one field for each property.
+        properties (list, optional): Fields that should be included in the
+            elements. Defaults to all of the fields in arr.
+
+    Returns:
+        list: Dictionaries of properties for each element. Values are native
+            Python types rather than NumPy scalars.
+
+    """
+    if properties is None:
+        properties = arr.dtype.names
+    columns = []
+    for p in properties:
+        if arr.dtype[p] == object:
+            columns.append([np.asarray(x).tolist() for x in arr[p]])
+        else:
+            columns.append(arr[p].tolist())
+    return [dict(zip(properties, x)) for x in zip(*columns)]
+
+
+def offset_indices(index_lists, offset):
+    r"""Add an offset to lists of indices.
+
+    Args:
+        index_lists (list): Lists of indices.
+        offset (int): Offset that should be added to every index.
+
+    Returns:
+        list: Lists of offset indices (as Python integers).
+
+    """
+    if not index_lists:
+        return []
+    counts = np.array([len(x) for x in index_lists])
+    if (counts == counts[0]).all():
+        return (np.array(index_lists) + offset).tolist()
+    flat = np.array(list(itertools.chain.from_iterable(index_lists))) + offset
+    return [x.tolist() for x in np.split(flat, np.cumsum(counts)[:-1])]
+
+
+def encode_binary_element(elements, properties, type_map, byteorder):
+    r"""Encode elements in the Ply binary format.
+
+    Args:
+        elements (list): Dictionaries of properties for each element.
+        properties (list): Properties in the order they should be written.
+        type_map (dict): Ply type strings for each property.
+        byteorder (str): Byte order that should be used.
+
+    Returns:
+        bytes: Encoded elements.
+
+    """
+    dtypes = {p: translate_ply2dtype(type_map[p], byteorder)
+              for p in properties}
+    fields = []
+    columns = []
+    for p in properties:
+        col = [x[p] for x in elements]
+        if len(dtypes[p]) == 2:
+            counts = set(len(x) for x in col)
+            if len(counts) != 1:
+                break
+            count = counts.pop()
+            fields += [('_count_' + p, dtypes[p][0]),
+                       (p, dtypes[p][1], (count, ))]
+            columns += [count, np.array(col)]
+        else:
+            fields.append((p, dtypes[p][0]))
+            columns.append(col)
+    else:
+        arr = np.empty(len(elements), dtype=fields)
+        for f, col in zip(fields, columns):
+            arr[f[0]] = col
+        return arr.tobytes()
+    # Lists with varying lengths must be encoded one element at a time
+    out = []
+    for x in elements:
+        for p in properties:
+            if len(dtypes[p]) == 2:
+                out.append(np.array(len(x[p]), dtype=dtypes[p][0]).tobytes())
+                out.append(np.array(x[p], dtype=dtypes[p][1]).tobytes())
+            else:
+                out.append(np.array(x[p], dtype=dtypes[p][0]).tobytes())
+    return b''.join(out)
+
+
+def decode_binary_element(msg, offset, count, properties, type_map, byteorder):
+    r"""Decode elements in the Ply binary format.
+
+    Args:
+        msg (bytes): Encoded message.
+        offset (int): Position in msg where the elements begin.
+        count (int): Number of elements that should be decoded.
+        properties (list): Properties in the order they were written.
+        type_map (dict): Ply type strings for each property.
+        byteorder (str): Byte order that was used.
+
+    Returns:
+        tuple(list, int): Dictionaries of properties (as Python types) for
+            each element and the position in msg following the last element.
+
+    """
+    if count == 0:
+        return [], offset
+    dtypes = {p: translate_ply2dtype(type_map[p], byteorder)
+              for p in properties}
+    # Use the first element to determine the length of list properties and
+    # read all of the elements at once assuming the lengths are the same
+    fields = []
+    counts = {}
+    pos = offset
+    for p in properties:
+        if len(dtypes[p]) == 2:
+            counts[p] = int(np.frombuffer(msg, dtype=dtypes[p][0], count=1,
+                                          offset=pos)[0])
+            fields += [('_count_' + p, dtypes[p][0]),
+                       (p, dtypes[p][1], (counts[p], ))]
+            pos += dtypes[p][0].itemsize + counts[p] * dtypes[p][1].itemsize
+        else:
+            fields.append((p, dtypes[p][0]))
+            pos += dtypes[p][0].itemsize
+    dtype = np.dtype(fields)
+    if (offset + count * dtype.itemsize) <= len(msg):
+        arr = np.frombuffer(msg, dtype=dtype, count=count, offset=offset)
+        if all([(arr['_count_' + p] == n).all() for p, n in counts.items()]):
+            return (array2elements(arr, properties=properties),
+                    offset + count * dtype.itemsize)
+    # Lists with varying lengths must be decoded one element at a time
+    out = []
+    pos = offset
+    for i in range(count):
+        new = {}
+        for p in properties:
+            if len(dtypes[p]) == 2:
+                n = int(np.frombuffer(msg, dtype=dtypes[p][0], count=1,
+                                      offset=pos)[0])
+                pos += dtypes[p][0].itemsize
+                new[p] = np.frombuffer(msg, dtype=dtypes[p][1], count=n,
+                                       offset=pos).tolist()
+                pos += n * dtypes[p][1].itemsize
+            else:
+                new[p] = np.frombuffer(msg, dtype=dtypes[p][0], count=1,
+                                       offset=pos).tolist()[0]
+                pos += dtypes[p][0].itemsize
+        out.append(new)
+    return out, pos
+
+
 def singular2plural(e_sing):
     r"""Get the plural version of a singular element name. If the singular
     version ends with the suffix 'ex' it is replaced with the plural suffix
@@ -272,6 +501,65 @@ class PlyDict(dict):
         r"""Get a version of the object as a pure dictionary."""
         out = dict(**self)
         return out
+
+    @classmethod
+    def from_array_dict(cls, in_dict):
+        r"""Get a version of the object from a dictionary of structured arrays.
+
+        Args:
+            in_dict (dict): Mapping between element names and structured
+                arrays (see as_array_dict).
+
+        Returns:
+            PlyDict: Version of the object with elements as lists of
+                dictionaries.
+
+        """
+        out = {}
+        for k, v in in_dict.items():
+            if isinstance(v, np.ndarray):
+                v = array2elements(v)
+            out[k] = v
+        return cls(out)
+
+    def as_array_dict(self):
+        r"""Get a version of the object where elements are structured arrays
+        with one field for each property. For large structures, this is much
+        more compact than lists of dictionaries and allows operations to be
+        performed on all of the elements at once.
+
+        Returns:
+            dict: Mapping between element names and structured arrays.
+                Entries that cannot be represented as structured arrays (e.g.
+                material and elements without a consistent set of
+                properties) are included unchanged.
+
+        """
+        out = {}
+        for k, v in self.items():
+            if isinstance(v, (list, tuple)) and v and isinstance(v[0], dict):
+                try:
+                    v = elements2array(v)
+                except ValueError:
+                    pass
+            out[k] = v
+        return out
+
+    def _vertex_coords(self):
+        r"""np.ndarray: Array of x, y, z coordinates for each vertex."""
+        return np.array([[v['x'], v['y'], v['z']] for v in self['vertices']],
+                        dtype='float64').reshape(-1, 3)
+
+    def _face_indices(self, _as_obj=False):
+        r"""Get the indices of the vertices in each face.
+
+        Returns:
+            list: Vertex indices for each face.
+
+        """
+        if _as_obj:
+            return [[v['vertex_index'] for v in f] for f in self['faces']]
+        return [f['vertex_index'] for f in self['faces']]
     
     def count_elements(self, element_name):
         r"""Get the count of a certain element in the dictionary.
@@ -303,24 +591,24 @@ class PlyDict(dict):
     @property
     def bounds(self):
         r"""tuple: Mins/maxs of vertices in each dimension."""
-        mins = np.empty(3, 'float64')
-        maxs = np.empty(3, 'float64')
-        for i, x in enumerate('xyz'):
-            mins[i] = min([v[x] for v in self['vertices']])
-            maxs[i] = max([v[x] for v in self['vertices']])
-        return mins, maxs
+        coords = self._vertex_coords()
+        return coords.min(axis=0), coords.max(axis=0)
+
+    def _get_mesh(self, _as_obj=False):
+        r"""Get the vertices for each face in the structure.
+
+        Returns:
+            list: Coordinates of the vertices in each face.
+
+        """
+        coords = self._vertex_coords()
+        return [coords[f].flatten().tolist()
+                for f in self._face_indices(_as_obj=_as_obj)]
 
     @property
     def mesh(self):
         r"""list: Vertices for each face in the structure."""
-        mesh = []
-        for i in range(self.count_elements('faces')):
-            imesh = []
-            for f in self['faces']:
-                for v in f['vertex_index']:
-                    imesh += [self['vertices'][v][k] for k in ['x', 'y', 'z']]
-            mesh.append(imesh)
-        return mesh
+        return self._get_mesh()
 
     @classmethod
     def from_shape(cls, shape, d, conversion=1.0, _as_obj=False):  # pragma: lpy
@@ -488,16 +776,17 @@ class PlyDict(dict):
         # Vertex fields
         self['vertices'] += solf['vertices']
         # Face fields
-        for f in solf['faces']:
-            self['faces'].append({'vertex_index': [v + nvert for v in
-                                                   f['vertex_index']]})
+        self['faces'] += [
+            {'vertex_index': f} for f in offset_indices(
+                [f['vertex_index'] for f in solf['faces']], nvert)]
         # Edge fields
         if 'edges' in solf:
             if 'edges' not in self:
                 self['edges'] = []
-            for e in solf['edges']:
-                iedge = {'vertex1': e['vertex1'] + nvert,
-                         'vertex2': e['vertex2'] + nvert}
+            indices = offset_indices([[e['vertex1'], e['vertex2']]
+                                      for e in solf['edges']], nvert)
+            for e, (v1, v2) in zip(solf['edges'], indices):
+                iedge = {'vertex1': v1, 'vertex2': v2}
                 for k in ['red', 'green', 'blue']:
                     if k in e:
                         iedge[k] = e[k]
@@ -557,42 +846,31 @@ class PlyDict(dict):
         """
         from matplotlib import cm
         from matplotlib import colors as mpl_colors
+        faces = self._face_indices(_as_obj=_as_obj)
+        counts = np.array([len(f) for f in faces], dtype='int64')
+        indices = np.array(list(itertools.chain.from_iterable(faces)),
+                           dtype='int64')
+        scalar_arr = np.asarray(scalar_arr)[:len(faces)]
         # Scale by area
         if scale_by_area:
-            scalar_arr = copy.deepcopy(scalar_arr)
-            for i, f in enumerate(self['faces']):
-                if _as_obj:
-                    fv = [_f['vertex_index'] for _f in f]
-                else:
-                    fv = f['vertex_index']
-                if len(fv) > 3:
-                    raise NotImplementedError("Area calc not implemented "
-                                              + "for faces above triangle.")
-                v0 = np.array([self['vertices'][fv[0]][k] for k in 'xyz'])
-                v1 = np.array([self['vertices'][fv[1]][k] for k in 'xyz'])
-                v2 = np.array([self['vertices'][fv[2]][k] for k in 'xyz'])
-                a = np.sqrt(np.sum((v0 - v1)**2))
-                b = np.sqrt(np.sum((v1 - v2)**2))
-                c = np.sqrt(np.sum((v2 - v0)**2))
-                s = (a + b + c) / 2.0
-                area = np.sqrt(s * (s - a) * (s - b) * (s - c))
-                scalar_arr[i] = area * scalar_arr[i]
-        # Map vertices onto faces
-        vertex_scalar = [[] for x in self['vertices']]
-        if _as_obj:
-            for i in range(len(self['faces'])):
-                for v in self['faces'][i]:
-                    vertex_scalar[v['vertex_index']].append(scalar_arr[i])
-        else:
-            for i in range(len(self['faces'])):
-                for v in self['faces'][i]['vertex_index']:
-                    vertex_scalar[v].append(scalar_arr[i])
-        for i in range(len(vertex_scalar)):
-            if len(vertex_scalar[i]) == 0:
-                vertex_scalar[i] = 0
-            else:
-                vertex_scalar[i] = np.mean(vertex_scalar[i])
-        vertex_scalar = np.array(vertex_scalar)
+            if (counts > 3).any():
+                raise NotImplementedError("Area calc not implemented "
+                                          + "for faces above triangle.")
+            fv = self._vertex_coords()[indices.reshape(-1, 3)]
+            a = np.sqrt(np.sum((fv[:, 0] - fv[:, 1])**2, axis=1))
+            b = np.sqrt(np.sum((fv[:, 1] - fv[:, 2])**2, axis=1))
+            c = np.sqrt(np.sum((fv[:, 2] - fv[:, 0])**2, axis=1))
+            s = (a + b + c) / 2.0
+            area = np.sqrt(s * (s - a) * (s - b) * (s - c))
+            scalar_arr = area * scalar_arr
+        # Map vertices onto faces, averaging over the faces for each vertex
+        nvert = self.count_elements('vertices')
+        face_scalar = np.repeat(scalar_arr, counts)
+        vertex_sum = np.bincount(indices, weights=face_scalar, minlength=nvert)
+        vertex_count = np.bincount(indices, minlength=nvert)
+        vertex_scalar = np.zeros(nvert, dtype='float64')
+        has_face = (vertex_count > 0)
+        vertex_scalar[has_face] = vertex_sum[has_face] / vertex_count[has_face]
         if scaling == 'log':
             vertex_scalar = np.ma.MaskedArray(vertex_scalar, vertex_scalar <= 0)
         # Get color scaling
@@ -617,9 +895,8 @@ class PlyDict(dict):
             out = self
         else:
             out = copy.deepcopy(self)
-        for i, c in enumerate(vertex_colors):
-            for j, k in enumerate(['red', 'green', 'blue']):
-                out['vertices'][i][k] = c[j]
+        for v, c in zip(out['vertices'], vertex_colors):
+            v['red'], v['green'], v['blue'] = c
         return out
 
 
@@ -685,12 +962,20 @@ class PlyMetaschemaType(JSONObjectMetaschemaType):
             newline (str, optional): String that should be used to delineated end
                 of lines. Defaults to '\n'.
             plyformat (str, optional): String describing the ply format and version.
-                Defaults to 'ascii 1.0'.
+                Defaults to 'ascii 1.0'. 'binary_little_endian 1.0' and
+                'binary_big_endian 1.0' are also supported.
 
         Returns:
-            bytes, str: Serialized message.
+            bytes, str: Serialized message. Messages in a binary format are
+                returned as bytes.
+
+        Raises:
+            ValueError: If plyformat is not supported.
 
         """
+        if plyformat not in _map_plyformat2byteorder:
+            raise ValueError("Unsupported ply format '%s'." % plyformat)
+        byteorder = _map_plyformat2byteorder[plyformat]
         # Add comments to identify generated files
         default_comments = ['author ygg_auto', 'File generated by yggdrasil']
         for c in default_comments:
@@ -740,6 +1025,13 @@ class PlyMetaschemaType(JSONObjectMetaschemaType):
                         header.append('property %s %s' % (type_map[e][p], p))
         header.append('end_header')
         # Encode body
+        if byteorder is not None:
+            body = [encode_binary_element(obj[e], property_order[e],
+                                          type_map[e], byteorder)
+                    for e in element_order
+                    if (e in obj) and (e != 'material') and (size_map[e] > 0)]
+            return (backwards.as_bytes(newline.join(header) + newline)
+                    + b''.join(body))
         body = []
         for e in element_order:
             if (e not in obj) or (e == 'material'):
@@ -783,18 +1075,36 @@ class PlyMetaschemaType(JSONObjectMetaschemaType):
         r"""Decode an object.
 
         Args:
-            msg (string): Encoded object to decode.
+            msg (bytes, string): Encoded object to decode.
             typedef (dict): Type definition that should be used to decode the
                 object.
 
         Returns:
             object: Decoded object.
 
+        Raises:
+            ValueError: If the message does not begin with 'ply'.
+            ValueError: If the message does not contain a complete header.
+            ValueError: If the ply format is not supported.
+
         """
-        lines = backwards.as_str(msg).splitlines()
-        metadata = {'comments': [], 'element_order': [], 'property_order': {}}
-        if lines[0] != 'ply':
+        msg = backwards.as_bytes(msg)
+        headend = msg.find(b'end_header')
+        if headend < 0:
+            lines = backwards.as_str(msg).splitlines()
+        else:
+            headend = msg.find(b'\n', headend)
+            if headend < 0:
+                headend = len(msg)
+            else:
+                headend += 1
+            lines = backwards.as_str(msg[:headend]).splitlines()
+        metadata = {'comments': [], 'element_order': [], 'property_order': {},
+                    'plyformat': 'ascii 1.0'}
+        if (not lines) or (lines[0] != 'ply'):
             raise ValueError("The first line must be 'ply'")
+        if headend < 0:
+            raise ValueError("Could not locate the end of the header.")
         # Parse header
         e = None
         p = None
@@ -825,10 +1135,23 @@ class PlyMetaschemaType(JSONObjectMetaschemaType):
                 type_map[e][p] = ' '.join(vars[1:-1])
                 metadata['property_order'][e].append(p)
             elif 'end_header' in line:
-                headline = i + 1
                 break
+        if metadata['plyformat'] not in _map_plyformat2byteorder:
+            raise ValueError("Unsupported ply format '%s'."
+                             % metadata['plyformat'])
+        byteorder = _map_plyformat2byteorder[metadata['plyformat']]
         # Parse body
-        i = headline
+        if byteorder is not None:
+            pos = headend
+            for e in metadata['element_order']:
+                if e == 'material':
+                    continue
+                obj[e], pos = decode_binary_element(
+                    msg, pos, size_map[e], metadata['property_order'][e],
+                    type_map[e], byteorder)
+            return PlyDict(obj)
+        lines = backwards.as_str(msg[headend:]).splitlines()
+        i = 0
         for e in metadata['element_order']:
             if e == 'material':
                 continue
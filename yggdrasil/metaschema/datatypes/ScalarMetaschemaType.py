@@ -2,6 +2,7 @@ import numpy as np
 import copy
 import warnings
 from yggdrasil import units, backwards
+from yggdrasil.metaschema.datatypes import YGG_MSG_BUF, get_binary_buffers
 from yggdrasil.metaschema.datatypes.MetaschemaType import MetaschemaType
 from yggdrasil.metaschema.datatypes.FixedMetaschemaType import (
     create_fixed_type_class)
@@ -119,10 +120,16 @@ class ScalarMetaschemaType(MetaschemaType):
                 object.
 
         Returns:
-            string: Encoded object.
+            string: Encoded object. If called within a binary_buffers
+                context, the array data is added to the list of raw buffers
+                and a reference to the buffer is returned.
 
         """
         arr = cls.to_array(obj)
+        buffers = get_binary_buffers()
+        if buffers is not None:
+            buffers.append(np.ascontiguousarray(arr).data)
+            return '%s%d' % (YGG_MSG_BUF, len(buffers) - 1)
         bytes = arr.tobytes()
         out = backwards.base64_encode(bytes).decode('ascii')
         return out
@@ -168,15 +175,28 @@ class ScalarMetaschemaType(MetaschemaType):
         r"""Decode an object.
 
         Args:
-            obj (string): Encoded object to decode.
+            obj (string): Encoded object to decode. This can also be a
+                reference to a raw buffer if called within a binary_buffers
+                context.
             typedef (dict): Type definition that should be used to decode the
                 object.
 
         Returns:
             object: Decoded object.
 
+        Raises:
+            ValueError: If obj references a raw buffer, but there are not any
+                buffers available.
+
         """
-        bytes = backwards.base64_decode(obj.encode('ascii'))
+        if obj.startswith(YGG_MSG_BUF):
+            buffers = get_binary_buffers()
+            if buffers is None:
+                raise ValueError("Encoded data references a raw buffer, but "
+                                 "there are not any buffers available.")
+            bytes = buffers[int(obj[len(YGG_MSG_BUF):])]
+        else:
+            bytes = backwards.base64_decode(obj.encode('ascii'))
         dtype = ScalarMetaschemaProperties.definition2dtype(typedef)
         arr = np.frombuffer(bytes, dtype=dtype)
         # arr = np.fromstring(bytes, dtype=dtype)
@@ -1,5 +1,6 @@
 import copy
 import jsonschema
+from yggdrasil.metaschema import validate_instance
 from yggdrasil.metaschema.datatypes import get_type_class, _type_registry
 from yggdrasil.metaschema.properties import get_metaschema_property
 from yggdrasil.metaschema.datatypes.JSONObjectMetaschemaType import (
@@ -89,6 +90,35 @@ class SchemaMetaschemaType(JSONObjectMetaschemaType):
     specificity = JSONObjectMetaschemaType.specificity + 1
     inherit_properties = ['extract_properties']
     _replaces_existing = False
+    _cached_metaschemas = {}
+
+    @classmethod
+    def get_cached_metaschema(cls, strict=False):
+        r"""Get the metaschema without copying it. The result is cached until
+        the metaschema is regenerated.
+
+        Args:
+            strict (bool, optional): If True, the returned metaschema will
+                require that schemas specify a type and will not allow
+                additional properties. Defaults to False.
+
+        Returns:
+            tuple(dict, str): Metaschema and the key identifying it in the
+                validator cache. The metaschema should not be modified.
+
+        """
+        from yggdrasil import metaschema
+        out = cls._cached_metaschemas.get(strict, None)
+        if (out is None) or (out[0] is not metaschema._metaschema):
+            x = cls.metaschema()
+            if strict:
+                x.setdefault('required', [])
+                if 'type' not in x['required']:
+                    x['required'].append('type')
+                x['additionalProperties'] = False
+            out = (metaschema._metaschema, x, metaschema.get_schema_key(x))
+            cls._cached_metaschemas[strict] = out
+        return out[1:]
 
     @classmethod
     def encode_data(cls, obj, typedef):
@@ -138,12 +168,8 @@ class SchemaMetaschemaType(JSONObjectMetaschemaType):
                                                          raise_errors=raise_errors):
             return False
         try:
-            x = copy.deepcopy(cls.metaschema())
-            x.setdefault('required', [])
-            if 'type' not in x['required']:
-                x['required'].append('type')
-            x['additionalProperties'] = False
-            jsonschema.validate(obj, x, cls=cls.validator())
+            x, x_key = cls.get_cached_metaschema(strict=True)
+            validate_instance(obj, x, schema_key=x_key)
         except jsonschema.exceptions.ValidationError:
             if raise_errors:
                 raise
@@ -163,7 +189,7 @@ class SchemaMetaschemaType(JSONObjectMetaschemaType):
         """
         if isinstance(obj, str):
             obj = {'type': obj}
-        x = cls.metaschema()
+        x = cls.get_cached_metaschema()[0]
         validators = {u'$ref': _validate_schema}
         normalizers = {tuple(): [_normalize_schema]}
         validator_class = copy.deepcopy(cls.validator())
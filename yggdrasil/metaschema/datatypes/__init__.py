@@ -3,6 +3,8 @@ import glob
 import jsonschema
 import copy
 import importlib
+import threading
+import contextlib
 from collections import OrderedDict
 from yggdrasil.metaschema.encoder import decode_json
 from yggdrasil.metaschema.properties import get_metaschema_property
@@ -13,6 +15,8 @@ _type_registry = OrderedDict()
 _schema_dir = os.path.join(os.path.dirname(__file__), 'schemas')
 _base_validator = jsonschema.validators.validator_for({"$schema": ""})
 YGG_MSG_HEAD = b'YGG_MSG_HEAD'
+YGG_MSG_BUF = 'YGG_MSG_BUF:'
+_binary_buffers = threading.local()
 _property_attributes = ['properties', 'definition_properties',
                         'metadata_properties', 'extract_properties']
 
@@ -38,6 +42,40 @@ def is_default_typedef(typedef):
     return (typedef == _default_typedef)
 
 
+@contextlib.contextmanager
+def binary_buffers(buffers=None):
+    r"""Context in which array data is added to/retrieved from a list of raw
+    buffers that are sent after the JSON serialization, rather than being
+    base64 encoded within it.
+
+    Args:
+        buffers (list, optional): List that buffers should be appended to
+            during encoding or retrieved from during decoding. Defaults to
+            None and array data is base64 encoded as normal.
+
+    Yields:
+        list: The list of buffers active within the context.
+
+    """
+    prev = getattr(_binary_buffers, 'buffers', None)
+    _binary_buffers.buffers = buffers
+    try:
+        yield buffers
+    finally:
+        _binary_buffers.buffers = prev
+
+
+def get_binary_buffers():
+    r"""Get the list of raw buffers active in the current thread.
+
+    Returns:
+        list: Raw buffers if called within a binary_buffers context, None
+            otherwise.
+
+    """
+    return getattr(_binary_buffers, 'buffers', None)
+
+
 def register_type(type_class):
     r"""Register a type class, recording methods for encoding/decoding.
 
@@ -518,6 +556,9 @@ def compare_schema(schema1, schema2, root1=None, root2=None):
 
     """
     try:
+        if (schema1 == schema2) and ('type' in schema1):
+            # Identical schemas are compatible and do not need resolvers
+            return
         if root1 is None:
             root1 = jsonschema.RefResolver.from_schema(schema1)
         if root2 is None:
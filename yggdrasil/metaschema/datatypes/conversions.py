@@ -1,6 +1,3 @@
-import copy
-
-
 _conversion_registry = {}
 
 
@@ -57,18 +54,16 @@ def ply2obj(ply):
     out = {'material': ply['material']}
     # Vertices
     if 'vertices' in ply:
-        out['vertices'] = copy.deepcopy(ply['vertices'])
+        out['vertices'] = [dict(v) for v in ply['vertices']]
     # Faces
     if 'faces' in ply:
-        out['faces'] = []
-        for f in ply['faces']:
-            out['faces'].append([{'vertex_index': q} for q in f['vertex_index']])
+        out['faces'] = [[{'vertex_index': q} for q in f['vertex_index']]
+                        for f in ply['faces']]
     # Edges
     if 'edges' in ply:
-        out['lines'] = []
-        for e in ply['edges']:
-            x = [{'vertex_index': e['vertex%d' % q]} for q in [1, 2]]
-            out['lines'].append(x)
+        out['lines'] = [[{'vertex_index': e['vertex1']},
+                         {'vertex_index': e['vertex2']}]
+                        for e in ply['edges']]
     return out
 
 
@@ -86,15 +81,12 @@ def obj2ply(obj):
     out = {'material': obj['material']}
     # Vertices
     if 'vertices' in obj:
-        out['vertices'] = copy.deepcopy(obj['vertices'])
-        for v in out['vertices']:
-            if 'w' in v:
-                del v['w']
+        out['vertices'] = [{k: x for k, x in v.items() if k != 'w'}
+                           for v in obj['vertices']]
     # Faces
     if 'faces' in obj:
-        out['faces'] = []
-        for f in obj['faces']:
-            out['faces'].append({'vertex_index': [x['vertex_index'] for x in f]})
+        out['faces'] = [{'vertex_index': [x['vertex_index'] for x in f]}
+                        for f in obj['faces']]
     # Edges
     if 'lines' in obj:
         out['edges'] = []
@@ -1,3 +1,4 @@
+import numpy as np
 from yggdrasil.tests import assert_raises, assert_equal
 from yggdrasil.metaschema import datatypes
 from yggdrasil.metaschema.tests import _valid_objects
@@ -63,6 +64,30 @@ def test_encode_decode():
     assert_raises(ValueError, datatypes.decode_data, b'', None)
 
 
+def test_binary_buffers():
+    r"""Test encode/decode of valid objects using raw binary buffers."""
+    for x in _valid_objects.values():
+        t = datatypes.encode_type(x)
+        with datatypes.binary_buffers([]) as buffers:
+            d = datatypes.encode_data(x)
+            w = datatypes.decode_data(d, t)
+        assert_equal(w, x)
+        assert(datatypes.get_binary_buffers() is None)
+    with datatypes.binary_buffers([]) as buffers:
+        d = datatypes.encode_data(1.0)
+    assert_equal(len(buffers), 1)
+    assert_raises(ValueError, datatypes.decode_data, d,
+                  datatypes.encode_type(1.0))
+
+
+def test_serialize_batch_error():
+    r"""Test error when objects in a batch have different type metadata."""
+    x = datatypes.get_type_from_def({'type': '1darray', 'subtype': 'float',
+                                     'precision': 64})
+    assert_raises(ValueError, x.serialize, [np.zeros(3), np.zeros(4)],
+                  batch=True)
+
+
 def test_encode_decode_readable():
     r"""Test encode_data_reable/decode for valid objects."""
     for x in _valid_objects.values():
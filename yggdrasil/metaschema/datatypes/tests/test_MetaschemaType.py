@@ -273,11 +273,64 @@ class TestMetaschemaType(YggTestClassInfo):
                 y = self.instance.deserialize(msg)
                 self.assert_result_equal(y[0], x)
 
+    def test_serialize_binary(self):
+        r"""Test serialize/deserialize with raw binary buffers."""
+        if self._cls == 'MetaschemaType':
+            for x in self._valid_decoded:
+                self.assert_raises(NotImplementedError, self.instance.serialize,
+                                   x, binary=True)
+        else:
+            for x in self._valid_decoded:
+                msg = self.instance.serialize(x, binary=True)
+                y = self.instance.deserialize(msg)
+                self.assert_result_equal(y[0], x)
+                # Message received in parts
+                _, header = self.instance.deserialize(msg[:-1])
+                self.assert_equal(header['incomplete'], True)
+                body = msg.split(YGG_MSG_HEAD, 2)[-1]
+                y = self.instance.deserialize(body, metadata=header)
+                self.assert_result_equal(y[0], x)
+
+    def test_serialize_batch(self):
+        r"""Test serialize/deserialize of a batch of objects."""
+        if self._cls == 'MetaschemaType':
+            for x in self._valid_decoded:
+                self.assert_raises(NotImplementedError, self.instance.serialize,
+                                   [x, x], batch=True)
+        else:
+            for x in self._valid_decoded:
+                msg = self.instance.serialize([x, x], batch=True)
+                y = self.instance.deserialize(msg)
+                self.assert_equal(y[1]['batch'], 2)
+                self.assert_equal(len(y[0]), 2)
+                for iy in y[0]:
+                    self.assert_result_equal(iy, x)
+            self.assert_raises(ValueError, self.instance.serialize, [],
+                               batch=True)
+
+    def test_serialize_fixed(self):
+        r"""Test serialize/deserialize without checks using cached metadata."""
+        if self._cls == 'MetaschemaType':
+            for x in self._valid_decoded:
+                self.assert_raises(NotImplementedError, self.instance.serialize,
+                                   x, dont_check=True)
+        else:
+            for x in self._valid_decoded:
+                # Repeat so that the cached metadata is used
+                msg0 = self.instance.serialize(x, dont_check=True, id='0')
+                msg1 = self.instance.serialize(x, dont_check=True, id='0')
+                self.assert_equal(msg1, msg0)
+                for i in range(2):
+                    y = self.instance.deserialize(msg1, dont_check=True)
+                    self.assert_result_equal(y[0], x)
+
     def test_serialize_error(self):
         r"""Test serialization errors."""
         if (self._cls != 'MetaschemaType') and (len(self._valid_decoded) > 0):
             self.assert_raises(RuntimeError, self.instance.serialize,
                                self._valid_decoded[0], data='something')
+            self.assert_raises(RuntimeError, self.instance.serialize,
+                               self._valid_decoded[0], binary_buffers=[])
 
     def test_deserialize_error(self):
         r"""Test deserialization errors."""
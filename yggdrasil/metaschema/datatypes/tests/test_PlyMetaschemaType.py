@@ -1,5 +1,6 @@
 import os
 import copy
+import json
 import shutil
 import tempfile
 import numpy as np
@@ -49,6 +50,9 @@ for f in _test_value['faces']:
 _test_value_simple = {'vertices': copy.deepcopy(_test_value['vertices']),
                       'faces': [{'vertex_index': [0, 1, 2]},
                                 {'vertex_index': [0, 2, 3]}]}
+_test_value_tri = {'vertices': copy.deepcopy(_test_value['vertices']),
+                   'faces': [{'vertex_index': [np.int32(x) for x in f]}
+                             for f in [[0, 1, 2], [0, 2, 3], [4, 5, 6]]]}
 _test_value_int64 = copy.deepcopy(_test_value)
 for f in _test_value_int64['faces']:
     f['vertex_index'] = [np.int64(x) for x in f['vertex_index']]
@@ -84,6 +88,52 @@ def test_translate_py2ply_errors():
     assert_raises(ValueError, PlyMetaschemaType.translate_py2ply, 'float128')
 
 
+def test_elements2array():
+    r"""Test conversion between lists of elements and structured arrays."""
+    for x in [_test_value, _test_value_tri]:
+        for e in ['vertices', 'edges', 'faces']:
+            if e not in x:
+                continue
+            arr = PlyMetaschemaType.elements2array(x[e])
+            assert_equal(len(arr), len(x[e]))
+            assert_equal(PlyMetaschemaType.array2elements(arr), x[e])
+            json.dumps(PlyMetaschemaType.array2elements(arr))
+    arr = PlyMetaschemaType.elements2array(_test_value['vertices'], ['x', 'y'])
+    assert_equal(arr.dtype.names, ('x', 'y'))
+    assert_raises(ValueError, PlyMetaschemaType.elements2array,
+                  [{'x': 0.0}, {'y': 0.0}], ['x'])
+
+
+def test_offset_indices():
+    r"""Test offset_indices."""
+    assert_equal(PlyMetaschemaType.offset_indices([], 1), [])
+    assert_equal(PlyMetaschemaType.offset_indices([[0, 1, 2], [2, 3, 4]], 2),
+                 [[2, 3, 4], [4, 5, 6]])
+    assert_equal(PlyMetaschemaType.offset_indices([[0, 1, 2], [2, 3, 4, 5]], 2),
+                 [[2, 3, 4], [4, 5, 6, 7]])
+    for x in PlyMetaschemaType.offset_indices([[0, 1, 2], [2, 3, 4, 5]], 2):
+        assert(all(isinstance(i, int) for i in x))
+
+
+def test_binary_plyformat():
+    r"""Test encoding/decoding using the binary ply formats."""
+    cls = PlyMetaschemaType.PlyMetaschemaType
+    for plyformat in ['binary_little_endian 1.0', 'binary_big_endian 1.0']:
+        for x in [_test_value, _test_value_tri]:
+            msg = cls.encode_data(x, None, plyformat=plyformat)
+            assert(isinstance(msg, bytes))
+            res = cls.decode_data(msg, None)
+            assert_equal(res, x)
+            # Decoded values are Python types that can be serialized as JSON
+            json.dumps(res)
+    assert_raises(ValueError, cls.encode_data, _test_value, None,
+                  plyformat='invalid')
+    msg = cls.encode_data(_test_value, None)
+    assert_raises(ValueError, cls.decode_data,
+                  msg.replace('ascii', 'invalid'), None)
+    assert_raises(ValueError, cls.decode_data, 'ply\nformat ascii 1.0\n', None)
+
+
 def test_singular2plural():
     r"""Test conversion from singular element names to plural ones and back."""
     pairs = [('face', 'faces'), ('vertex', 'vertices'),
@@ -120,7 +170,8 @@ class TestPlyDict(YggTestClassInfo):
 
     def test_mesh(self):
         r"""Test mesh."""
-        self.instance.mesh
+        mesh = self.instance.mesh
+        self.assert_equal(len(mesh), self.instance.nface)
 
     def test_merge(self):
         r"""Test merging two ply objects."""
@@ -134,6 +185,12 @@ class TestPlyDict(YggTestClassInfo):
         basic = self.import_cls(vertices=self.instance['vertices'],
                                 faces=[])
         basic.append(self.instance)
+        basic = self.import_cls(vertices=copy.deepcopy(self.instance['vertices']),
+                                faces=[])
+        basic.append(self.instance)
+        self.assert_equal(basic.nvert, 2 * self.instance.nvert)
+        self.assert_equal(basic.nface, self.instance.nface)
+        self.assert_equal(basic.mesh[-1], self.instance.mesh[-1])
 
     def test_apply_scalar_map(self, _as_obj=False):
         r"""Test applying a scalar colormap."""
@@ -186,6 +243,12 @@ class TestPlyDict(YggTestClassInfo):
         y = self.import_cls.from_dict(x)
         self.assert_equal(y, self.instance)
 
+    def test_to_from_array_dict(self):
+        r"""Test transformation to/from dict of structured arrays."""
+        x = self.instance.as_array_dict()
+        y = self.import_cls.from_array_dict(x)
+        self.assert_equal(y, self.instance)
+
     def test_properties(self):
         r"""Test explicit exposure of specific element counts as properties
         against counts based on singular elements."""
@@ -1,3 +1,4 @@
+import copy
 from yggdrasil.metaschema import normalizer as normalizer_mod
 from yggdrasil.metaschema.properties.MetaschemaProperty import MetaschemaProperty
 
@@ -24,5 +25,7 @@ class DefaultMetaschemaProperty(MetaschemaProperty):
         r"""Normalization method for 'default' property."""
         if (((not normalizer.NO_DEFAULTS)
              and isinstance(instance, normalizer_mod.UndefinedProperty))):
-            return value
+            # Copy so that the schema (which may be cached) is not modified
+            # by changes to the normalized instance
+            return copy.deepcopy(value)
         return instance
@@ -4,6 +4,7 @@ import numpy as np
 import shutil
 import tempfile
 import warnings
+import jsonschema
 from yggdrasil import metaschema
 from yggdrasil.tests import assert_raises, assert_equal
 
@@ -125,6 +126,25 @@ def test_validate_instance():
         metaschema.validate_instance(v, {'type': k})
 
 
+def test_cached_validator():
+    r"""Test reuse of validators for schemas with the same contents."""
+    schema = {'type': 'object', 'properties': {'a': {'type': 'int'}}}
+    with metaschema.cached_validator(schema) as x:
+        assert_equal(x.schema, schema)
+        # Recursive calls get a new instance
+        with metaschema.cached_validator(schema) as y:
+            assert(y is not x)
+    with metaschema.cached_validator(dict(schema)) as y:
+        assert(y is x)
+    # Modifying the schema does not change the cached validator
+    schema['properties']['a']['type'] = 'float'
+    with metaschema.cached_validator(schema) as y:
+        assert(y is not x)
+    metaschema.validate_instance({'a': float(1)}, schema)
+    assert_raises(jsonschema.ValidationError, metaschema.validate_instance,
+                  {'a': 'hello'}, schema)
+
+
 def test_normalize_instance():
     r"""Test normalize_instance."""
     for schema, x, y in _normalize_objects:
@@ -6,11 +6,16 @@ import signal
 import traceback
 from pprint import pformat
 from itertools import chain
+from collections import OrderedDict
 import socket
 from yggdrasil.tools import YggClass
 from yggdrasil.config import ygg_cfg, cfg_environment
 from yggdrasil import platform, backwards, yamlfile
+from yggdrasil.components import import_component
+from yggdrasil.communication import tracing
 from yggdrasil.drivers import create_driver
+from yggdrasil.drivers.CompiledModelDriver import (
+    CompiledModelDriver, run_compilation_tasks)
 
 
 COLOR_TRACE = '\033[30;43;22m'
@@ -48,6 +53,8 @@ class YggRunner(YggClass):
         outputdrivers (dict): Output drivers associated with this run.
         serverdrivers (dict): The addresses associated with different server
             drivers.
+        uncompiled_models (list): Names of compiled models that were created
+            without being compiled so that they can be compiled concurrently.
         interrupt_time (float): Time of last interrupt signal.
         error_flag (bool): True if one or more models raises an error.
 
@@ -69,6 +76,7 @@ class YggRunner(YggClass):
         self.inputdrivers = {}
         self.outputdrivers = {}
         self.serverdrivers = {}
+        self.uncompiled_models = []
         self.interrupt_time = 0
         self._inputchannels = {}
         self._outputchannels = {}
@@ -168,6 +176,7 @@ class YggRunner(YggClass):
             t0 = timer()
         times = {}
         times['init'] = timer()
+        self.clearTraces()
         self.loadDrivers()
         times['load drivers'] = timer()
         self.startDrivers()
@@ -188,8 +197,43 @@ class YggRunner(YggClass):
             tprev = times[k]
         self.info(40 * '=')
         self.info('%20s\t%f', "Total", tprev - t0)
+        self.exportTraces()
         return times
 
+    def clearTraces(self):
+        r"""Remove trace files left by previous runs if tracing is enabled."""
+        trace_dir = tracing.get_trace_dir()
+        if (trace_dir is None) or (not os.path.isdir(trace_dir)):
+            return
+        tracing.reset_tracer()
+        tracing.remove_trace_files(trace_dir)
+
+    def exportTraces(self):
+        r"""Export the events recorded by the runner and models as a Chrome
+        trace and a summary of the latency of each connection if tracing is
+        enabled.
+
+        Returns:
+            dict: Latency summary for each connection. None is returned if
+                tracing is not enabled.
+
+        """
+        trace_dir = tracing.get_trace_dir()
+        if trace_dir is None:
+            return None
+        tracing.reset_tracer()
+        if not os.path.isdir(trace_dir):  # pragma: debug
+            return {}
+        out = tracing.export_traces(trace_dir)
+        self.info('Message traces saved to %s', trace_dir)
+        for k in sorted(out.keys()):
+            v = out[k]
+            if 'latency' in v:
+                self.info('%s: %d messages, latency mean = %f s, max = %f s',
+                          k, v['count'], v['latency']['mean'],
+                          v['latency']['max'])
+        return out
+
     @property
     def all_drivers(self):
         r"""iterator: For all drivers."""
@@ -252,8 +296,22 @@ class YggRunner(YggClass):
 
         """
         yml['env'] = {}
+        drv_cls = import_component('model', yml['driver'], without_schema=True)
+        if issubclass(drv_cls, CompiledModelDriver) and ('skip_compile' not in yml):
+            # Compilation is deferred so that models compile concurrently
+            yml['skip_compile'] = True
+            self.uncompiled_models.append(yml['name'])
         for iod in self.io_drivers(yml['name']):
-            yml['env'].update(iod['instance'].env)
+            if yml.get('copy_index', 0) and hasattr(iod['instance'], 'worker_env'):
+                # Copies of server models receive requests via their own comm
+                # with the channel names prefixed by the name of the copy
+                prefix = '%s:' % yml['copy_of']
+                for k, v in iod['instance'].worker_env[yml['copy_index']].items():
+                    if k.startswith(prefix):
+                        k = '%s:%s' % (yml['name'], k[len(prefix):])
+                    yml['env'][k] = v
+            else:
+                yml['env'].update(iod['instance'].env)
             iod['models'].append(yml['name'])
         drv = self.createDriver(yml)
         if 'client_of' in yml:
@@ -263,6 +321,40 @@ class YggRunner(YggClass):
                    yml['name'], pformat(yml['instance'].env))
         return drv
 
+    def compileModels(self):
+        r"""Compile models that were created without being compiled.
+        Independent models are compiled concurrently, but models that
+        compile the same source files are compiled one after another."""
+        tasks = OrderedDict()
+        dependencies = {}
+        model_files = {}
+        for name in self.uncompiled_models:
+            driver = self.modeldrivers[name]
+            d = driver['instance']
+            tasks[driver['name']] = d.build
+            dependencies[driver['name']] = list(
+                model_files.get(d.model_file, []))
+            model_files.setdefault(d.model_file, []).append(driver['name'])
+        run_compilation_tasks(tasks, dependencies=dependencies)
+        self.uncompiled_models = []
+
+    def is_python_model(self, name):
+        r"""Determine if a model is written in Python and so receives
+        messages via the Python interface.
+
+        Args:
+            name (str): Name of the model.
+
+        Returns:
+            bool: True if the model is written in Python, False otherwise.
+
+        """
+        if name not in self.modeldrivers:
+            return False
+        drv_cls = import_component('model', self.modeldrivers[name]['driver'],
+                                   without_schema=True)
+        return (drv_cls.language == 'python')
+
     def createInputDriver(self, yml):
         r"""Create an input driver instance from the yaml information.
 
@@ -274,6 +366,10 @@ class YggRunner(YggClass):
 
         """
         yml['models'] = []
+        # Batches can only be unpacked by the Python interface
+        models = yml.get('model_driver', [])
+        yml.setdefault('forward_batches', bool(models) and all(
+            [self.is_python_model(x) for x in models]))
         if yml['args'] not in self._outputchannels:
             for x in yml['icomm_kws']['comm']:
                 if 'filetype' not in x:
@@ -295,6 +391,8 @@ class YggRunner(YggClass):
 
         """
         yml['models'] = []
+        # Messages are sent to an input driver which can unpack batches
+        yml.setdefault('forward_batches', True)
         if yml['args'] in self._inputchannels:
             yml.setdefault('comm_env', {})
             yml['comm_env'] = self._inputchannels[yml['args']]['instance'].comm_env
@@ -330,6 +428,15 @@ class YggRunner(YggClass):
             self.error("%s could not be created.", driver['name'])
             self.terminate()
             raise
+        # Compile models concurrently
+        self.debug("Compiling models")
+        try:
+            self.compileModels()
+        except BaseException as e:  # pragma: debug
+            self.error("%s could not be compiled.",
+                       getattr(e, 'task_name', 'Model'))
+            self.terminate()
+            raise
 
     def startDrivers(self):
         r"""Start drivers, starting with the IO drivers."""
@@ -442,6 +549,9 @@ class YggRunner(YggClass):
                 iod = self.inputdrivers['%s:%s' % (srv_name, srv_name)]
                 iod['instance'].on_client_exit()
                 srv['instance'].stop()
+                for x in self.modeldrivers.values():
+                    if x.get('copy_of', None) == srv_name:
+                        x['instance'].stop()
 
     def terminate(self):
         r"""Immediately stop all drivers, beginning with IO drivers."""
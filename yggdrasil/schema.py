@@ -58,8 +58,10 @@ def ordered_dump(data, **kwargs):
 
 def clear_schema():
     r"""Clear global schema."""
+    from yggdrasil.components import clear_component_schema_cache
     global _schema
     _schema = None
+    clear_component_schema_cache()
 
 
 def init_schema(fname=None):
@@ -101,6 +103,13 @@ def load_schema(fname=None):
     if not os.path.isfile(fname):
         x = create_schema()
         x.save(fname)
+        if fname == _schema_fname:
+            # Manifest for importing components is generated alongside
+            from yggdrasil.components import (
+                create_registry_manifest, save_registry_manifest,
+                clear_registry_manifest)
+            save_registry_manifest(create_registry_manifest(x))
+            clear_registry_manifest()
     return SchemaRegistry.from_file(fname)
 
 
@@ -764,8 +773,10 @@ class SchemaRegistry(object):
                 get_component_schema.
 
         """
-        comp_schema = self.get_component_schema(comp_name, **kwargs)
-        return metaschema.validate_instance(obj, comp_schema)
+        comp_schema, comp_key = self._get_cached_component_schema(
+            comp_name, **kwargs)
+        return metaschema.validate_instance(obj, comp_schema,
+                                            schema_key=comp_key)
 
     def normalize(self, obj, backwards_compat=False, **kwargs):
         r"""Normalize an object against this schema.
@@ -843,6 +854,50 @@ class SchemaRegistry(object):
             dict: Schema for the specified component.
 
         """
+        return copy.deepcopy(self._get_cached_component_schema(
+            comp_name, subtype=subtype, relaxed=relaxed,
+            allow_instance=allow_instance,
+            allow_instance_definitions=allow_instance_definitions)[0])
+
+    def _get_cached_component_schema(self, comp_name, subtype=None,
+                                     relaxed=False, allow_instance=False,
+                                     allow_instance_definitions=False):
+        r"""Get the cached schema for a certain component. The returned
+        schema should not be modified.
+
+        Args:
+            comp_name (str): Name of the component to get the schema for.
+            subtype (str, optional): Component subtype to get schema for.
+                Defaults to None and the schema for evaluating any subtype of
+                the specified component is returned.
+            relaxed (bool, optional): If True, the returned schema (and any
+                definitions it includes) are relaxed. Defaults to False.
+            allow_instance (bool, optional): If True, the returned schema will
+                validate instances of this component. Defaults to False.
+            allow_instance_definitions (bool, optional): If True, the
+                definitions in the returned schema will allow for instances of
+                the components. Defaults to False.
+
+        Returns:
+            tuple(dict, str): Schema for the specified component and the key
+                identifying it in the validator cache.
+
+        """
+        cache_key = ('component', comp_name, subtype, relaxed, allow_instance,
+                     allow_instance_definitions)
+        if cache_key not in self._cache:
+            out = self._create_component_schema(
+                comp_name, subtype=subtype, relaxed=relaxed,
+                allow_instance=allow_instance,
+                allow_instance_definitions=allow_instance_definitions)
+            self._cache[cache_key] = (out, metaschema.get_schema_key(out))
+        return self._cache[cache_key]
+
+    def _create_component_schema(self, comp_name, subtype=None, relaxed=False,
+                                 allow_instance=False,
+                                 allow_instance_definitions=False):
+        r"""Create the schema for a certain component. See
+        get_component_schema for a description of the arguments."""
         if comp_name not in self._storage:  # pragma: debug
             raise ValueError("Unrecognized component: %s" % comp_name)
         if subtype is None:
@@ -865,7 +920,10 @@ class SchemaRegistry(object):
             list: All of the valid properties for the specified component.
 
         """
-        return self._storage[comp_name].properties
+        cache_key = ('component_keys', comp_name)
+        if cache_key not in self._cache:
+            self._cache[cache_key] = self._storage[comp_name].properties
+        return list(self._cache[cache_key])
 
     @classmethod
     def register_normalizer(cls, path):
@@ -1088,7 +1146,8 @@ def _normalize_root(normalizer, value, instance, schema):
     #     normalizer.schema_registry = get_schema()
     if getattr(normalizer, 'iodict', None) is None:
         normalizer.iodict = {'inputs': {}, 'outputs': {}, 'connections': [],
-                             'input_drivers': [], 'output_drivers': [], 'pairs': [],
+                             'input_drivers': OrderedDict(),
+                             'output_drivers': OrderedDict(), 'pairs': [],
                              'inputs_extra': {}, 'outputs_extra': {},
                              'models': {},
                              'aliases': {'inputs': {}, 'outputs': {}}}
@@ -1138,7 +1197,7 @@ def _normalize_modelio_elements(normalizer, value, instance, schema):
             # Move non-comm keywords to a buffer
             if (s is not None):
                 comm_keys = s.get_component_keys('comm')
-                type_keys = list(metaschema.get_metaschema()['properties'].keys())
+                type_keys = metaschema.get_metaschema_property_names()
                 extra_keys = {}
                 migrate_keys(instance, [extra_keys], comm_keys + type_keys)
                 iodict['%s_extra' % io][instance['name']] = extra_keys
@@ -1149,22 +1208,22 @@ def _normalize_modelio_elements(normalizer, value, instance, schema):
         # Add driver to list
         if ('driver' in instance) and ('args' in instance):
             opp_map = {'inputs': 'output', 'outputs': 'input'}
-            for i, (opp_arg, opp_name) in enumerate(iodict['%s_drivers' % opp_map[io]]):
-                if instance['args'] == opp_arg:
-                    if io == 'inputs':
-                        iodict['pairs'].append(
-                            (iodict['%s_drivers' % opp_map[io]].pop(i)[1],
-                             instance['name']))
-                    else:  # pragma: debug
-                        # This won't be called because inputs are processed first
-                        # but this code is here for symmetries sake
-                        iodict['pairs'].append(
-                            (instance['name'],
-                             iodict['%s_drivers' % opp_map[io]].pop(i)[1]))
-                    break
+            # Drivers are indexed by args so pairs are found without a scan
+            opp_drivers = iodict['%s_drivers' % opp_map[io]]
+            opp_names = opp_drivers.get(instance['args'], [])
+            if opp_names:
+                opp_name = opp_names.pop(0)
+                if not opp_names:
+                    del opp_drivers[instance['args']]
+                if io == 'inputs':
+                    iodict['pairs'].append((opp_name, instance['name']))
+                else:  # pragma: debug
+                    # This won't be called because inputs are processed first
+                    # but this code is here for symmetries sake
+                    iodict['pairs'].append((instance['name'], opp_name))
             else:
-                iodict['%s_drivers' % io[:-1]].append(
-                    (instance['args'], instance['name']))
+                iodict['%s_drivers' % io[:-1]].setdefault(
+                    instance['args'], []).append(instance['name'])
     return instance
 
 
@@ -1189,7 +1248,8 @@ def _normalize_connio_base(normalizer, value, instance, schema):
             oyml.pop('working_dir', None)
             iyml.pop('working_dir', None)
         # File input
-        for k, v in iodict['input_drivers']:
+        for k, v in [(k, v) for k, names in iodict['input_drivers'].items()
+                     for v in names]:
             iyml = iodict['inputs'][v]
             fyml = dict(name=k, filetype=cdriver2filetype(iyml['driver']))
             if iyml.get('as_array', False):
@@ -1198,7 +1258,8 @@ def _normalize_connio_base(normalizer, value, instance, schema):
             conn = dict(input=fyml, output=v)
             new_connections.append(([iyml], conn))
         # File output
-        for k, v in iodict['output_drivers']:
+        for k, v in [(k, v) for k, names in iodict['output_drivers'].items()
+                     for v in names]:
             oyml = iodict['outputs'][v]
             fyml = dict(name=k, filetype=cdriver2filetype(oyml['driver']))
             if oyml.get('as_array', False):
@@ -1213,8 +1274,9 @@ def _normalize_connio_base(normalizer, value, instance, schema):
             iodict['connections'].append(conn)
             instance.append(conn)
         # Empty registry of orphan input/output drivers
-        for k in ['input_drivers', 'output_drivers', 'pairs']:
-            iodict[k] = []
+        for k in ['input_drivers', 'output_drivers']:
+            iodict[k] = OrderedDict()
+        iodict['pairs'] = []
     return instance
 
 
@@ -1418,7 +1480,7 @@ def _normalize_datatype(normalizer, value, instance, schema):
     r"""Normalize the datatype if the type information is in the comm."""
     if isinstance(instance, dict):
         if ('datatype' not in instance):
-            type_keys = list(metaschema.get_metaschema()['properties'].keys())
+            type_keys = metaschema.get_metaschema_property_names()
             # Don't include args in type_keys if driver in the instance
             if ('driver' in instance) and ('args' in type_keys):
                 type_keys.remove('args')
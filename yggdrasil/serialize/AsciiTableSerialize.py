@@ -1,7 +1,7 @@
 from yggdrasil import backwards, units, serialize
 from yggdrasil.serialize import _default_delimiter
 from yggdrasil.serialize.DefaultSerialize import DefaultSerialize
-from yggdrasil.metaschema import get_metaschema
+from yggdrasil.metaschema import get_metaschema_property_names
 from yggdrasil.metaschema.properties.ScalarMetaschemaProperties import (
     definition2dtype, data2dtype)
 
@@ -62,8 +62,7 @@ class AsciiTableSerialize(DefaultSerialize):
         # Transform scalar into array for table
         if kwargs.get('type', 'array') != 'array':
             old_typedef = {}
-            _metaschema = get_metaschema()
-            for k in _metaschema['properties'].keys():
+            for k in get_metaschema_property_names():
                 if k in kwargs:
                     old_typedef[k] = kwargs.pop(k)
             new_typedef = {'type': 'array', 'items': [old_typedef]}
@@ -10,6 +10,7 @@ class ObjSerialize(PlySerialize):
     _seritype = 'obj'
     _schema_subtype_description = ('Serialize 3D structures using Obj format.')
     default_datatype = {'type': 'obj'}
+    _schema_excluded_from_inherit = ['plyformat']
 
     def func_serialize(self, args):
         r"""Serialize a message.
@@ -34,8 +35,10 @@ class ObjSerialize(PlySerialize):
             obj: Deserialized message.
 
         """
-        return ObjDict(self.datatype.decode_data(backwards.as_str(msg),
-                                                 self.typedef))
+        out = self.datatype.decode_data(backwards.as_str(msg), self.typedef)
+        if not isinstance(out, ObjDict):
+            out = ObjDict(out)
+        return out
 
     @classmethod
     def get_testing_options(cls):
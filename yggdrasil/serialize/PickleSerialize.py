@@ -12,6 +12,7 @@ class PickleSerialize(DefaultSerialize):
                                    'pickle.')
     _default_type = {'type': 'bytes'}
     is_framed = True
+    _frame_cache = None
 
     def func_serialize(self, args):
         r"""Serialize a message.
@@ -36,9 +37,25 @@ class PickleSerialize(DefaultSerialize):
             obj: Deserialized Python object.
 
         """
+        cache, self._frame_cache = self._frame_cache, None
+        if (cache is not None) and ((msg is cache[0]) or (msg == cache[0])):
+            return cache[1]
         out = backwards.pickle.loads(msg)
         return out
 
+    def cache_frame(self, frame, obj):
+        r"""Store the object that a frame was unpickled into so that the
+        frame does not need to be unpickled again when it is deserialized.
+        The object is only used once and is discarded on the next call to
+        func_deserialize.
+
+        Args:
+            frame (bytes): Frame containing the pickled object.
+            obj (object): Object that was unpickled from the frame.
+
+        """
+        self._frame_cache = (frame, obj)
+
     @classmethod
     def get_first_frame(cls, msg):
         r"""Extract one frame from the provided message that may contain one
@@ -12,11 +12,17 @@ class PlySerialize(SerializeBase):
             serialized output. Defaults to True.
         newline (str, optional): String that should be used for new lines.
             Defaults to '\n'.
+        plyformat (str, optional): Ply format that should be used to
+            serialize messages. Defaults to 'ascii 1.0'. The binary formats
+            are much more compact and faster to read/write for large
+            structures.
 
     Attributes:
         write_header (bool): If True, headers will be added to serialized
             output.
         newline (str): String that should be used for new lines.
+        plyformat (str): Ply format that should be used to serialize
+            messages.
         default_rgb (list): Default color in RGB that should be used for
             missing colors.
 
@@ -26,7 +32,10 @@ class PlySerialize(SerializeBase):
     _schema_subtype_description = ('Serialize 3D structures using Ply format.')
     _schema_properties = {
         'newline': {'type': 'string',
-                    'default': backwards.as_str(_default_newline)}}
+                    'default': backwards.as_str(_default_newline)},
+        'plyformat': {'type': 'string', 'default': 'ascii 1.0',
+                      'enum': ['ascii 1.0', 'binary_little_endian 1.0',
+                               'binary_big_endian 1.0']}}
     default_datatype = {'type': 'ply'}
     concats_as_str = False
 
@@ -46,7 +55,8 @@ class PlySerialize(SerializeBase):
             bytes, str: Serialized message.
 
         """
-        return backwards.as_bytes(self.datatype.encode_data(args, self.typedef))
+        return backwards.as_bytes(self.datatype.encode_data(
+            args, self.typedef, plyformat=self.plyformat))
 
     def func_deserialize(self, msg):
         r"""Deserialize a message.
@@ -58,8 +68,10 @@ class PlySerialize(SerializeBase):
             obj: Deserialized message.
 
         """
-        return PlyDict(self.datatype.decode_data(backwards.as_str(msg),
-                                                 self.typedef))
+        out = self.datatype.decode_data(msg, self.typedef)
+        if not isinstance(out, PlyDict):
+            out = PlyDict(out)
+        return out
 
     @classmethod
     def concatenate(cls, objects, **kwargs):
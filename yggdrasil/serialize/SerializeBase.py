@@ -3,7 +3,7 @@ import pprint
 import numpy as np
 import warnings
 from yggdrasil import backwards, tools, units, serialize
-from yggdrasil.metaschema import get_metaschema
+from yggdrasil.metaschema import get_metaschema_property_names
 from yggdrasil.metaschema.datatypes import (
     guess_type_from_obj, get_type_from_def, get_type_class, compare_schema)
 from yggdrasil.metaschema.properties.ScalarMetaschemaProperties import (
@@ -13,6 +13,16 @@ from yggdrasil.metaschema.datatypes.ArrayMetaschemaType import (
     OneDArrayMetaschemaType)
 
 
+# Metadata keywords unrelated to serialization
+# TODO: Find a better way of tracking these
+_metadata_kws = ['body', 'address', 'size', 'id', 'incomplete', 'raw',
+                 'commtype', 'filetype', 'response_address', 'request_id',
+                 'append', 'in_temp', 'is_series', 'working_dir', 'fmts',
+                 'model_driver', 'env', 'send_converter', 'recv_converter',
+                 'typedef_base', 'binary', 'binary_buffers', 'batch',
+                 'persistent_response', 'trace_id']
+
+
 class SerializeBase(tools.YggClass):
     r"""Base class for serializing/deserializing a Python object into/from a
     bytes message.
@@ -440,9 +450,14 @@ class SerializeBase(tools.YggClass):
         if ((self.initialized or metadata.get('raw', False)
              or metadata.get('incomplete', False))):
             return
-        cls = guess_type_from_obj(msg)
-        typedef = cls.encode_type(msg)
-        typedef = cls.extract_typedef(typedef)
+        if isinstance(msg, backwards.bytes_type):
+            # The precision of bytes is not extracted so the type definition
+            # is the same for all bytes messages
+            typedef = {'type': 'bytes'}
+        else:
+            cls = guess_type_from_obj(msg)
+            typedef = cls.encode_type(msg)
+            typedef = cls.extract_typedef(typedef)
         metadata.update(typedef)
         self.initialize_serializer(metadata)
 
@@ -461,8 +476,45 @@ class SerializeBase(tools.YggClass):
         if ((self.initialized or metadata.get('raw', False)
              or metadata.get('incomplete', False))):
             return
+        # Skip the update if the same type information already left the
+        # serializer uninitialized (e.g. bytes messages for the default type)
+        key = self.get_initialization_key(metadata, extract=extract)
+        if (key is not None) and (key == self._uninitialized_key):
+            return
         self.update_serializer(extract=extract, **metadata)
         self.initialized = (self.typedef != self.default_datatype)
+        if not self.initialized:
+            self._uninitialized_key = key
+
+    def get_initialization_key(self, metadata, extract=False):
+        r"""Get the subset of metadata that determines how the serializer
+        will be updated by initialize_serializer.
+
+        Args:
+            metadata (dict): Header information including type info.
+            extract (bool, optional): If True, only the type information
+                that would be extracted from metadata is included. Defaults
+                to False.
+
+        Returns:
+            tuple: Extract flag and metadata entries related to
+                serialization, or None if they cannot be determined.
+
+        """
+        out = {}
+        for k, v in metadata.items():
+            if (k in _metadata_kws) or k.startswith('zmq'):
+                continue
+            out[k] = v
+        if extract and isinstance(out.get('type', None), backwards.string_types):
+            try:
+                reqkeys = get_type_class(out['type']).get_extract_properties(out)
+            except ValueError:  # pragma: debug
+                return None
+            for k in get_metaschema_property_names():
+                if (k in out) and (k not in reqkeys):
+                    del out[k]
+        return (extract, out)
 
     def update_serializer(self, extract=False, skip_type=False, **kwargs):
         r"""Update serializer with provided information.
@@ -482,25 +534,19 @@ class SerializeBase(tools.YggClass):
                 keywords (currect or old-style).
 
         """
+        self._uninitialized_key = None
         old_datatype = None
         if self.initialized:
             old_datatype = copy.deepcopy(self.datatype)
-        _metaschema = get_metaschema()
         # Raise an error if the types are not compatible
         seritype = kwargs.pop('seritype', self.seritype)
         if (seritype != self._seritype) and (seritype != 'default'):  # pragma: debug
             raise Exception("Cannot change types form %s to %s." %
                             (self._seritype, seritype))
         # Remove metadata keywords unrelated to serialization
-        # TODO: Find a better way of tracking these
-        _remove_kws = ['body', 'address', 'size', 'id', 'incomplete', 'raw',
-                       'commtype', 'filetype', 'response_address', 'request_id',
-                       'append', 'in_temp', 'is_series', 'working_dir', 'fmts',
-                       'model_driver', 'env', 'send_converter', 'recv_converter',
-                       'typedef_base']
         kws = list(kwargs.keys())
         for k in kws:
-            if (k in _remove_kws) or k.startswith('zmq'):
+            if (k in _metadata_kws) or k.startswith('zmq'):
                 kwargs.pop(k)
         # Set attributes and remove unused metadata keys
         for k in self._schema_properties.keys():
@@ -508,7 +554,7 @@ class SerializeBase(tools.YggClass):
                 setattr(self, k, kwargs.pop(k))
         # Create preliminary typedef
         typedef = kwargs.pop('datatype', {})
-        for k in _metaschema['properties'].keys():
+        for k in get_metaschema_property_names():
             if k in kwargs:
                 typedef[k] = kwargs.pop(k)
         # Update extra keywords
@@ -672,6 +718,8 @@ class SerializeBase(tools.YggClass):
 
         Raises:
             TypeError: If returned msg is not bytes type (str on Python 2).
+            ValueError: If header_kwargs requests a batch and the serializer
+                uses a serialization function.
 
 
         """
@@ -679,7 +727,13 @@ class SerializeBase(tools.YggClass):
             header_kwargs = {}
         if isinstance(args, backwards.bytes_type) and (args == tools.YGG_MSG_EOF):
             header_kwargs['raw'] = True
-        self.initialize_from_message(args, **header_kwargs)
+        if header_kwargs.get('batch', False):
+            if self.func_serialize is not None:
+                raise ValueError("Serializer of type '%s' cannot serialize "
+                                 "batches of messages." % self.seritype)
+            self.initialize_from_message(args[0], **header_kwargs)
+        else:
+            self.initialize_from_message(args, **header_kwargs)
         metadata = {'no_metadata': no_metadata}
         if add_serializer_info:
             self.debug("serializer_info = %s", str(self.serializer_info))
@@ -703,7 +757,9 @@ class SerializeBase(tools.YggClass):
                     if not no_metadata:
                         metadata['metadata'] = self.datatype.encode_type(
                             args, typedef=self.typedef)
-        if ((self.initialized
+        # Messages that left the serializer with the default type (e.g. bytes)
+        # match it trivially and do not need to be checked
+        if (((self.initialized or (self._uninitialized_key is not None))
              and (not tools.check_environ_bool('YGG_VALIDATE_ALL_MESSAGES')))):
             metadata.setdefault('dont_check', True)
         out = self.encoded_datatype.serialize(data, **metadata)
@@ -746,11 +802,12 @@ class SerializeBase(tools.YggClass):
                 out = self.func_deserialize(out)
         # Update serializer
         typedef_base = metadata.pop('typedef_base', {})
-        typedef = copy.deepcopy(metadata)
-        typedef.update(typedef_base)
-        if not ((metadata.get('size', 0) == 0)
+        if not (self.initialized
+                or (metadata.get('size', 0) == 0)
                 or metadata.get('incomplete', False)
                 or metadata.get('raw', False)):
+            typedef = copy.deepcopy(metadata)
+            typedef.update(typedef_base)
             self.initialize_serializer(typedef, extract=True)
         return out, metadata
 
@@ -22,6 +22,11 @@ _fmt_char = b'%'
 _default_comment = b'# '
 _default_delimiter = b'\t'
 _default_newline = b'\n'
+_split_formats = {}
+_message_formats = {}
+_split_converters = {'d': int, 'i': int, 'f': float, 'F': float, 'e': float,
+                     'E': float, 'g': float, 'G': float, 's': bytes,
+                     'j': complex}
 
 
 def extract_formats(fmt_str):
@@ -307,6 +312,84 @@ def format_message(args, fmt_str):
     return out
 
 
+def get_split_format(fmt_str):
+    r"""Get the components of a format string that can be parsed by splitting
+    messages on a single delimiter rather than with scanf. This is only
+    possible if all of the format codes are for decimal integers, floats,
+    complex numbers, or strings and they are separated by the same delimiter.
+    Results are cached.
+
+    Args:
+        fmt_str (str, bytes): Format string.
+
+    Returns:
+        tuple: Prefix before the first format code, suffix after the last
+            format code, delimiter between format codes, and the characters
+            identifying the type of each format code as bytes. None is
+            returned if the format string cannot be parsed by splitting.
+
+    """
+    fmt_str = backwards.as_bytes(fmt_str)
+    if fmt_str not in _split_formats:
+        out = None
+        fmts = extract_formats(fmt_str)
+        codes = [f[-1:] for f in fmts]
+        if fmts and all(backwards.as_str(c) in _split_converters for c in codes):
+            try:
+                info = format2table(fmt_str)
+            except RuntimeError:
+                info = None
+            if info is not None:
+                prefix = info.get('comment', b'')
+                suffix = info.get('newline', b'')
+                delimiter = info['delimiter']
+                if (prefix + delimiter.join(fmts) + suffix) == fmt_str:
+                    out = (prefix, suffix, delimiter, b''.join(codes))
+        _split_formats[fmt_str] = out
+    return _split_formats[fmt_str]
+
+
+def split_message(msg, fmt_str):
+    r"""Extract python objects from a message by splitting it on the
+    delimiter in the format string. This is faster than using scanf, but
+    only handles messages that exactly match the layout of the format string
+    (see get_split_format).
+
+    Args:
+        msg (bytes): Message that should be parsed.
+        fmt_str (str, bytes): Format string that should be used to parse the
+            message.
+
+    Returns:
+        tuple: Variables extracted from the message. None is returned if the
+            message cannot be parsed by splitting.
+
+    """
+    split_fmt = get_split_format(fmt_str)
+    if (split_fmt is None) or (not isinstance(msg, bytes)):
+        return None
+    prefix, suffix, delimiter, codes = split_fmt
+    if not (msg.startswith(prefix) and msg.endswith(suffix)):
+        return None
+    body = msg[len(prefix):(len(msg) - len(suffix))]
+    tokens = body.split(delimiter)
+    if len(tokens) != len(codes):
+        return None
+    out = []
+    try:
+        for t, c in zip(tokens, backwards.as_str(codes)):
+            if c == 's':
+                t = t.strip()
+                if (not t) or (len(t.split()) != 1):
+                    return None
+            elif c == 'j':
+                t = backwards.as_str(t)
+            out.append(_split_converters[c](t))
+    except ValueError:
+        return None
+    return tuple(out)
+
+
 def process_message(msg, fmt_str):
     r"""Extract python objects from a message using a format string.
 
@@ -326,16 +409,23 @@ def process_message(msg, fmt_str):
     """
     if not isinstance(msg, backwards.string_types):
         raise TypeError("Message must be a string or bytes string type.")
-    nfmt = len(extract_formats(fmt_str))
-    py_fmt_str = cformat2pyscanf(fmt_str)
-    args = backwards.scanf_bytes(py_fmt_str, msg)
+    if fmt_str not in _message_formats:
+        fmt_list = extract_formats(fmt_str)
+        dtype_list = None
+        if len(fmt_list) > 1:
+            dtype = cformat2nptype(fmt_str)
+            dtype_list = [dtype[i] for i in range(len(fmt_list))]
+        _message_formats[fmt_str] = (len(fmt_list), dtype_list)
+    nfmt, dtype_list = _message_formats[fmt_str]
+    args = split_message(msg, fmt_str)
+    if args is None:
+        py_fmt_str = cformat2pyscanf(fmt_str)
+        args = backwards.scanf_bytes(py_fmt_str, msg)
     if args is None:
         nargs = 0
     else:
         nargs = len(args)
-        if len(args) > 1:
-            dtype = cformat2nptype(fmt_str)
-            dtype_list = [dtype[i] for i in range(nargs)]
+        if (nargs > 1) and (nargs == nfmt):
             args = tuple([np.array([a], idtype)[0] for
                           a, idtype in zip(args, dtype_list)])
     if nargs != nfmt:
@@ -674,6 +764,61 @@ def array_to_table(arrs, fmt_str, use_astropy=False):
     return out
 
 
+def split_table(msg, fmt_str, dtype=None):
+    r"""Extract information from an ASCII table as an array by splitting the
+    whole table on the delimiter and newline in the format string and
+    converting each column with numpy. Lines that begin with a comment (the
+    prefix of the format string or '#') are skipped.
+
+    Args:
+        msg (bytes): ASCII table as bytes string.
+        fmt_str (bytes): Format string that should be used to parse the table.
+        dtype (np.dtype, optional): Structured data type of the output array.
+            Defaults to None and is determined from fmt_str.
+
+    Returns:
+        np.ndarray: Table contents as an array. None is returned if the
+            table cannot be parsed by splitting (see get_split_format).
+
+    """
+    split_fmt = get_split_format(fmt_str)
+    if (split_fmt is None) or (not isinstance(msg, bytes)):
+        return None
+    prefix, suffix, delimiter, codes = split_fmt
+    if dtype is None:
+        dtype = cformat2nptype(fmt_str)
+    if (((suffix != _default_newline) or (len(codes) < 2)
+         or any(dtype[i].itemsize == 0 for i in range(len(codes))))):
+        return None
+    comment = (prefix.strip() or b'#')
+    lines = msg.splitlines()
+    if comment in msg:
+        lines = [x for x in lines if not x.lstrip().startswith(comment)]
+        if any(comment in x for x in lines):
+            return None
+    if not all(lines):
+        lines = [x for x in lines if x]
+    if not lines:
+        return None
+    tokens = delimiter.join(lines).split(delimiter)
+    if len(tokens) != (len(lines) * len(codes)):
+        return None
+    cols = np.array(tokens).reshape(len(lines), len(codes))
+    out = np.empty(len(lines), dtype)
+    try:
+        for i, c in enumerate(backwards.as_str(codes)):
+            icol = cols[:, i]
+            if c == 's':
+                icol = np.char.strip(icol)
+            out[dtype.names[i]] = icol.astype(dtype[i])
+    except ValueError:
+        return None
+    if len(lines) == 1:
+        # Match np.genfromtxt which returns a 0-d array for a single row
+        out = out.reshape(())
+    return out
+
+
 def table_to_array(msg, fmt_str=None, use_astropy=False, names=None,
                    delimiter=None, comment=None, encoding='utf-8'):
     r"""Extract information from an ASCII table as an array.
@@ -708,6 +853,10 @@ def table_to_array(msg, fmt_str=None, use_astropy=False, names=None,
         dtype = cformat2nptype(fmt_str, names=names)
         info = format2table(fmt_str)
         names = dtype.names
+    if (dtype is not None) and (not use_astropy):
+        arr = split_table(msg, fmt_str, dtype=dtype)
+        if arr is not None:
+            return arr
     fd = backwards.BytesIO(msg)
     if names is not None:
         names = [backwards.as_str(n) for n in names]
@@ -9,3 +9,17 @@ class TestPickleSerialize(parent.TestSerializeBase):
     def test_get_first_frame(self):
         r"""Test get_first_frame for empty message."""
         self.assert_equal(self.import_cls.get_first_frame(b'not a pickle'), b'')
+
+    def test_cache_frame(self):
+        r"""Test that a cached object is used once in place of unpickling."""
+        obj = {'a': [1, 2, 3]}
+        frame = self.instance.func_serialize(obj)
+        self.instance.cache_frame(frame, obj)
+        assert(self.instance.func_deserialize(frame) is obj)
+        x = self.instance.func_deserialize(frame)
+        assert(x is not obj)
+        self.assert_equal(x, obj)
+        self.instance.cache_frame(frame, obj)
+        self.assert_equal(
+            self.instance.func_deserialize(self.instance.func_serialize(1)), 1)
+        assert(self.instance.func_deserialize(frame) is not obj)
@@ -5,3 +5,14 @@ class TestPlySerialize(parent.TestSerializeBase):
     r"""Test class for TestPlySerialize class."""
 
     _cls = 'PlySerialize'
+
+    def test_plyformat(self):
+        r"""Test serialization using the supported ply formats."""
+        plyformats = self.import_cls._schema_properties.get(
+            'plyformat', {}).get('enum', [])
+        for plyformat in plyformats:
+            inst = self.import_cls(plyformat=plyformat)
+            for iobj in self.testing_options['objects']:
+                msg = inst.serialize(iobj)
+                iout, ihead = inst.deserialize(msg)
+                self.assert_result_equal(iout, iobj)
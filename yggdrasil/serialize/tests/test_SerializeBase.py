@@ -13,6 +13,21 @@ def test_demote_string():
                              'items': [{'type': 'bytes'}]})
 
 
+def test_initialize_default():
+    r"""Test initialization from messages that match the default type."""
+    x = import_component('serializer', 'default')()
+    for msg in [b'hello', b'goodbye']:
+        out = x.deserialize(x.serialize(msg))
+        assert_equal(out[0], msg)
+        assert(not x.initialized)
+        key = x.get_initialization_key({'type': 'bytes'}, extract=True)
+        assert_equal(x._uninitialized_key, key)
+    out = x.deserialize(x.serialize(1.0))
+    assert_equal(out[0], 1.0)
+    assert(x.initialized)
+    assert_equal(x._uninitialized_key, None)
+
+
 class TestSerializeBase(YggTestClassInfo):
     r"""Test class for SerializeBase class."""
 
@@ -187,6 +187,37 @@ def test_format_message():
     assert_raises(ValueError, serialize.process_message, b'hello', "%d")
 
 
+def test_split_message():
+    r"""Test parsing messages by splitting on the delimiter."""
+    fmt = b'%5s\t%ld\t%lf\t%g%+gj\n'
+    assert_equal(serialize.get_split_format(fmt),
+                 (b'', b'\n', b'\t', b'sdfj'))
+    assert_equal(serialize.get_split_format(b'%x\t%d\n'), None)
+    assert_equal(serialize.get_split_format(b'%d %d\t%d\n'), None)
+    assert_equal(serialize.split_message(b'one \t1\t1.5\t1+2j\n', fmt),
+                 (b'one', 1, 1.5, 1 + 2j))
+    for msg in [b'one\t1\t1.5\n', b'one\t1\t1.5\t1+2j', b'o e\t1\t1.5\t1+2j\n',
+                b'one\t1.5\t1.5\t1+2j\n', u'one\t1\t1.5\t1+2j\n']:
+        assert_equal(serialize.split_message(msg, fmt), None)
+    # Messages that cannot be split fall back to scanf
+    assert_equal(serialize.process_message(b'1 2\n', b'%d\t%d\n'), (1, 2))
+
+
+def test_split_table():
+    r"""Test parsing tables by splitting on the delimiter."""
+    fmt = b'# %5s\t%ld\t%lf\t%g%+gj\n'
+    dtype = serialize.cformat2nptype(fmt)
+    arr0 = np.ones(5, dtype)
+    arr0['f0'][0] = b'hello'
+    tab = b'# name\tcount\tsize\tz\n' + serialize.array_to_table(arr0, fmt)
+    np.testing.assert_array_equal(serialize.split_table(tab, fmt), arr0)
+    np.testing.assert_array_equal(serialize.split_table(tab, fmt),
+                                  serialize.table_to_array(tab, fmt))
+    assert_equal(serialize.split_table(tab.splitlines(True)[1], fmt).shape, ())
+    for tab in [b'', b'1\t2\n', b'hello\t1\t1\t1+0j  # comment\n']:
+        assert_equal(serialize.split_table(tab, fmt), None)
+
+
 def test_combine_flds():
     r"""Test combine_flds."""
     names0 = ['f0', 'f1', 'f2', 'f3']
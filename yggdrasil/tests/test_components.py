@@ -1,4 +1,7 @@
-from yggdrasil.tests import assert_raises
+import os
+import json
+import importlib
+from yggdrasil.tests import assert_raises, assert_equal
 from yggdrasil import components
 
 
@@ -25,6 +28,48 @@ def test_import_component():
     components.restore_registry(out)
 
 
+def test_registry_manifest():
+    r"""Test the manifest used to import components without the schema."""
+    manifest = components.get_registry_manifest()
+    assert_equal(manifest, json.loads(json.dumps(
+        components.create_registry_manifest())))
+    for k, v in manifest.items():
+        for ksub, kcls in v['subtypes'].items():
+            assert(kcls in v['modules'])
+        for kcls, kmod in v['modules'].items():
+            assert(hasattr(importlib.import_module(kmod), kcls))
+        base_class = components.get_component_base_class(k)
+        assert_equal(base_class.__name__, v['base_class'])
+    # Test saving/loading manifest
+    fname = 'test_registry.json'
+    components.save_registry_manifest(manifest, fname=fname)
+    try:
+        with open(fname, 'r') as fd:
+            assert_equal(json.load(fd), manifest)
+    finally:
+        os.remove(fname)
+    components.clear_registry_manifest()
+    assert_equal(components.get_registry_manifest(), manifest)
+
+
+def test_get_component_validation_schema():
+    r"""Test caching of schemas used to validate component kwargs."""
+    from yggdrasil import schema
+    props, s, key = components.get_component_validation_schema(
+        'comm', 'zmq', excluded_from_validation=['datatype'])
+    assert('datatype' in props)
+    assert('datatype' not in s['properties'])
+    out = components.get_component_validation_schema(
+        'comm', 'zmq', excluded_from_validation=['datatype'])
+    assert(out[1] is s)
+    assert_equal(out[2], key)
+    schema.clear_schema()
+    out = components.get_component_validation_schema(
+        'comm', 'zmq', excluded_from_validation=['datatype'])
+    assert(out[1] is not s)
+    assert_equal(out[1], s)
+
+
 def test_create_component():
     r"""Test dynamic creation of component instance."""
     x = components.create_component('serializer', seritype='direct')
@@ -3,7 +3,7 @@ import unittest
 import signal
 import uuid
 from yggdrasil import runner, tools, platform
-from yggdrasil.tests import YggTestBase, assert_raises
+from yggdrasil.tests import YggTestBase, assert_raises, assert_equal
 # from yggdrasil.tests import yamls as sc_yamls
 from yggdrasil.examples import yamls as ex_yamls
 
@@ -61,6 +61,24 @@ def test_runner_terminate():
     cr.terminate()
 
 
+def test_runner_forward_batches():
+    r"""Test that connections only forward batches to Python models."""
+    from yggdrasil.drivers.CModelDriver import CModelDriver
+    languages = ['python']
+    if CModelDriver.is_installed():  # pragma: no cover
+        languages.append('c')
+    for lang in languages:
+        cr = runner.get_runner([ex_yamls['hello'][lang]])
+        try:
+            cr.loadDrivers()
+            for x in cr.inputdrivers.values():
+                assert_equal(x['instance'].forward_batches, (lang == 'python'))
+            for x in cr.outputdrivers.values():
+                assert(x['instance'].forward_batches)
+        finally:
+            cr.terminate()
+
+
 def test_runner_error():
     r"""Test error on missing yaml."""
     assert_raises(IOError, runner.YggRunner,
@@ -86,3 +104,14 @@ class TestYggRunner(YggTestBase):
         assert_raises(Exception, self.runner.createInputDriver, yml)
         yml['driver'] = 'OutputDriver'
         assert_raises(Exception, self.runner.createOutputDriver, yml)
+
+    def test_is_python_model(self):
+        r"""Test is_python_model."""
+        assert(self.runner.is_python_model('hello_python'))
+        assert(not self.runner.is_python_model('fake_model'))
+        self.runner.modeldrivers['fake_model'] = {'name': 'fake_model',
+                                                  'driver': 'CModelDriver'}
+        try:
+            assert(not self.runner.is_python_model('fake_model'))
+        finally:
+            del self.runner.modeldrivers['fake_model']
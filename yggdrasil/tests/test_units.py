@@ -70,6 +70,42 @@ class TestUnits(YggTestBase):
             units.convert_to(v, 'm')
             self.assert_raises(ValueError, units.convert_to, v, 's')
 
+    def test_convert_to_offset(self):
+        r"""Test convert_to for units with offsets."""
+        x = units.add_units(np.array([0.0, 100.0]), 'degC')
+        self.assert_equal(units.get_data(units.convert_to(x, 'K')),
+                          np.array([273.15, 373.15]))
+        x = units.add_units(np.arange(3), 'cm')
+        self.assert_equal(units.get_data(units.convert_to(x, 'm')),
+                          np.array([0.0, 0.01, 0.02]))
+
+    def test_get_conversion_factor(self):
+        r"""Test get_conversion_factor."""
+        units.clear_cache()
+        self.assert_equal(units.get_conversion_factor('m', 'cm'), (100.0, 0.0))
+        self.assert_equal(units.get_conversion_factor('m', 'cm'), (100.0, 0.0))
+        factor, offset = units.get_conversion_factor('degC', 'K')
+        self.assert_equal((factor, offset), (1.0, 273.15))
+        self.assert_raises(ValueError, units.get_conversion_factor, 'cm', 's')
+        self.assert_raises(ValueError, units.get_conversion_factor,
+                           'cm', 'invalid')
+
+    def test_convert_data(self):
+        r"""Test convert_data."""
+        x = units.convert_data(np.arange(3), 'cm', 'm')
+        self.assert_equal(x, np.array([0.0, 0.01, 0.02]))
+        self.assert_equal(units.convert_data(100.0, 'degC', 'K'), 373.15)
+        x = units.convert_data(np.zeros(2, dtype='f4'), 'degC', 'K')
+        self.assert_equal(x.dtype, np.dtype('f4'))
+
+    def test_cache(self):
+        r"""Test caching of parsed units."""
+        units.clear_cache()
+        x = units.as_unit('cm')
+        assert(units.as_unit('cm') is x)
+        units.clear_cache()
+        assert(units.as_unit('cm') is not x)
+
     def test_are_compatible(self):
         r"""Test are_compatible."""
         assert(units.are_compatible('cm', 'm'))
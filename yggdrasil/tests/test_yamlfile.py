@@ -1,8 +1,11 @@
 import tempfile
+import shutil
 import os
+import json
 import yaml
 from jsonschema.exceptions import ValidationError
 from yggdrasil import yamlfile
+from yggdrasil.config import ygg_cfg
 from yggdrasil.backwards import StringIO
 from yggdrasil.tests import YggTestClass, assert_raises, assert_equal
 _yaml_env = 'TEST_YAML_FILE'
@@ -56,6 +59,53 @@ def test_parse_component_error():
                   {}, 'invalid', 'invalid')
 
 
+def test_parse_yaml_cache():
+    r"""Test reuse of normalized YAML documents from the cache and removal of
+    the least recently used documents."""
+    old_cfg = {k: ygg_cfg.get('yaml', k, '') for k in
+               ['cache', 'cache_dir', 'cache_max_entries']}
+    cache_dir = tempfile.mkdtemp()
+    working_dir = tempfile.mkdtemp()
+    fname = os.path.join(working_dir, 'test_cache.yml')
+    ygg_cfg.set('yaml', 'cache', 'True')
+    ygg_cfg.set('yaml', 'cache_dir', cache_dir)
+    ygg_cfg.set('yaml', 'cache_max_entries', '2')
+    contents = ('model:\n  name: %s\n  language: python\n'
+                '  args: ./src/model.py\n')
+    try:
+        assert_equal(yamlfile.get_yaml_cache_dir(), cache_dir)
+        with open(fname, 'w') as fd:
+            fd.write(contents % 'modelA')
+        yamlfile.parse_yaml(fname)
+        cache_files = os.listdir(cache_dir)
+        assert_equal(len(cache_files), 1)
+        # Alter the cached document so that it is evident if it is used
+        cache_file = os.path.join(cache_dir, cache_files[0])
+        with open(cache_file, 'r') as fd:
+            cached = json.load(fd)
+        cached['models'][0]['args'] = ['./src/cached.py']
+        with open(cache_file, 'w') as fd:
+            json.dump(cached, fd)
+        out = yamlfile.parse_yaml(fname)
+        assert_equal(out['model']['modelA']['args'], ['./src/cached.py'])
+        # Older documents are removed once the limit is reached
+        os.utime(cache_file, (0, 0))
+        for name in ['modelB', 'modelC']:
+            with open(fname, 'w') as fd:
+                fd.write(contents % name)
+            yamlfile.parse_yaml(fname)
+        assert_equal(len(os.listdir(cache_dir)), 2)
+        assert(not os.path.isfile(cache_file))
+        # Disabled cache is not used
+        ygg_cfg.set('yaml', 'cache', 'False')
+        assert_equal(yamlfile.get_yaml_cache_dir(), None)
+    finally:
+        for k, v in old_cfg.items():
+            ygg_cfg.set('yaml', k, v)
+        shutil.rmtree(cache_dir)
+        shutil.rmtree(working_dir)
+
+
 class YamlTestBase(YggTestClass):
     r"""Test base for yamlfile."""
     _contents = tuple()
@@ -169,6 +219,34 @@ class TestYamlServerClient(YamlTestBase):
                   '    client_of: modelA'],)
 
 
+class TestYamlServerCopies(YamlTestBase):
+    r"""Test specification of a server model with multiple copies."""
+    _contents = (['models:',
+                  '  - name: modelA',
+                  '    driver: GCCModelDriver',
+                  '    args: ./src/modelA.c',
+                  '    is_server: True',
+                  '    copies: 3'],
+                 ['model:',
+                  '  - name: modelB',
+                  '    driver: GCCModelDriver',
+                  '    args: ./src/modelB.c',
+                  '    client_of: modelA'],)
+
+    def test_parse_yaml(self):
+        r"""Test that copies are added to the models and server driver."""
+        out = yamlfile.parse_yaml(self.files)
+        copies = ['modelA_copy1', 'modelA_copy2']
+        for i, k in enumerate(copies):
+            assert(k in out['model'])
+            assert_equal(out['model'][k]['copy_of'], 'modelA')
+            assert_equal(out['model'][k]['copy_index'], i + 1)
+            assert(not out['model'][k]['overwrite'])
+        srv = out['input']['modelA:modelA']
+        assert_equal(srv['copies'], 3)
+        assert_equal(srv['model_driver'], ['modelA'] + copies)
+
+
 class TestYamlIODrivers(YamlTestBase):
     r"""Test full specification of IO drivers."""
     _contents = (['models:',
@@ -556,6 +634,36 @@ class TestYamlDuplicateError(YamlTestBaseError):
                   '    args: ./src/modelA.c'],)
 
 
+class TestYamlCopiesError_server(YamlTestBaseError):
+    r"""Test error when a model that is not a server has copies."""
+    _error = ValueError
+    _contents = (['models:',
+                  '  - name: modelA',
+                  '    driver: GCCModelDriver',
+                  '    args: ./src/modelA.c',
+                  '    copies: 2'],)
+
+
+class TestYamlCopiesError_io(YamlTestBaseError):
+    r"""Test error when a server model with copies has other I/O channels."""
+    _error = ValueError
+    _contents = (['models:',
+                  '  - name: modelA',
+                  '    driver: GCCModelDriver',
+                  '    args: ./src/modelA.c',
+                  '    is_server: True',
+                  '    copies: 2',
+                  '    outputs: outputA',
+                  '  - name: modelB',
+                  '    driver: GCCModelDriver',
+                  '    args: ./src/modelB.c',
+                  '    client_of: modelA',
+                  '    inputs: inputB',
+                  'connections:',
+                  '  - input: outputA',
+                  '    output: inputB'],)
+
+
 class TestYamlConnectionError(YamlTestBaseError):
     r"""Test error when there is not connection for a model I/O channel."""
     _error = RuntimeError
@@ -33,6 +33,7 @@ if ((logging.getLogger("yggdrasil").getEffectiveLevel()
     _stack_in_timeout = True
 _thread_registry = {}
 _lock_registry = {}
+_safe_eval_globals = None
 try:
     _main_thread = threading.main_thread()
 except AttributeError:
@@ -346,6 +347,58 @@ def remove_path(fpath, timer_class=None, timeout=None):
             raise RuntimeError("Failed to remove file: %s" % fpath)
 
 
+def prune_cache(entries, max_entries):
+    r"""Remove the least recently used entries from a cache so that at
+    most max_entries remain. Entries are ordered by their modification time,
+    which caches should update when an entry is used. Entries that cannot be
+    removed (e.g. because another process is using them) are skipped.
+
+    Args:
+        entries (list): Full paths to the files or directories that make up
+            the entries in the cache.
+        max_entries (int): Maximum number of entries that should be kept. If
+            less than 1, the number of entries is not limited.
+
+    Returns:
+        list: Entries that were removed.
+
+    """
+    if (max_entries < 1) or (len(entries) <= max_entries):
+        return []
+    mtimes = []
+    for x in entries:
+        try:
+            mtimes.append((os.path.getmtime(x), x))
+        except OSError:  # pragma: debug
+            pass
+    mtimes.sort()
+    out = []
+    for _, x in mtimes[:max(len(mtimes) - max_entries, 0)]:
+        try:
+            if os.path.isdir(x):
+                shutil.rmtree(x)
+            else:
+                os.remove(x)
+            out.append(x)
+        except OSError:  # pragma: debug
+            pass
+    return out
+
+
+def touch_cache_entry(entry):
+    r"""Mark a cache entry as recently used by updating its modification
+    time so that it is not removed by prune_cache before older entries.
+
+    Args:
+        entry (str): Full path to the file or directory for the entry.
+
+    """
+    try:
+        os.utime(entry, None)
+    except OSError:  # pragma: debug
+        pass
+
+
 def get_supported_platforms():
     r"""Get a list of the platforms supported by yggdrasil.
 
@@ -364,9 +417,8 @@ def get_supported_lang():
         list: The names of programming languages supported by yggdrasil.
     
     """
-    from yggdrasil import schema
-    s = schema.get_schema()
-    out = s['model'].subtypes
+    from yggdrasil.components import get_registry_manifest
+    out = sorted(get_registry_manifest()['model']['subtypes'].keys())
     if 'c++' in out:
         out[out.index('c++')] = 'cpp'
     # if 'R' in out:
@@ -394,9 +446,8 @@ def get_supported_comm():
         list: The names of communication mechanisms supported by yggdrasil.
 
     """
-    from yggdrasil import schema
-    s = schema.get_schema()
-    out = s['comm'].subtypes
+    from yggdrasil.components import get_registry_manifest
+    out = sorted(get_registry_manifest()['comm']['subtypes'].keys())
     for k in ['CommBase', 'DefaultComm', 'default']:
         if k in out:
             out.remove(k)
@@ -488,13 +539,15 @@ def get_installed_comm(language=None):
 
 def get_default_comm():
     r"""Get the default comm that should be used for message passing."""
-    comm_list = get_installed_comm()
     if 'YGG_DEFAULT_COMM' in os.environ:
         _default_comm = os.environ['YGG_DEFAULT_COMM']
-        if not is_comm_installed(_default_comm, language='any'):  # pragma: debug
+        _default_lang = os.environ.get('YGG_MODEL_LANGUAGE', 'any')
+        if not is_comm_installed(_default_comm,
+                                 language=_default_lang):  # pragma: debug
             raise Exception('Unsupported default comm %s set by YGG_DEFAULT_COMM' % (
                             _default_comm))
     else:
+        comm_list = get_installed_comm()
         if len(comm_list) > 0:
             _default_comm = comm_list[0]
         else:  # pragma: windows
@@ -613,18 +666,18 @@ def sleep(interval):
         time.sleep(interval)
 
 
-def safe_eval(statement, **kwargs):
-    r"""Run eval with a limited set of builtins and Python libraries/functions.
-
-    Args:
-        statement (str): Statement that should be evaluated.
-        **kwargs: Additional keyword arguments are variables that are made available
-            to the statement during evaluation.
+def get_safe_eval_globals():
+    r"""Get the limited set of builtins and Python libraries/functions that are
+    available to statements evaluated by safe_eval. The namespace is created
+    the first time this is called and then reused.
 
     Returns:
-        object: Result of the eval.
+        dict: Global namespace for safe_eval.
 
     """
+    global _safe_eval_globals
+    if _safe_eval_globals is not None:
+        return _safe_eval_globals
     from yggdrasil import units
     safe_dict = {}
     _safe_lists = {'math': ['acos', 'asin', 'atan', 'atan2', 'ceil', 'cos',
@@ -652,7 +705,40 @@ def safe_eval(statement, **kwargs):
             mod = importlib.import_module(mod_name)
             for func in func_list:
                 safe_dict[func] = getattr(mod, func)
-    safe_dict.update(kwargs)
+    safe_dict['__builtins__'] = None
+    _safe_eval_globals = safe_dict
+    return _safe_eval_globals
+
+
+def compile_statement(statement):
+    r"""Compile a statement so that it can be evaluated by safe_eval multiple
+    times without being parsed again.
+
+    Args:
+        statement (str): Statement that should be compiled.
+
+    Returns:
+        code: Compiled statement.
+
+    """
+    return compile(statement, '<statement>', 'eval')
+
+
+def safe_eval(statement, **kwargs):
+    r"""Run eval with a limited set of builtins and Python libraries/functions.
+
+    Args:
+        statement (str, code): Statement that should be evaluated or a
+            statement compiled by compile_statement.
+        **kwargs: Additional keyword arguments are variables that are made available
+            to the statement during evaluation.
+
+    Returns:
+        object: Result of the eval.
+
+    """
+    if isinstance(statement, backwards.string_types):
+        statement = compile_statement(statement)
     # The following replaces <Class Name(a, b)> style reprs with calls to classes
     # identified in self._no_eval_class
     # regex = r'<([^<>]+)\(([^\(\)]+)\)>'
@@ -666,7 +752,41 @@ def safe_eval(statement, **kwargs):
     #                          % (match.group(0), statement))
     #     statement = statement.replace(match.group(0),
     #                                   '%s(%s)' % (cls_repl, match.group(2)), 1)
-    return eval(statement, {"__builtins__": None}, safe_dict)
+    return eval(statement, get_safe_eval_globals(), kwargs)
+
+
+def is_vectorizable_batch(x):
+    r"""Determine if a batch of messages can be processed at once using
+    NumPy semantics (i.e. it is a 1D array, a structured array, or a Pandas
+    data frame where each element/row is a message).
+
+    Args:
+        x (object): Batch of messages.
+
+    Returns:
+        bool: True if the batch can be processed at once, False otherwise.
+
+    """
+    if hasattr(x, 'iterrows'):
+        return True
+    return (hasattr(x, 'ndim') and hasattr(x, 'dtype') and (x.ndim == 1))
+
+
+def iter_batch(x):
+    r"""Iterate over the messages in a batch.
+
+    Args:
+        x (list, np.ndarray, pandas.DataFrame): Batch of messages. For arrays
+            and data frames, each element/row along the first axis is a
+            message.
+
+    Returns:
+        iterator: Messages in the batch.
+
+    """
+    if hasattr(x, 'iterrows'):
+        return (row for _, row in x.iterrows())
+    return iter(x)
 
 
 def eval_kwarg(x):
@@ -1,6 +1,8 @@
 import re
+import threading
 import numpy as np
 import logging
+from collections import OrderedDict
 from yggdrasil import backwards
 if backwards.PY2:  # pragma: Python 2
     import pint
@@ -25,6 +27,54 @@ if _use_unyt:
 else:
     _unit_quantity = _ureg_pint.Quantity
     _unit_array = _ureg_pint.Quantity
+_cache_size = 256
+_cache_lock = threading.Lock()
+_unit_cache = OrderedDict()
+_factor_cache = OrderedDict()
+
+
+def _cache_get(cache, key):
+    r"""Get an entry from a least recently used cache, marking it as the
+    most recently used.
+
+    Args:
+        cache (OrderedDict): Cache to get the entry from.
+        key (object): Key for the entry.
+
+    Returns:
+        object: Cached entry. None is returned if there is not an entry for
+            the key.
+
+    """
+    with _cache_lock:
+        out = cache.pop(key, None)
+        if out is not None:
+            cache[key] = out
+    return out
+
+
+def _cache_set(cache, key, value):
+    r"""Add an entry to a least recently used cache, discarding the least
+    recently used entry if the cache is full.
+
+    Args:
+        cache (OrderedDict): Cache to add the entry to.
+        key (object): Key for the entry.
+        value (object): Entry to add.
+
+    """
+    with _cache_lock:
+        cache.pop(key, None)
+        cache[key] = value
+        while len(cache) > _cache_size:
+            cache.popitem(last=False)
+
+
+def clear_cache():
+    r"""Clear the cache of parsed units and conversion factors."""
+    with _cache_lock:
+        _unit_cache.clear()
+        _factor_cache.clear()
 
 
 def convert_R_unit_string(r_str):
@@ -130,10 +180,11 @@ def add_units(arr, unit_str, dtype=None):
         else:
             dtype = np.array([arr]).dtype
     if _use_unyt:
+        unit = as_unit(unit_str)
         if isinstance(arr, np.ndarray) and (arr.ndim > 0):
-            out = unyt.unyt_array(arr, unit_str, dtype=dtype)
+            out = unyt.unyt_array(arr, unit, dtype=dtype)
         else:
-            out = unyt.unyt_quantity(arr, unit_str, dtype=dtype)
+            out = unyt.unyt_quantity(arr, unit, dtype=dtype)
     else:
         out = _ureg_pint.Quantity(arr, unit_str)
     return out
@@ -153,11 +204,8 @@ def are_compatible(units1, units2):
     # Empty units always compatible
     if is_null_unit(units1) or is_null_unit(units2):
         return True
-    if (not is_unit(units1)) or (not is_unit(units2)):
-        return False
-    x = add_units(1, units1)
     try:
-        convert_to(x, units2)
+        get_conversion_factor(units1, units2)
     except ValueError:
         return False
     return True
@@ -191,6 +239,9 @@ def as_unit(ustr):
         ValueError: If the string is not a recognized unit.
 
     """
+    out = _cache_get(_unit_cache, ustr)
+    if out is not None:
+        return out
     if _use_unyt:
         try:
             out = unyt.Unit(ustr)
@@ -201,6 +252,7 @@ def as_unit(ustr):
             out = _ureg_pint(ustr)
         except pint.errors.UndefinedUnitError as e:
             raise ValueError(str(e))
+    _cache_set(_unit_cache, ustr, out)
     return out
 
 
@@ -242,10 +294,101 @@ def convert_to(arr, new_units):
     if not has_units(arr):
         return add_units(arr, new_units)
     if _use_unyt:
-        try:
-            out = arr.to(new_units)
-        except unyt.exceptions.UnitConversionError as e:
-            raise ValueError(str(e))
+        unit = as_unit(new_units)
+        data = convert_data(arr.ndview, arr.units, unit)
+        out = type(arr)(data, unit, bypass_validation=True)
     else:
         out = arr.to(new_units)
     return out
+
+
+def get_conversion_factor(from_units, to_units):
+    r"""Get the scale factor and offset for converting values from one set
+    of units to another such that new = factor * old + offset. Factors are
+    cached so that units are only compared once.
+
+    Args:
+        from_units (str, unyt.Unit): Units that values are in.
+        to_units (str, unyt.Unit): Units that values should be converted to.
+
+    Returns:
+        tuple(float, float): Scale factor and offset.
+
+    Raises:
+        ValueError: If either of the units are not recognized or the units
+            are not compatible.
+
+    """
+    key = (_unit_key(from_units), _unit_key(to_units))
+    out = _cache_get(_factor_cache, key)
+    if out is not None:
+        return out
+    unit1 = as_unit(from_units)
+    unit2 = as_unit(to_units)
+    if _use_unyt:
+        try:
+            factor, offset = unit1.get_conversion_factor(unit2)
+            offset = -offset if offset else 0.0
+        except unyt.exceptions.UnitConversionError:
+            # Conversions between electromagnetic unit systems are only
+            # handled by arrays, but are never offset
+            try:
+                factor = float(unyt.unyt_quantity(1.0, unit1).to(unit2).v)
+            except unyt.exceptions.UnitConversionError as e:
+                raise ValueError(str(e))
+            offset = 0.0
+    else:
+        try:
+            offset = _ureg_pint.Quantity(0.0, unit1.units).to(
+                unit2.units).magnitude
+            factor = _ureg_pint.Quantity(1.0, unit1.units).to(
+                unit2.units).magnitude - offset
+        except pint.errors.DimensionalityError as e:
+            raise ValueError(str(e))
+    out = (factor, offset)
+    _cache_set(_factor_cache, key, out)
+    return out
+
+
+def convert_data(arr, from_units, to_units):
+    r"""Convert values without units from one set of units to another.
+    Integer values are converted to floats.
+
+    Args:
+        arr (np.ndarray, float, int): Values in from_units.
+        from_units (str, unyt.Unit): Units that values are in.
+        to_units (str, unyt.Unit): Units that values should be converted to.
+
+    Returns:
+        np.ndarray: Values in to_units.
+
+    Raises:
+        ValueError: If either of the units are not recognized or the units
+            are not compatible.
+
+    """
+    factor, offset = get_conversion_factor(from_units, to_units)
+    arr = np.asarray(arr)
+    dtype = arr.dtype
+    if dtype.kind not in 'fc':
+        dtype = np.dtype('f%d' % max(dtype.itemsize, 4))
+    out = np.multiply(arr, dtype.type(factor), dtype=dtype)
+    if offset:
+        out += dtype.type(offset)
+    return out
+
+
+def _unit_key(units):
+    r"""Get a hashable key for a set of units for use in the caches.
+
+    Args:
+        units (str, unyt.Unit): Units.
+
+    Returns:
+        object: Key for the units.
+
+    """
+    if _use_unyt and isinstance(units, unyt.Unit):
+        # Unit equality is based on dimensions and scale so degC == K
+        return (type(units), units.expr)
+    return backwards.as_str(units)
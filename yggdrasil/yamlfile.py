@@ -1,12 +1,17 @@
 import os
 import copy
+import json
 import pprint
+import hashlib
+import tempfile
 import pystache
 import yaml
 import git
 import sys
 
-from yggdrasil import backwards
+import yggdrasil
+from yggdrasil import backwards, schema, tools
+from yggdrasil.config import ygg_cfg
 from yggdrasil.schema import standardize, get_schema
 
 if sys.version_info > (3, 0):
@@ -125,6 +130,130 @@ def prep_yaml(files):
     return yml_all
 
 
+def get_yaml_cache_dir():
+    r"""Determine the directory where normalized YAML documents are cached.
+
+    Returns:
+        str: Full path to the YAML cache directory. None is returned if
+            caching of normalized YAMLs is disabled via the 'cache' option in
+            the 'yaml' section of the config file.
+
+    """
+    if ygg_cfg.get('yaml', 'cache', 'True').lower() != 'true':
+        return None
+    out = ygg_cfg.get('yaml', 'cache_dir', None)
+    if not out:
+        out = os.path.join(os.path.expanduser('~'), '.yggdrasil_cache', 'yaml')
+    return out
+
+
+def get_yaml_cache_max_entries():
+    r"""Determine the maximum number of normalized YAML documents that
+    should be kept in the cache.
+
+    Returns:
+        int: Maximum number of cached documents from the 'cache_max_entries'
+            option in the 'yaml' section of the config file. Values less
+            than 1 indicate that the number is not limited.
+
+    """
+    return int(ygg_cfg.get('yaml', 'cache_max_entries', None) or 100)
+
+
+def get_yaml_cache_file(yml_prep):
+    r"""Determine the file where the normalized version of a prepared YAML
+    document is cached. The file name is a hash of the prepared document
+    (which includes the contents of the YAML files after environment
+    variable substitution and their locations), the schema, and the
+    yggdrasil version.
+
+    Args:
+        yml_prep (dict): YAML document returned by prep_yaml.
+
+    Returns:
+        str: Full path to the cache file. None is returned if caching is
+            disabled or the document cannot be encoded as JSON.
+
+    """
+    cache_dir = get_yaml_cache_dir()
+    if cache_dir is None:
+        return None
+    try:
+        contents = json.dumps(yml_prep, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    h = hashlib.sha256()
+    h.update(backwards.as_bytes(yggdrasil.__version__))
+    if os.path.isfile(schema._schema_fname):
+        with open(schema._schema_fname, 'rb') as fd:
+            h.update(fd.read())
+    h.update(backwards.as_bytes(contents))
+    return os.path.join(cache_dir, h.hexdigest() + '.json')
+
+
+def load_cached_yaml(cache_file):
+    r"""Load a normalized YAML document from the cache.
+
+    Args:
+        cache_file (str): Full path to the cache file returned by
+            get_yaml_cache_file.
+
+    Returns:
+        dict: Normalized YAML document. None is returned if the document is
+            not cached or the cache file cannot be read.
+
+    """
+    if (cache_file is None) or (not os.path.isfile(cache_file)):
+        return None
+    try:
+        with open(cache_file, 'r') as fd:
+            out = json.load(fd)
+    except (IOError, OSError, ValueError):  # pragma: debug
+        return None
+    tools.touch_cache_entry(cache_file)
+    return out
+
+
+def save_cached_yaml(cache_file, yml_norm):
+    r"""Save a normalized YAML document to the cache. Documents that cannot
+    be represented exactly in JSON are not cached. If there are more than
+    the maximum number of documents in the cache afterwards, the least
+    recently used documents are removed.
+
+    Args:
+        cache_file (str): Full path to the cache file returned by
+            get_yaml_cache_file.
+        yml_norm (dict): Normalized YAML document.
+
+    """
+    if cache_file is None:
+        return
+    try:
+        contents = json.dumps(yml_norm)
+        if json.loads(contents) != yml_norm:
+            return
+    except (TypeError, ValueError):
+        return
+    cache_dir = os.path.dirname(cache_file)
+    tmp = None
+    try:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        # Write to a temporary file first so that partial documents are
+        # never read by another process
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            f.write(contents)
+        os.rename(tmp, cache_file)
+    except (IOError, OSError):  # pragma: debug
+        if (tmp is not None) and os.path.isfile(tmp):
+            os.remove(tmp)
+        return
+    tools.prune_cache([os.path.join(cache_dir, x) for x in os.listdir(cache_dir)
+                       if x.endswith('.json')],
+                      get_yaml_cache_max_entries())
+
+
 def parse_yaml(files):
     r"""Parse list of yaml files.
 
@@ -147,7 +276,11 @@ def parse_yaml(files):
     yml_prep = prep_yaml(files)
     # print('prepped')
     # pprint.pprint(yml_prep)
-    yml_norm = s.validate(yml_prep, normalize=True)
+    cache_file = get_yaml_cache_file(yml_prep)
+    yml_norm = load_cached_yaml(cache_file)
+    if yml_norm is None:
+        yml_norm = s.validate(yml_prep, normalize=True)
+        save_cached_yaml(cache_file, yml_norm)
     # print('normalized')
     # pprint.pprint(yml_norm)
     # Parse models, then connections to ensure connections can be processed
@@ -173,6 +306,8 @@ def parse_yaml(files):
                         existing['model'][m][io + 's'].pop(i)
                         break
             existing[io].pop(k)
+    # Add copies of server models
+    existing = parse_model_copies(existing)
     # Link io drivers back to models
     existing = link_model_io(existing)
     # print('drivers')
@@ -388,7 +523,8 @@ def parse_connection(yml, existing):
 
     # Transfer connection keywords to one connection driver
     conn_keys_gen = ['inputs', 'outputs']
-    conn_keys = list(set(schema['connection'].properties) - set(conn_keys_gen))
+    conn_keys = list(set(schema.get_component_keys('connection'))
+                     - set(conn_keys_gen))
     yml_conn = {}
     yml_conn.pop('name', None)
     for k in conn_keys:
@@ -402,6 +538,56 @@ def parse_connection(yml, existing):
     return existing
 
 
+def parse_model_copies(existing):
+    r"""Add entries for additional copies of models that will share the
+    requests sent to a server.
+
+    Args:
+        existing (dict): Dictionary of existing components.
+
+    Raises:
+        ValueError: If copies is greater than 1 for a model that is not a
+            server.
+        ValueError: If copies is greater than 1 for a model that has inputs
+            or outputs other than the server channel or that is a client of
+            another model.
+
+    Returns:
+        dict: Dictionary with model copies added.
+
+    """
+    for name in list(existing['model'].keys()):
+        yml = existing['model'][name]
+        ncopies = yml.get('copies', 1)
+        if ncopies <= 1:
+            continue
+        if not yml.get('is_server', False):
+            raise ValueError(("Model '%s' has copies = %d, but copies are "
+                              + "only supported for server models.")
+                             % (name, ncopies))
+        srv_name = '%s:%s' % (name, name)
+        io_names = ([x['name'] for x in yml['inputs']]
+                    + [x['name'] for x in yml['outputs']])
+        if (io_names != [srv_name]) or yml.get('client_of', []):
+            raise ValueError(("Model '%s' has copies = %d, but copies are "
+                              + "only supported for server models without "
+                              + "any other inputs or outputs.")
+                             % (name, ncopies))
+        srv = existing['input'][srv_name]
+        srv['copies'] = ncopies
+        for i in range(1, ncopies):
+            icopy = copy.deepcopy(yml)
+            icopy['name'] = '%s_copy%d' % (name, i)
+            icopy['copy_of'] = name
+            icopy['copy_index'] = i
+            icopy['model_index'] = len(existing['model'])
+            # Products are built/removed by the original model
+            icopy['overwrite'] = False
+            existing['model'][icopy['name']] = icopy
+            srv['model_driver'].append(icopy['name'])
+    return existing
+
+
 def link_model_io(existing):
     r"""Link I/O drivers back to the models they communicate with.
 